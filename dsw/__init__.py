@@ -1,14 +1,19 @@
-from dsw.biofilter import DefaultBioFilter, LocalBioFilter
+from dsw.biofilter import DefaultBioFilter, LocalBioFilter, build_automaton
 
-from dsw.spiderweb import encode, decode
+from dsw.spiderweb import encode, decode, encode_batch, decode_batch, encode_parallel, encode_file
 from dsw.spiderweb import find_vertices, connect_valid_graph, connect_coding_graph
 from dsw.spiderweb import set_vt, repair_dna, remove_nasty_arc
 from dsw.spiderweb import create_random_shuffles
 
+from dsw.graphized import CompiledAccessor, CompactAccessor, MaskAccessor
 from dsw.graphized import accessor_to_adjacency_matrix, adjacency_matrix_to_accessor
-from dsw.graphized import accessor_to_latter_map, latter_map_to_accessor
-from dsw.graphized import obtain_vertices, obtain_leaf_vertices, obtain_formers, obtain_latters, get_complete_accessor
+from dsw.graphized import accessor_to_latter_map, latter_map_to_accessor, get_complete_accessor
+from dsw.graphized import obtain_vertices, obtain_components, obtain_leaf_vertices, obtain_formers, obtain_latters
 from dsw.graphized import approximate_capacity, path_matching, remove_useless, calculate_intersection_score
 
-from dsw.operation import calculus_addition, calculus_subtraction, calculus_multiplication, calculus_division
+from dsw.operation import BigNumber, calculus_addition, calculus_subtraction, calculus_multiplication, calculus_division
+from dsw.operation import DefaultSink, NullSink, LoggingSink, CallbackSink, JSONLinesSink
+from dsw.operation import Telemetry, telemetry, Profiler
 from dsw.operation import Monitor, dna_to_number, number_to_dna, bit_to_number, number_to_bit
+from dsw.operation import huge_divmod, digit_to_number, PackedDNA
+from dsw.operation import vertices_to_digits, digits_to_vertices, vertices_to_dna, dna_to_vertices
@@ -1,3 +1,8 @@
+from collections import deque
+from inspect import signature
+from numpy import array, ones, zeros, any, sum, int64
+
+
 class DefaultBioFilter(object):
 
     def __init__(self, screen_name):
@@ -23,6 +28,34 @@ class DefaultBioFilter(object):
         """
         raise NotImplementedError("This interface \"def valid(dna_string)\" needs to be implemented.")
 
+    def valid_batch(self, digit_matrix, only_last=True):
+        """
+        Judge whether the DNA sequences (in the digit form) meet the requirements.
+
+        :param digit_matrix: digit matrix (one DNA sequence per row, 0, 1, 2, and 3 refer to "A", "C", "G", and "T").
+        :type digit_matrix: numpy.ndarray
+
+        :param only_last: only check the DNA sequence of the last observed window.
+        :type only_last: bool
+
+        :return: judgements.
+        :rtype: numpy.ndarray
+
+        .. note::
+            This default interface judges the DNA sequences one by one through "valid",
+            the inherited screen can override it with a vectorized version.
+        """
+        digit_matrix, judgements = array(digit_matrix), []
+        has_only_last = "only_last" in signature(self.valid).parameters  # the screen may not support it.
+        for digits in digit_matrix.tolist():
+            dna_sequence = "".join(["ACGT"[digit] for digit in digits])
+            if has_only_last:
+                judgements.append(self.valid(dna_sequence, only_last=only_last))
+            else:
+                judgements.append(self.valid(dna_sequence))
+
+        return array(judgements, dtype=bool)
+
 
 class LocalBioFilter(DefaultBioFilter):
 
@@ -70,6 +103,10 @@ class LocalBioFilter(DefaultBioFilter):
 
             If "GC" in the undesired DNA motifs (undesired_motifs), "GC" cannot be included in tue valid DNA sequences.
             This parameter could contain the restriction enzyme sites or some low compatibility DNA patterns.
+
+            The homopolymer runs and the undesired DNA motifs (with their reverse complements) are compiled
+            into one automaton ("transitions" and "terminals") here,
+            so the constraints should not be changed after initialization.
         """
         super().__init__(screen_name="Local")
         if max_homopolymer_runs is not None:
@@ -87,6 +124,15 @@ class LocalBioFilter(DefaultBioFilter):
         self.gc_range = gc_range
         self.undesired_motifs = undesired_motifs
 
+        patterns = []
+        if max_homopolymer_runs is not None:
+            patterns += [nucleotide * (1 + max_homopolymer_runs) for nucleotide in "ACGT"]
+        if undesired_motifs is not None:
+            for special in undesired_motifs:
+                reverse_complement = special.replace("A", "t").replace("C", "g").replace("G", "c").replace("T", "a")
+                patterns += [special, reverse_complement[::-1].upper()]
+        self.transitions, self.terminals = build_automaton(patterns=patterns)
+
     def valid(self, dna_sequence, only_last=True):
         """
         Judge whether the DNA sequence meets the local biochemical constraints.
@@ -104,52 +150,173 @@ class LocalBioFilter(DefaultBioFilter):
             "only_last" parameter is used to save time.
             For most tree-based coding algorithms,
             it is not necessary to detect the sub DNA sequences observed in each window from scratch every time.
+
+            The DNA sequence is judged in a single pass through the compiled automaton,
+            along with the GC content of each observed window.
         """
         if only_last:
             observed_dna_sequence = dna_sequence[-self.observed_length:]
         else:
             observed_dna_sequence = dna_sequence
 
-        for nucleotide in observed_dna_sequence:
-            if nucleotide not in "ACGT":
-                return False
+        if self.terminals[0]:
+            return False
 
-        if self.max_homopolymer_runs is not None:
-            for nucleotide in "ACGT":
-                if nucleotide * (1 + self.max_homopolymer_runs) in observed_dna_sequence:
-                    return False
+        state, gc_flags, gc_count = 0, [], 0
+        for location, nucleotide in enumerate(observed_dna_sequence):
+            nucleotide_index = "ACGT".find(nucleotide)
+            if nucleotide_index < 0:
+                return False
 
-        if self.undesired_motifs is not None:
-            for special in self.undesired_motifs:
-                if special in observed_dna_sequence:
-                    return False
-                reverse_complement = special.replace("A", "t").replace("C", "g").replace("G", "c").replace("T", "a")
-                reverse_complement = reverse_complement[::-1].upper()
-                if reverse_complement in observed_dna_sequence:
-                    return False
+            state = self.transitions[state][nucleotide_index]
+            if self.terminals[state]:
+                return False
 
-        if self.gc_range is not None:
-            if len(observed_dna_sequence) >= self.observed_length:
-                for index in range(len(observed_dna_sequence) - self.observed_length + 1):
-                    sub_dna_sequence = observed_dna_sequence[index: index + self.observed_length]
-                    gc_count = sub_dna_sequence.count("C") + sub_dna_sequence.count("G")
+            if self.gc_range is not None:
+                gc_flags.append(nucleotide_index in [1, 2])
+                gc_count += gc_flags[-1]
+                if location >= self.observed_length:
+                    gc_count -= gc_flags[location - self.observed_length]
+                if location >= self.observed_length - 1:
                     if gc_count > self.gc_range[1] * self.observed_length:
                         return False
                     if gc_count < self.gc_range[0] * self.observed_length:
                         return False
-            else:
-                gc_count = observed_dna_sequence.count("C") + observed_dna_sequence.count("G")
-                if gc_count > self.gc_range[1] * self.observed_length:
-                    return False
-                at_count = observed_dna_sequence.count("A") + observed_dna_sequence.count("T")
-                if at_count > (1 - self.gc_range[0]) * self.observed_length:
-                    return False
+
+        if self.gc_range is not None and len(observed_dna_sequence) < self.observed_length:
+            if gc_count > self.gc_range[1] * self.observed_length:
+                return False
+            at_count = len(observed_dna_sequence) - gc_count
+            if at_count > (1 - self.gc_range[0]) * self.observed_length:
+                return False
 
         return True
 
+    def valid_batch(self, digit_matrix, only_last=True):
+        """
+        Judge whether the DNA sequences (in the digit form) meet the local biochemical constraints at once.
+
+        :param digit_matrix: digit matrix (one DNA sequence per row, 0, 1, 2, and 3 refer to "A", "C", "G", and "T").
+        :type digit_matrix: numpy.ndarray
+
+        :param only_last: only check the DNA sequence of the last observed window.
+        :type only_last: bool
+
+        :return: judgements.
+        :rtype: numpy.ndarray
+
+        Example
+            >>> from dsw import LocalBioFilter
+            >>> bio_filter = LocalBioFilter(observed_length=8, \
+                                            max_homopolymer_runs=2, gc_range=[0.4, 0.6], undesired_motifs=["GC"])
+            >>> digit_matrix = [[0, 1, 2, 3, 0, 1, 2, 3], [2, 1, 0, 3, 2, 1, 0, 3], [0, 0, 0, 1, 1, 2, 2, 0]]
+            >>> bio_filter.valid_batch(digit_matrix=digit_matrix)
+            array([ True, False, False])
+
+        .. note::
+            The judgement of each row equals to "valid" of the corresponding DNA sequence.
+            All rows walk through the compiled automaton column by column,
+            and the GC contents of the observed windows are evaluated for all rows at once.
+        """
+        digit_matrix = array(digit_matrix, dtype=int64)
+        if digit_matrix.ndim != 2:
+            digit_matrix = digit_matrix.reshape(len(digit_matrix), -1)
+
+        if only_last:
+            digit_matrix = digit_matrix[:, -self.observed_length:] if self.observed_length > 0 else digit_matrix[:, :0]
+
+        sample_number, sequence_length = digit_matrix.shape
+        judgements = ones(shape=(sample_number,), dtype=bool)
+
+        if self.terminals[0]:
+            judgements[:] = False
+
+        transitions, terminals = array(self.transitions, dtype=int64), array(self.terminals, dtype=bool)
+        states = zeros(shape=(sample_number,), dtype=int64)
+        for location in range(sequence_length):
+            states = transitions[states, digit_matrix[:, location]]
+            judgements &= ~terminals[states]
+
+        if self.gc_range is not None:
+            gc_flags = ((digit_matrix == 1) | (digit_matrix == 2)).astype(int64)
+            if sequence_length >= self.observed_length:
+                window_number = sequence_length - self.observed_length + 1
+                gc_counts = zeros(shape=(sample_number, window_number), dtype=int64)
+                for index in range(self.observed_length):
+                    gc_counts += gc_flags[:, index: index + window_number]
+                judgements &= ~any(gc_counts > self.gc_range[1] * self.observed_length, axis=1)
+                judgements &= ~any(gc_counts < self.gc_range[0] * self.observed_length, axis=1)
+            else:
+                gc_counts = sum(gc_flags, axis=1)
+                judgements &= ~(gc_counts > self.gc_range[1] * self.observed_length)
+                judgements &= ~(sequence_length - gc_counts > (1 - self.gc_range[0]) * self.observed_length)
+
+        return judgements
+
     def __str__(self):
         info = self.screen_name + "\n"
         info += "maximum homopolymer runs : " + str(self.max_homopolymer_runs) + "\n"
         info += "local GC content range   : " + str(self.gc_range[0]) + " <= GC <= " + str(self.gc_range[1]) + "\n"
         info += "undesired DNA motifs     : " + str(self.undesired_motifs).replace("\"", "") + "\n"
         return info
+
+
+def build_automaton(patterns):
+    """
+    Build the deterministic automaton (Aho-Corasick) which finds any of the patterns in the DNA sequence.
+
+    :param patterns: DNA patterns to be found.
+    :type patterns: list
+
+    :return: transitions (the next state of each state and nucleotide index) and terminals (pattern found).
+    :rtype: list, list
+
+    Example
+        >>> from dsw import build_automaton
+        >>> transitions, terminals = build_automaton(patterns=["GC", "AA"])
+        >>> transitions
+        [[3, 0, 1, 0], [3, 2, 1, 0], [3, 0, 1, 0], [4, 0, 1, 0], [4, 0, 1, 0]]
+        >>> terminals
+        [False, False, True, False, True]
+
+    .. note::
+        Reference [1] Alfred V. Aho and Margaret J. Corasick (1975) Communications of the ACM
+
+        The state 0 is the initial state and the nucleotide indices of "A", "C", "G", and "T" are 0, 1, 2, and 3.
+        A state is terminal if its prefix ends with any pattern.
+        The patterns containing other characters are ignored because they never appear in the valid DNA sequence.
+    """
+    transitions, terminals = [[-1, -1, -1, -1]], [False]
+    for pattern in patterns:
+        if any([nucleotide not in "ACGT" for nucleotide in pattern]):
+            continue
+        state = 0
+        for nucleotide in pattern:
+            nucleotide_index = "ACGT".index(nucleotide)
+            if transitions[state][nucleotide_index] == -1:
+                transitions[state][nucleotide_index] = len(transitions)
+                transitions.append([-1, -1, -1, -1])
+                terminals.append(False)
+            state = transitions[state][nucleotide_index]
+        terminals[state] = True
+
+    # fill the failure transitions in the breadth-first order.
+    failures, queue = [0] * len(transitions), deque()
+    for nucleotide_index in range(4):
+        if transitions[0][nucleotide_index] == -1:
+            transitions[0][nucleotide_index] = 0
+        else:
+            queue.append(transitions[0][nucleotide_index])
+
+    while queue:
+        state = queue.popleft()
+        terminals[state] |= terminals[failures[state]]
+        for nucleotide_index in range(4):
+            next_state = transitions[state][nucleotide_index]
+            if next_state == -1:
+                transitions[state][nucleotide_index] = transitions[failures[state]][nucleotide_index]
+            else:
+                failures[next_state] = transitions[failures[state]][nucleotide_index]
+                queue.append(next_state)
+
+    return transitions, terminals
@@ -1,7 +1,473 @@
 from itertools import combinations
-from numpy import zeros, ones, zeros_like, array, union1d, min, median, max, random, log, log2, sum, abs, all, where
+from numpy import zeros, ones, zeros_like, ones_like, array, union1d, min, median, max, random, log, log2, sum, abs
+from numpy import all, any, arange, tile, argsort, array_equal, cumsum, take_along_axis, where, nonzero
+from numpy import concatenate, searchsorted, minimum, maximum, int32, int64
+from numpy import broadcast_arrays, bitwise_and, bitwise_or, integer, uint8
+
+from dsw.operation import Monitor, PackedDNA, telemetry, profiled
+
+
+class CompiledAccessor(object):
+
+    def __init__(self, accessor, shuffles=None):
+        """
+        Initialize the compiled accessor, which precomputes the vertex information used in the transcoding.
+
+        :param accessor: accessor of the coding algorithm.
+        :type accessor: numpy.ndarray or dsw.graphized.CompactAccessor
+
+        :param shuffles: shuffle relationships for bit-nucleotide mapping.
+        :type shuffles: numpy.ndarray or None
+
+        Example
+            >>> from numpy import array
+            >>> from dsw import CompiledAccessor
+            >>> # accessor with GC-balanced
+            >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+            >>> compiled_accessor = CompiledAccessor(accessor=accessor)
+            >>> compiled_accessor.out_degrees
+            array([0, 2, 2, 0, 2, 0, 0, 2, 2, 0, 0, 2, 0, 2, 2, 0])
+            >>> compiled_accessor.used_indices[1], compiled_accessor.used_indices[4]
+            (array([ 0,  3, -1, -1]), array([ 1,  2, -1, -1]))
+            >>> compiled_accessor.ranks[1], compiled_accessor.ranks[4]
+            (array([ 0, -1, -1,  1]), array([-1,  0,  1, -1]))
+            >>> shuffles = array([[3, 2, 1, 0], [2, 3, 1, 0], [3, 1, 0, 2], [0, 3, 1, 2], \
+                                  [3, 2, 0, 1], [1, 0, 3, 2], [0, 3, 1, 2], [2, 0, 1, 3], \
+                                  [2, 3, 0, 1], [1, 0, 3, 2], [2, 0, 1, 3], [0, 1, 3, 2], \
+                                  [2, 3, 1, 0], [2, 0, 3, 1], [0, 1, 3, 2], [0, 3, 2, 1]])
+            >>> compiled_accessor = CompiledAccessor(accessor=accessor, shuffles=shuffles)
+            >>> compiled_accessor.shuffled_indices[1], compiled_accessor.shuffled_indices[4]
+            (array([ 3,  0, -1, -1]), array([ 2,  1, -1, -1]))
+            >>> compiled_accessor.shuffled_ranks[1], compiled_accessor.shuffled_ranks[4]
+            (array([ 1, -1, -1,  0]), array([-1,  1,  0, -1]))
+
+        .. note::
+            For each vertex, "out_degrees" records the number of follow-up vertices,
+            "used_indices" packs the available nucleotide indices at the front (the remaining cells are -1),
+            and "ranks" records the rank of each nucleotide index in the available nucleotide indices
+            (-1 if the nucleotide is unavailable).
+
+            "shuffled_indices" records the nucleotide index of each digit after the shuffle,
+            and "shuffled_ranks" records the digit of each nucleotide index after the shuffle.
+            Without the shuffles, they are the same as "used_indices" and "ranks" respectively.
+
+            The compilation is done once for the whole accessor (and shuffles),
+            which is suitable for transcoding a large number of DNA sequences through the same coding algorithm.
+            The accessor and shuffles should not be changed after compilation.
+            The compact accessor is compiled through its equivalent accessor,
+            so the compiled tables are indexed by the vertex indices.
+        """
+        if isinstance(accessor, CompactAccessor):
+            accessor = accessor.to_accessor()
+
+        self.accessor, self.shuffles = accessor, shuffles
+        if isinstance(accessor, MaskAccessor):  # look the vertex information up by the masks.
+            masks = accessor.obtain_masks()
+            self.out_degrees, self.ranks = accessor.degree_table[masks], accessor.rank_table[masks]
+            self.used_indices = accessor.index_table[masks]
+        else:
+            available = accessor >= 0
+            self.out_degrees = sum(available, axis=1)
+            self.ranks = where(available, cumsum(available, axis=1) - 1, -1)
+            self.used_indices = -ones_like(accessor)
+            vertex_indices, nucleotide_indices = nonzero(available)
+            self.used_indices[vertex_indices, self.ranks[vertex_indices, nucleotide_indices]] = nucleotide_indices
+
+        if shuffles is not None:
+            # the digit is mapped to the rank through the argsort of shuffles in the available nucleotide indices.
+            orders = shuffles[arange(len(accessor))[:, None], self.used_indices]
+            orders = argsort(where(self.used_indices >= 0, orders, accessor.shape[1]), axis=1, kind="stable")
+            self.shuffled_indices = take_along_axis(self.used_indices, orders, axis=1)
+            self.shuffled_ranks = -ones_like(self.used_indices)
+            vertex_indices, digits = nonzero(self.shuffled_indices >= 0)
+            self.shuffled_ranks[vertex_indices, self.shuffled_indices[vertex_indices, digits]] = digits
+        else:
+            self.shuffled_indices, self.shuffled_ranks = self.used_indices, self.ranks
+
+    def compatible(self, shuffles):
+        """
+        Judge whether the shuffles can be used with this compiled accessor.
+
+        :param shuffles: shuffle relationships for bit-nucleotide mapping.
+        :type shuffles: numpy.ndarray or None
+
+        :return: judgement.
+        :rtype: bool
+
+        .. note::
+            None is always compatible, which means that the compiled shuffles (if any) are used.
+        """
+        if shuffles is None or shuffles is self.shuffles:
+            return True
+
+        return self.shuffles is not None and array_equal(shuffles, self.shuffles)
+
+    def __len__(self):
+        return len(self.accessor)
+
+
+class CompactAccessor(object):
+
+    def __init__(self, accessor):
+        """
+        Initialize the compact accessor, which renumbers the vertices used in the accessor as 0, 1, ..., n - 1.
+
+        :param accessor: accessor of the coding algorithm.
+        :type accessor: numpy.ndarray
+
+        Example
+            >>> from numpy import array, array_equal
+            >>> from dsw import CompactAccessor
+            >>> # accessor with GC-balanced
+            >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+            >>> compact_accessor = CompactAccessor(accessor=accessor)
+            >>> compact_accessor.vertex_indices
+            array([ 1,  2,  4,  7,  8, 11, 13, 14])
+            >>> compact_accessor.latters[:3]
+            array([[ 2, -1, -1,  3],
+                   [ 4, -1, -1,  5],
+                   [-1,  0,  1, -1]], dtype=int32)
+            >>> compact_accessor.to_compact([7, 3]), compact_accessor.to_original([3, -1])
+            (array([ 3, -1]), array([ 7, -1]))
+            >>> array_equal(compact_accessor.to_accessor(), accessor)
+            True
+
+        .. note::
+            "vertex_indices" is the backward map (from the compact index to the vertex index),
+            and the forward map is the binary search in it, so the memory scales with the number of used vertices.
+
+            "latters" records the compact index of the latter vertex through each nucleotide index.
+            Its last row is an extra row without latter vertex, which is reached by the compact index -1
+            (the vertices out of this accessor), so that the walk through the table stops there.
+
+            The functions "encode", "decode", "repair_dna", "path_matching" and "approximate_capacity" work on it
+            directly, where the start vertex (previous vertex) and the recorded path still use the vertex indices.
+        """
+        if isinstance(accessor, MaskAccessor):
+            accessor = accessor.to_accessor()
+
+        available = accessor >= 0
+        used_flags = any(available, axis=1)
+        used_flags[accessor[available]] = True
+
+        self.vertex_number = len(accessor)
+        self.vertex_indices = where(used_flags)[0]
+
+        dtype = int32 if len(self.vertex_indices) < 2 ** 31 - 1 else int64
+        self.latters = -ones(shape=(len(self.vertex_indices) + 1, accessor.shape[1]), dtype=dtype)
+        used_accessor = accessor[self.vertex_indices]
+        self.latters[:-1][used_accessor >= 0] = self.to_compact(used_accessor[used_accessor >= 0])
+
+    @staticmethod
+    def from_vertices(vertices, observed_length):
+        """
+        Create the compact accessor of the valid graph from the valid vertices without the complete accessor.
+
+        :param vertices: vertex accessor, in each cell, True is valid vertex and False is invalid vertex.
+        :type vertices: numpy.ndarray
+
+        :param observed_length: length of the DNA sequence in a vertex.
+        :type observed_length: int
+
+        :return: compact accessor.
+        :rtype: dsw.graphized.CompactAccessor
+
+        Example
+            >>> from numpy import array
+            >>> from dsw import CompactAccessor
+            >>> vertices = array([0, 1, 1, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0])
+            >>> compact_accessor = CompactAccessor.from_vertices(vertices=vertices, observed_length=2)
+            >>> compact_accessor.vertex_indices
+            array([ 1,  2,  4,  7,  8, 11, 13, 14])
+            >>> compact_accessor.latters[:3]
+            array([[ 2, -1, -1,  3],
+                   [ 4, -1, -1,  5],
+                   [-1,  0,  1, -1]], dtype=int32)
+
+        .. note::
+            The result is equivalent to "CompactAccessor(connect_valid_graph(observed_length, vertices))".
+            However, the vertices without any arc are kept here.
+        """
+        compact_accessor = CompactAccessor.__new__(CompactAccessor)
+        compact_accessor.vertex_number = int(4 ** observed_length)
+        compact_accessor.vertex_indices = where(array(vertices) != 0)[0]
+
+        vertex_indices = compact_accessor.vertex_indices
+        dtype = int32 if len(vertex_indices) < 2 ** 31 - 1 else int64
+        latter_indices = (vertex_indices[:, None] * 4 + arange(4)[None, :]) % compact_accessor.vertex_number
+        compact_accessor.latters = -ones(shape=(len(vertex_indices) + 1, 4), dtype=dtype)
+        compact_accessor.latters[:-1] = compact_accessor.to_compact(latter_indices)
+
+        return compact_accessor
+
+    def to_compact(self, vertex_indices):
+        """
+        Convert the vertex indices to the compact indices.
+
+        :param vertex_indices: vertex indices.
+        :type vertex_indices: numpy.ndarray or list or int
+
+        :return: compact indices (-1 if the vertex is out of this accessor).
+        :rtype: numpy.ndarray or int
+        """
+        vertex_indices = array(vertex_indices)
+        if len(self.vertex_indices) > 0:
+            locations = minimum(searchsorted(self.vertex_indices, vertex_indices), len(self.vertex_indices) - 1)
+            compact_indices = where(self.vertex_indices[locations] == vertex_indices, locations, -1)
+        else:
+            compact_indices = -ones_like(vertex_indices)
+
+        return int(compact_indices) if compact_indices.ndim == 0 else compact_indices
+
+    def to_original(self, compact_indices):
+        """
+        Convert the compact indices to the vertex indices.
+
+        :param compact_indices: compact indices.
+        :type compact_indices: numpy.ndarray or list or int
+
+        :return: vertex indices (-1 if the compact index is -1).
+        :rtype: numpy.ndarray or int
+        """
+        compact_indices = array(compact_indices)
+        if len(self.vertex_indices) > 0:
+            vertex_indices = where(compact_indices >= 0, self.vertex_indices[maximum(compact_indices, 0)], -1)
+        else:
+            vertex_indices = -ones_like(compact_indices)
+
+        return int(vertex_indices) if vertex_indices.ndim == 0 else vertex_indices
+
+    def select(self, table):
+        """
+        Select the rows of the table indexed by the vertex indices (such as the shuffles) for the compact indices.
+
+        :param table: table with one row per vertex index.
+        :type table: numpy.ndarray
+
+        :return: table with one row per compact index (and the extra row).
+        :rtype: numpy.ndarray
+        """
+        return concatenate((table[self.vertex_indices], table[:1]))
+
+    def to_accessor(self):
+        """
+        Convert this compact accessor to its equivalent accessor.
+
+        :return: accessor.
+        :rtype: numpy.ndarray
+        """
+        accessor = -ones(shape=(self.vertex_number, self.latters.shape[1]), dtype=int)
+        accessor[self.vertex_indices] = self.to_original(self.latters[:-1])
+
+        return accessor
+
+    def __len__(self):
+        return len(self.vertex_indices)
+
+
+class MaskAccessor(object):
+
+    # lookup tables indexed by the 4-bit mask, where the bit k refers to the arc through the nucleotide index k.
+    bit_table = ((arange(16)[:, None] >> arange(4)[None, :]) & 1) == 1
+    degree_table = sum(bit_table, axis=1)
+    rank_table = where(bit_table, cumsum(bit_table, axis=1) - 1, -1)
+    index_table = where(arange(4)[None, :] < degree_table[:, None], argsort(~bit_table, axis=1, kind="stable"), -1)
+
+    def __init__(self, accessor):
+        """
+        Initialize the mask accessor, which stores the out-arcs of each vertex as a 4-bit mask.
+
+        :param accessor: accessor of the coding algorithm.
+        :type accessor: numpy.ndarray
+
+        :raise ValueError: the latter vertex of any arc is not the shifted former vertex.
+
+        Example
+            >>> from numpy import array, array_equal
+            >>> from dsw import MaskAccessor
+            >>> # accessor with GC-balanced
+            >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+            >>> mask_accessor = MaskAccessor(accessor=accessor)
+            >>> mask_accessor.masks
+            array([  9, 144,  96,   6,  96,   6,   9, 144], dtype=uint8)
+            >>> mask_accessor.obtain_masks([1, 4, 5])
+            array([9, 6, 0])
+            >>> mask_accessor[1], mask_accessor[13, 3]
+            (array([ 4, -1, -1,  7]), 7)
+            >>> array_equal(mask_accessor.to_accessor(), accessor)
+            True
+
+        .. note::
+            In the accessor, the latter vertex of the vertex v through the nucleotide index k is always (4v + k) % 4^l,
+            so only whether the arc exists is recorded ("masks") and the latter vertex is calculated when required.
+            Two vertices are packed into one byte, where the vertex with the even index is in the high 4 bits,
+            so that the memory is 4^l / 2 bytes (512 KB for l = 10).
+
+            The mask accessor is indexed like the accessor ("mask_accessor[vertex_index]",
+            "mask_accessor[vertex_index, nucleotide_index]", or the same with arrays and slices),
+            and setting an arc to -1 removes it.
+            Therefore, all the functions receiving the accessor work on it,
+            where "encode", "decode", "repair_dna", "path_matching", "obtain_components" and "approximate_capacity"
+            calculate the latter vertices on the fly, and "CompiledAccessor" looks its tables up by the masks.
+            The functions requiring the whole table (such as "accessor_to_latter_map") convert it through "to_accessor".
+        """
+        accessor = array(accessor)
+        available = accessor >= 0
+        vertex_number = len(accessor)
+        latter_indices = (arange(vertex_number)[:, None] * 4 + arange(accessor.shape[1])[None, :]) % vertex_number
+
+        if accessor.shape[1] != 4 or any(available & (accessor != latter_indices)):
+            raise ValueError("The accessor cannot be stored as the mask accessor, "
+                             + "because the latter vertex of some arcs is not the shifted former vertex!")
+
+        self.vertex_number = vertex_number
+        self.masks = MaskAccessor._pack(sum(available * (1 << arange(4))[None, :], axis=1))
+
+    @staticmethod
+    def from_vertices(vertices, observed_length):
+        """
+        Create the mask accessor of the valid graph from the valid vertices without the complete accessor.
+
+        :param vertices: vertex accessor, in each cell, True is valid vertex and False is invalid vertex.
+        :type vertices: numpy.ndarray
+
+        :param observed_length: length of the DNA sequence in a vertex.
+        :type observed_length: int
+
+        :return: mask accessor.
+        :rtype: dsw.graphized.MaskAccessor
+
+        Example
+            >>> from numpy import array
+            >>> from dsw import MaskAccessor
+            >>> vertices = array([0, 1, 1, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0])
+            >>> mask_accessor = MaskAccessor.from_vertices(vertices=vertices, observed_length=2)
+            >>> mask_accessor.masks
+            array([  9, 144,  96,   6,  96,   6,   9, 144], dtype=uint8)
+
+        .. note::
+            The result is equivalent to "MaskAccessor(connect_valid_graph(observed_length, vertices))".
+        """
+        vertices = array(vertices) != 0
+        latter_flags = tile(vertices.reshape(-1, 4), (4, 1))  # the latter vertices of each vertex are valid or not.
+
+        mask_accessor = MaskAccessor.__new__(MaskAccessor)
+        mask_accessor.vertex_number = int(4 ** observed_length)
+        masks = sum(latter_flags * (1 << arange(4))[None, :], axis=1)
+        mask_accessor.masks = MaskAccessor._pack(where(vertices, masks, 0))
+
+        return mask_accessor
+
+    def obtain_masks(self, vertex_indices=None):
+        """
+        Obtain the 4-bit masks of the vertices.
+
+        :param vertex_indices: vertex indices (all the vertices if None).
+        :type vertex_indices: numpy.ndarray or list or int or None
+
+        :return: masks, where the bit k is 1 if the vertex has the arc through the nucleotide index k.
+        :rtype: numpy.ndarray or int
+        """
+        if vertex_indices is None:
+            vertex_indices = arange(self.vertex_number)
+
+        vertex_indices = array(vertex_indices)
+        masks = (self.masks[vertex_indices >> 1].astype(int64) >> (4 - 4 * (vertex_indices & 1))) & 15
+
+        return int(masks) if masks.ndim == 0 else masks
+
+    def obtain_out_degrees(self, vertex_indices=None):
+        """
+        Obtain the out-degrees of the vertices.
+
+        :param vertex_indices: vertex indices (all the vertices if None).
+        :type vertex_indices: numpy.ndarray or list or int or None
+
+        :return: out-degrees.
+        :rtype: numpy.ndarray or int
+        """
+        out_degrees = self.degree_table[self.obtain_masks(vertex_indices)]
+
+        return int(out_degrees) if out_degrees.ndim == 0 else out_degrees
+
+    def to_accessor(self):
+        """
+        Convert this mask accessor to its equivalent accessor.
+
+        :return: accessor.
+        :rtype: numpy.ndarray
+        """
+        return self[:]
+
+    @staticmethod
+    def _pack(masks):
+        # pack the 4-bit masks of two adjacent vertices into one byte.
+        packed_masks = zeros(shape=(len(masks) + 1) // 2 * 2, dtype=uint8)
+        packed_masks[:len(masks)] = masks
+
+        return ((packed_masks[0::2] << 4) | packed_masks[1::2]).astype(uint8)
+
+    def _split(self, key):
+        # split the key into the vertex indices and the nucleotide indices which can be broadcast together.
+        vertex_indices, nucleotide_indices = key if isinstance(key, tuple) else (key, None)
+        if isinstance(vertex_indices, slice):
+            vertex_indices = arange(self.vertex_number)[vertex_indices]
+        vertex_indices = array(vertex_indices)
+
+        if nucleotide_indices is None:
+            vertex_indices, nucleotide_indices = vertex_indices[..., None], arange(4)
+        elif isinstance(nucleotide_indices, slice):
+            vertex_indices, nucleotide_indices = vertex_indices[..., None], arange(4)[nucleotide_indices]
+
+        return vertex_indices, array(nucleotide_indices)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, integer)):  # the latter vertices of a single vertex.
+            vertex_index = int(key)
+            mask = (int(self.masks[vertex_index >> 1]) >> (4 - 4 * (vertex_index & 1))) & 15
+            return where(self.bit_table[mask], (vertex_index * 4 + arange(4)) % self.vertex_number, -1)
+
+        if isinstance(key, tuple) and isinstance(key[0], (int, integer)) and isinstance(key[1], (int, integer)):
+            vertex_index, nucleotide_index = int(key[0]), int(key[1])  # the latter vertex of a single arc.
+            mask = (int(self.masks[vertex_index >> 1]) >> (4 - 4 * (vertex_index & 1))) & 15
+            return (vertex_index * 4 + nucleotide_index) % self.vertex_number if (mask >> nucleotide_index) & 1 else -1
+
+        vertex_indices, nucleotide_indices = self._split(key)
+        masks = self.obtain_masks(vertex_indices)
+        latter_indices = (vertex_indices * 4 + nucleotide_indices) % self.vertex_number
+        latter_indices = where((array(masks) >> nucleotide_indices) & 1 == 1, latter_indices, -1)
+
+        return int(latter_indices) if latter_indices.ndim == 0 else latter_indices
+
+    def __setitem__(self, key, value):
+        vertex_indices, nucleotide_indices = self._split(key)
+        vertex_indices, nucleotide_indices, values = broadcast_arrays(vertex_indices, nucleotide_indices, array(value))
+        latter_indices = (vertex_indices * 4 + nucleotide_indices) % self.vertex_number
 
-from dsw.operation import Monitor
+        if any((values >= 0) & (values != latter_indices)):
+            raise ValueError("Only the arc from the former vertex to its shifted vertex can be set!")
+
+        byte_indices = (vertex_indices >> 1).reshape(-1)
+        bits = (1 << (nucleotide_indices + 4 - 4 * (vertex_indices & 1))).reshape(-1)
+        removed = (values < 0).reshape(-1)
+        bitwise_and.at(self.masks, byte_indices[removed], (~bits[removed] & 255).astype(uint8))
+        bitwise_or.at(self.masks, byte_indices[~removed], bits[~removed].astype(uint8))
+
+    @property
+    def shape(self):
+        return self.vertex_number, 4
+
+    def __len__(self):
+        return self.vertex_number
 
 
 def get_complete_accessor(observed_length, verbose=False):
@@ -39,18 +505,16 @@ def get_complete_accessor(observed_length, verbose=False):
 
     .. note::
         The size of accessor is 4 ^ l * 4 and that of corresponding adjacency matrix is 4 ^ l * 4 ^ l.
-    """
-    accessor, monitor = -ones(shape=(int(4 ** observed_length), 4), dtype=int), Monitor()
 
-    for vertex_index in range(int(4 ** observed_length)):
-        latters = obtain_latters(current=vertex_index, observed_length=observed_length)
-        for position, latter_vertex_index in enumerate(latters):
-            accessor[vertex_index][position] = latter_vertex_index
+        The latter vertex of vertex v through nucleotide index n is (4 * v + n) mod 4 ^ l,
+        so the rows of the accessor repeat every 4 ^ (l - 1) vertices and the whole accessor is created at once.
+    """
+    vertex_number = int(4 ** observed_length)
 
-        if verbose:
-            monitor(vertex_index + 1, int(4 ** observed_length))
+    if verbose:
+        telemetry.message("Create the complete accessor with " + str(vertex_number) + " vertices.")
 
-    return accessor
+    return tile(arange(vertex_number).reshape(-1, 4), (4, 1))
 
 
 def accessor_to_adjacency_matrix(accessor, maximum_length=8, verbose=False):
@@ -100,6 +564,9 @@ def accessor_to_adjacency_matrix(accessor, maximum_length=8, verbose=False):
     """
     nucleotides = "ACGT"
 
+    if isinstance(accessor, MaskAccessor):
+        accessor = accessor.to_accessor()
+
     if len(accessor) >= 4 ** maximum_length:
         raise MemoryError("Unable to allocate adjacency matrix when length of DNA sequence (vertex) is more than 7.")
     if accessor.shape[1] != len(nucleotides) or min(accessor) < -1 or max(accessor) > len(accessor) - 1:
@@ -220,6 +687,9 @@ def accessor_to_latter_map(accessor, verbose=False):
         which only retains available information of follow-up vertices.
         However, latter map is not suitable for matrix calculation.
     """
+    if isinstance(accessor, MaskAccessor):
+        accessor = accessor.to_accessor()
+
     latter_map, monitor, total = {}, Monitor(), len(accessor)
 
     locations = where(sum(((accessor + 1).astype(bool)), axis=1).astype(int) > 0)[0]
@@ -291,7 +761,7 @@ def latter_map_to_accessor(latter_map, observed_length, threshold=None, verbose=
     accessor = -ones(shape=(len(nucleotides) ** observed_length, len(nucleotides)), dtype=int)
     if len(latter_map) > 0:
         if verbose:
-            print("Convert the latter map to the accessor.")
+            telemetry.message("Convert the latter map to the accessor.")
 
         total = len(latter_map.items())
         for current, (former_vertex, latter_vertices) in enumerate(latter_map.items()):
@@ -333,12 +803,12 @@ def remove_useless(latter_map, threshold, verbose=False):
     monitor = Monitor()
 
     if verbose:
-        print("Remove useless vertex, the out-degree of witch less than " + str(threshold) + ".")
+        telemetry.message("Remove useless vertex, the out-degree of witch less than " + str(threshold) + ".")
 
     round_number = 1
     while True:
         if verbose:
-            print("Check available vertices.")
+            telemetry.message("Check available vertices.")
 
         remove_vertices, saved_vertices, total = [], [], len(latter_map)
         for current, (former_vertex, latter_vertices) in enumerate(latter_map.items()):
@@ -351,7 +821,7 @@ def remove_useless(latter_map, threshold, verbose=False):
                 monitor(current + 1, total, extra={"round": round_number})
 
         if verbose:
-            print("Remove vertices " + str(remove_vertices) + " and load a novel latter map.")
+            telemetry.message("Remove vertices " + str(remove_vertices) + " and load a novel latter map.")
 
         new_latter_map, remove_flag = {}, False
         for current, (former_vertex, latter_vertices) in enumerate(latter_map.items()):
@@ -484,9 +954,85 @@ def obtain_vertices(accessor):
         >>> obtain_vertices(accessor=accessor)
         array([ 1,  2,  4,  7,  8, 11, 13, 14])
     """
+    if isinstance(accessor, MaskAccessor):  # the vertex with any arc has a non-zero mask.
+        return where(accessor.obtain_masks() > 0)[0].astype(int)
+
     return where(sum(((accessor + 1).astype(bool)), axis=1).astype(bool) == 1)[0].astype(int)
 
 
+def obtain_components(accessor, vertex_indices=None):
+    """
+    Obtain the strongly connected components reachable from the given vertices in the established graph.
+
+    :param accessor: accessor of graph.
+    :type accessor: numpy.ndarray
+
+    :param vertex_indices: vertex indices to start the search (all the vertices if None).
+    :type vertex_indices: numpy.ndarray or list or None
+
+    :return: component label of each vertex (-1 if the vertex is not reached).
+    :rtype: numpy.ndarray
+
+    Example
+        >>> from numpy import array
+        >>> from dsw import obtain_components
+        >>> accessor = array([[ 1, -1, -1, -1], [ 4, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], \
+                              [ 0, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], \
+                              [ 1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], \
+                              [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, -1, -1, 15]])
+        >>> obtain_components(accessor=accessor, vertex_indices=[8, 15])
+        array([ 0,  0, -1, -1,  0, -1, -1, -1,  1, -1, -1, -1, -1, -1, -1,  2])
+
+    .. note::
+        Reference [1] Robert Tarjan (1972) SIAM Journal on Computing
+
+        The depth-first search is iterative (with an explicit stack), so it is not limited by the recursion depth.
+        The components are labeled in the reverse topological order, i.e. the sink components are labeled first.
+    """
+    vertex_number = len(accessor)
+    if vertex_indices is None:
+        vertex_indices = range(vertex_number)
+
+    orders, lowlinks, on_stack = [-1] * vertex_number, [0] * vertex_number, [False] * vertex_number
+    labels, stack, order, label = [-1] * vertex_number, [], 0, 0
+
+    for root_index in vertex_indices:
+        if orders[root_index] >= 0:
+            continue
+
+        orders[root_index], lowlinks[root_index], order = order, order, order + 1
+        stack.append(root_index)
+        on_stack[root_index] = True
+        tasks = [(root_index, iter(accessor[root_index].tolist()))]
+        while tasks:
+            vertex_index, latter_indices = tasks[-1]
+            for latter_index in latter_indices:
+                if latter_index < 0:
+                    continue
+                if orders[latter_index] < 0:  # go deeper.
+                    orders[latter_index], lowlinks[latter_index], order = order, order, order + 1
+                    stack.append(latter_index)
+                    on_stack[latter_index] = True
+                    tasks.append((latter_index, iter(accessor[latter_index].tolist())))
+                    break
+                if on_stack[latter_index] and orders[latter_index] < lowlinks[vertex_index]:
+                    lowlinks[vertex_index] = orders[latter_index]
+            else:  # all the latter vertices are visited.
+                tasks.pop()
+                if tasks and lowlinks[vertex_index] < lowlinks[tasks[-1][0]]:
+                    lowlinks[tasks[-1][0]] = lowlinks[vertex_index]
+
+                if lowlinks[vertex_index] == orders[vertex_index]:  # the root of a component.
+                    while True:
+                        member_index = stack.pop()
+                        on_stack[member_index], labels[member_index] = False, label
+                        if member_index == vertex_index:
+                            break
+                    label += 1
+
+    return array(labels)
+
+
 def obtain_leaf_vertices(vertex_index, depth, accessor=None, latter_map=None):
     """
     Obtain leaf vertices in required depth of the tree with the rooted vertex.
@@ -559,12 +1105,13 @@ def obtain_leaf_vertices(vertex_index, depth, accessor=None, latter_map=None):
 
 
 # noinspection PyUnresolvedReferences
+@profiled
 def approximate_capacity(accessor, tolerance_level=-10, repeats=1, maximum_iteration=500, process=False, verbose=False):
     """
     Approximate the capacity of the specific graph through Perron–Frobenius theorem.
 
-    :param accessor: accessor of graph.
-    :type accessor: numpy.ndarray
+    :param accessor: (compact) accessor of graph.
+    :type accessor: numpy.ndarray or dsw.graphized.CompactAccessor
 
     :param tolerance_level: error tolerance of power iteration.
     :type tolerance_level: int
@@ -614,18 +1161,26 @@ def approximate_capacity(accessor, tolerance_level=-10, repeats=1, maximum_itera
 
         Reference [5] William Ford (2014) Academic Press
     """
-    if all(accessor == -1):
+    if isinstance(accessor, CompactAccessor):  # the power iteration only needs the arcs.
+        accessor = accessor.latters
+
+    if isinstance(accessor, MaskAccessor):  # the arcs are calculated column by column.
+        out_degrees = accessor.obtain_out_degrees()
+    else:
+        out_degrees = sum(accessor >= 0, axis=1)
+
+    if all(out_degrees == 0):
         if process:
             return (0.0, [0.0]) if repeats == 1 else (0.0, [[0.0] for _ in range(repeats)])
         else:
             return 0.0
 
-    ignore_positions = where(sum(accessor, axis=1) == -len(accessor[0]))[0]
+    ignore_positions = where(out_degrees == 0)[0]
 
     results, record = [], []
     for repeat in range(repeats):
         if verbose and repeats > 1:
-            print("Approximate capacity in " + str(repeat + 1) + " (" + str(repeats) + ") times.")
+            telemetry.message("Approximate capacity in " + str(repeat + 1) + " (" + str(repeats) + ") times.")
 
         record.append([])
         if repeats > 1:
@@ -638,7 +1193,8 @@ def approximate_capacity(accessor, tolerance_level=-10, repeats=1, maximum_itera
         monitor, queue, last_eigenvalue, current = Monitor(), [], None, 0
         while True:
             eigenvector = zeros_like(last_eigenvector)
-            for positions in accessor.T:
+            for nucleotide_index in range(accessor.shape[1]):
+                positions = accessor[:, nucleotide_index]
                 available = where(positions >= 0)
                 eigenvector[available] += last_eigenvector[positions[available]]
             eigenvalue = max(eigenvector)
@@ -676,21 +1232,24 @@ def approximate_capacity(accessor, tolerance_level=-10, repeats=1, maximum_itera
 
             last_eigenvalue, last_eigenvector, current = eigenvalue, eigenvector, current + 1
 
+        telemetry.count(name="approximate_capacity.iterations", value=current + 1)
+
     if process:
         return (median(results), record[0]) if repeats == 1 else (median(results), record)
     else:
         return median(results)
 
 
+@profiled
 def path_matching(dna_sequence, accessor, previous_index, occur_location, has_indel=False, nucleotides=None):
     """
     Perform saturation repair at the selected position and obtain the DNA sequences matching the path of accessor.
 
     :param dna_sequence: DNA sequence waiting for saturation substitution in the specific location.
-    :type dna_sequence: str
+    :type dna_sequence: str or dsw.operation.PackedDNA
 
-    :param accessor: accessor.
-    :type accessor: numpy.ndarray
+    :param accessor: (compiled or compact) accessor.
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
 
     :param previous_index: previous vertex index before the occurred error location.
     :type previous_index: int
@@ -704,7 +1263,7 @@ def path_matching(dna_sequence, accessor, previous_index, occur_location, has_in
     :param nucleotides: usage of nucleotides.
     :type nucleotides: str or None
 
-    :return: repaired DNA sequences (may contain multiple repair show) and visited count.
+    :return: repaired DNA sequences (in the type of the inputted DNA sequence) and visited count.
     :rtype: list, int
 
     Example
@@ -723,56 +1282,71 @@ def path_matching(dna_sequence, accessor, previous_index, occur_location, has_in
     if nucleotides is None:
         nucleotides = "ACGT"
 
+    if isinstance(accessor, CompiledAccessor):
+        accessor = accessor.accessor
+
+    if isinstance(accessor, CompactAccessor):  # walk through the compact indices.
+        previous_index, accessor = accessor.to_compact(previous_index), accessor.latters
+
+    is_packed = isinstance(dna_sequence, PackedDNA)
+    if is_packed and nucleotides == "ACGT":
+        values = dna_sequence.indices().tolist()
+    else:
+        values = [nucleotides.index(nucleotide) for nucleotide in dna_sequence]
+
+    def assemble(obtained_values):
+        obtained_dna_sequence = "".join([nucleotides[value] for value in obtained_values])
+        return PackedDNA(obtained_dna_sequence) if is_packed else obtained_dna_sequence
+
     repair_info, visited_count = [], 0
-    original, used_indices = dna_sequence[occur_location], where(accessor[previous_index] >= 0)[0]
-
-    for r_nucleotide in list(filter(lambda n: n != original, [nucleotides[index] for index in used_indices])):
-        vertex_index, reliable = accessor[previous_index][nucleotides.index(r_nucleotide)], True
-        for index, nucleotide in enumerate(dna_sequence[occur_location + 1:]):
-            used_nucleotides = [nucleotides[used_index] for used_index in where(accessor[vertex_index] >= 0)[0]]
-            if nucleotide in used_nucleotides:
-                vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+    original, used_indices = values[occur_location], where(accessor[previous_index] >= 0)[0].tolist()
+
+    for r_value in list(filter(lambda value: value != original, used_indices)):
+        vertex_index, reliable = accessor[previous_index][r_value], True
+        for value in values[occur_location + 1:]:
+            vertex_index = accessor[vertex_index, value]
+            if vertex_index >= 0:
                 visited_count += 1
             else:
                 reliable = False
                 break
 
         if reliable:  # "S" refers to repair by substation.
-            obtained_dna_sequence = list(dna_sequence)
-            obtained_dna_sequence[occur_location] = r_nucleotide
-            repair_info.append((("S", occur_location, r_nucleotide), "".join(obtained_dna_sequence)))
+            obtained_values = list(values)
+            obtained_values[occur_location] = r_value
+            repair_info.append((("S", occur_location, nucleotides[r_value]), assemble(obtained_values)))
 
     if has_indel:
-        for a_nucleotide in [nucleotides[used_index] for used_index in used_indices]:
-            vertex_index, reliable = accessor[previous_index][nucleotides.index(a_nucleotide)], True
-            for nucleotide in dna_sequence[occur_location:]:
-                used_nucleotides = [nucleotides[used_index] for used_index in where(accessor[vertex_index] >= 0)[0]]
-                if nucleotide in used_nucleotides:
-                    vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+        for a_value in used_indices:
+            vertex_index, reliable = accessor[previous_index][a_value], True
+            for value in values[occur_location:]:
+                vertex_index = accessor[vertex_index, value]
+                if vertex_index >= 0:
                     visited_count += 1
                 else:
                     reliable = False
                     break
 
             if reliable:  # "I" refers to repair by insertion.
-                obtained_dna_sequence = list(dna_sequence)
-                obtained_dna_sequence.insert(occur_location, a_nucleotide)
-                repair_info.append((("I", occur_location, a_nucleotide), "".join(obtained_dna_sequence)))
-
-        d_nucleotide, vertex_index, reliable = original, previous_index, True
-        for index, nucleotide in enumerate(dna_sequence[occur_location + 1:]):
-            used_nucleotides = [nucleotides[used_index] for used_index in where(accessor[vertex_index] >= 0)[0]]
-            if nucleotide in used_nucleotides:
-                vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+                obtained_values = list(values)
+                obtained_values.insert(occur_location, a_value)
+                repair_info.append((("I", occur_location, nucleotides[a_value]), assemble(obtained_values)))
+
+        vertex_index, reliable = previous_index, True
+        for value in values[occur_location + 1:]:
+            vertex_index = accessor[vertex_index, value]
+            if vertex_index >= 0:
                 visited_count += 1
             else:
                 reliable = False
                 break
 
         if reliable:   # "D" refers to repair by deletion.
-            obtained_dna_sequence = list(dna_sequence)
-            del obtained_dna_sequence[occur_location]
-            repair_info.append((("D", occur_location, d_nucleotide), "".join(obtained_dna_sequence)))
+            obtained_values = list(values)
+            del obtained_values[occur_location]
+            repair_info.append((("D", occur_location, nucleotides[original]), assemble(obtained_values)))
+
+    telemetry.count(name="path_matching.visited_times", value=visited_count)
 
     return repair_info, visited_count
 
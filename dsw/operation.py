@@ -1,12 +1,347 @@
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from functools import wraps
+from json import dumps
+from logging import getLogger, INFO
+from time import perf_counter
+from numpy import array, zeros, full, arange, frombuffer, concatenate, stack, sum, any, packbits, unpackbits
+from numpy import uint8, int64
 
 
-class Monitor(object):
+class DefaultSink(object):
+
+    def __init__(self, sink_name):
+        """
+        Initialize the default sink of telemetry records.
+
+        :param sink_name: name of sink.
+        :type sink_name: str
+        """
+        self.sink_name = sink_name
+
+    def emit(self, record):
+        """
+        Receive a telemetry record.
+
+        :param record: telemetry record, such as {"type": "progress", "current": 1, "total": 10, ...}.
+        :type record: dict
+
+        :raise: this interface needs to be implemented.
+        """
+        raise NotImplementedError("This interface \"def emit(record)\" needs to be implemented.")
+
+
+class NullSink(DefaultSink):
 
     def __init__(self):
+        """
+        Initialize the sink which drops all the telemetry records.
+
+        Example
+            >>> from dsw import NullSink
+            >>> NullSink().emit(record={"type": "message", "text": "dropped"})
+        """
+        super().__init__(sink_name="Null")
+
+    def emit(self, record):
+        pass
+
+
+class LoggingSink(DefaultSink):
+
+    def __init__(self, logger=None, level=INFO):
+        """
+        Initialize the sink which writes the telemetry records into a logger.
+
+        :param logger: logger to write (the logger named "dsw" if None).
+        :type logger: logging.Logger or None
+
+        :param level: logging level of the records.
+        :type level: int
+        """
+        super().__init__(sink_name="Logging")
+        self.logger, self.level = logger if logger is not None else getLogger("dsw"), level
+
+    def emit(self, record):
+        if record.get("type") == "message":
+            self.logger.log(self.level, record["text"])
+        else:
+            self.logger.log(self.level, dumps(record, default=str))
+
+
+class CallbackSink(DefaultSink):
+
+    def __init__(self, callback):
+        """
+        Initialize the sink which passes the telemetry records to a callback.
+
+        :param callback: callback receiving each record.
+        :type callback: function
+
+        Example
+            >>> from dsw import CallbackSink, Monitor
+            >>> records = []
+            >>> monitor = Monitor(sink=CallbackSink(callback=records.append))
+            >>> for state in range(1, 1001):
+            ...     monitor(current_state=state, total_state=1000)
+            >>> len(records), records[-1]["percent"]
+            (101, 100)
+        """
+        super().__init__(sink_name="Callback")
+        self.callback = callback
+
+    def emit(self, record):
+        self.callback(record)
+
+
+class JSONLinesSink(DefaultSink):
+
+    def __init__(self, target):
+        """
+        Initialize the sink which writes each telemetry record as a line of JSON.
+
+        :param target: file path (appended) or opened text file.
+        :type target: str or io.TextIOBase
+        """
+        super().__init__(sink_name="JSONLines")
+        if isinstance(target, str):
+            self.file, self.is_owned = open(target, "a", encoding="utf-8"), True
+        else:
+            self.file, self.is_owned = target, False
+
+    def emit(self, record):
+        self.file.write(dumps(record, default=str) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """
+        Close the file if it is opened by this sink.
+        """
+        if self.is_owned:
+            self.file.close()
+
+
+class Telemetry(object):
+
+    def __init__(self, sink=None, enabled=False):
+        """
+        Initialize the telemetry, which collects counters and timers and routes the outputs of verbose paths.
+
+        :param sink: sink of the telemetry records (print to the console if None).
+        :type sink: dsw.operation.DefaultSink or None
+
+        :param enabled: collect the counters and timers.
+        :type enabled: bool
+
+        Example
+            >>> from dsw import Telemetry, CallbackSink
+            >>> records = []
+            >>> telemetry = Telemetry(sink=CallbackSink(callback=records.append), enabled=True)
+            >>> for _ in range(3):
+            ...     telemetry.count(name="nucleotides", value=100)
+            ...     with telemetry.timer(name="walk"):
+            ...         pass
+            >>> telemetry.message(text="Walk finished.")
+            >>> telemetry.counters, telemetry.timers["walk"][0]
+            ({'nucleotides': 300}, 3)
+            >>> records
+            [{'type': 'message', 'text': 'Walk finished.'}]
+
+        .. note::
+            If the telemetry is disabled (by default), "count" returns at once
+            and "timer" returns a shared empty context manager, so that the hooks cost almost nothing.
+
+            The progress of "Monitor" and the messages of verbose paths in this library are routed
+            through the sink of the global telemetry ("dsw.telemetry"), which prints to the console by default.
+        """
+        self.sink, self.enabled = sink, enabled
+        self.counters, self.timers = {}, {}
+
+    def count(self, name, value=1):
+        """
+        Increase a counter.
+
+        :param name: name of counter.
+        :type name: str
+
+        :param value: increment.
+        :type value: int
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def timer(self, name):
+        """
+        Obtain a context manager which accumulates the wall time of its block into a timer.
+
+        :param name: name of timer.
+        :type name: str
+
+        :return: context manager.
+        :rtype: contextlib.AbstractContextManager
+        """
+        if not self.enabled:
+            return empty_context
+
+        return self.measure(name)
+
+    @contextmanager
+    def measure(self, name):
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            call_number, total_time = self.timers.get(name, (0, 0.0))
+            self.timers[name] = (call_number + 1, total_time + perf_counter() - start_time)
+
+    def message(self, text):
+        """
+        Output a message of verbose path.
+
+        :param text: message.
+        :type text: str
+        """
+        if self.sink is None:
+            print(text)
+        else:
+            self.sink.emit({"type": "message", "text": text})
+
+    def snapshot(self):
+        """
+        Obtain the current counters and timers.
+
+        :return: counters and timers (the call number and the total seconds of each timer).
+        :rtype: dict
+        """
+        timers = {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self.timers.items()}
+        return {"counters": dict(self.counters), "timers": timers}
+
+    def flush(self):
+        """
+        Emit the current counters and timers as a "metrics" record to the sink.
+        """
+        record = {"type": "metrics"}
+        record.update(self.snapshot())
+        if self.sink is None:
+            print(dumps(record))
+        else:
+            self.sink.emit(record)
+
+    def reset(self):
+        """
+        Clear the counters and timers.
+        """
+        self.counters, self.timers = {}, {}
+
+
+empty_context, telemetry = nullcontext(), Telemetry()
+
+
+class Profiler(object):
+
+    def __init__(self, file_path=None):
+        """
+        Initialize the profiler, which records the wall time, call counts and work counters of the hot paths.
+
+        :param file_path: path of the JSON file to export the report when the profiler exits.
+        :type file_path: str or None
+
+        Example
+            >>> from numpy import array
+            >>> from dsw import Profiler, encode, decode
+            >>> # accessor with GC-balanced
+            >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                                  [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+            >>> with Profiler() as profiler:
+            ...     for _ in range(3):
+            ...         dna_sequence = encode(binary_message=array([0, 1, 0, 1, 0, 1, 0, 1]), accessor=accessor, \
+                                              start_index=1)
+            ...         binary_message = decode(dna_sequence=dna_sequence, bit_length=8, accessor=accessor, \
+                                                start_index=1)
+            >>> profiler.report["timers"]["encode"]["calls"], profiler.report["timers"]["decode"]["calls"]
+            (3, 3)
+            >>> profiler.report["counters"]
+            {'encode.nucleotides': 21, 'decode.nucleotides': 21}
+
+        .. note::
+            The profiled functions are "encode", "decode", "repair_dna", "path_matching", "find_vertices",
+            "connect_coding_graph" and "approximate_capacity".
+            The wall time of nested calls is inclusive, such as "path_matching" inside "repair_dna".
+
+            The global telemetry ("dsw.telemetry") is enabled inside the profiler,
+            and its previous switch, counters and timers are restored when the profiler exits.
+            Setting "dsw.telemetry.enabled = True" is the global switch for the same records without the profiler.
+        """
+        self.file_path, self.report, self.previous_state, self.start_time = file_path, None, None, None
+
+    def __enter__(self):
+        self.previous_state = (telemetry.enabled, telemetry.counters, telemetry.timers)
+        telemetry.enabled, telemetry.counters, telemetry.timers = True, {}, {}
+        self.start_time = perf_counter()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.report = {"seconds": perf_counter() - self.start_time}
+        self.report.update(telemetry.snapshot())
+        telemetry.enabled, telemetry.counters, telemetry.timers = self.previous_state
+
+        if self.file_path is not None:
+            self.export(file_path=self.file_path)
+
+        return False
+
+    def export(self, file_path):
+        """
+        Export the report as a JSON file.
+
+        :param file_path: path of the JSON file.
+        :type file_path: str
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+
+    def to_json(self):
+        """
+        Obtain the report as a JSON string.
+
+        :return: JSON string of the report.
+        :rtype: str
+        """
+        return dumps(self.report, indent=2)
+
+
+def profiled(function):
+    """
+    Record the wall time and call count of the function in the global telemetry if it is enabled.
+
+    :param function: function to be profiled.
+    :type function: function
+
+    :return: profiled function.
+    :rtype: function
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not telemetry.enabled:
+            return function(*args, **kwargs)
+
+        with telemetry.measure(function.__name__):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class Monitor(object):
+
+    def __init__(self, sink=None):
         """
         Initialize the monitor to identify the task progress.
 
+        :param sink: sink of the progress records (the sink of the global telemetry if None).
+        :type sink: dsw.operation.DefaultSink or None
+
         Example
             >>> from dsw import Monitor
             >>> monitor = Monitor()
@@ -16,8 +351,16 @@ class Monitor(object):
             \r|███████████         | 50% ( 5/10) wait 0000:00:00.
             >>> monitor(current_state=10, total_state=10)
             \r|████████████████████|100% (10/10) used 0000:00:00.
+
+        .. note::
+            The progress is rendered only when its integer percentage changes (or the task is finished),
+            so that calling the monitor in every iteration of a huge loop costs almost nothing.
+
+            The monitor starts over when the current state goes backwards or the total state changes,
+            so that it can be reused for another task even if the previous one is not finished.
         """
-        self.last_time = None
+        self.sink, self.last_time, self.last_position = sink, None, -1
+        self.last_state, self.last_total = 0, None
 
     def __call__(self, current_state, total_state, extra=None):
         """
@@ -32,50 +375,369 @@ class Monitor(object):
         :param extra: extra vision information if required.
         :type extra: dict
         """
-        if self.last_time is None:
-            self.last_time = datetime.now()
+        if current_state < self.last_state or total_state != self.last_total:  # another task is started.
+            self.last_time, self.last_position = None, -1
+        self.last_state, self.last_total = current_state, total_state
 
         if current_state == 0:
+            if self.last_time is None:
+                self.last_time = datetime.now()
             return
 
         position = int(current_state / total_state * 100)
+        if position == self.last_position and current_state < total_state:
+            return
 
-        string = "|"
-
-        for index in range(0, 100, 5):
-            if position >= index:
-                string += "█"
-            else:
-                string += " "
+        if self.last_time is None:
+            self.last_time = datetime.now()
 
-        string += "|"
+        self.last_position = position
 
         pass_time = (datetime.now() - self.last_time).total_seconds()
         wait_time = int(pass_time * (total_state - current_state) / current_state)
 
-        string += " " * (3 - len(str(position))) + str(position) + "% ("
+        sink = self.sink if self.sink is not None else telemetry.sink
+        if sink is not None:
+            sink.emit({"type": "progress", "current": current_state, "total": total_state, "percent": position,
+                       "used": pass_time, "wait": wait_time if current_state < total_state else 0, "extra": extra})
+
+        else:
+            string = "|"
+
+            for index in range(0, 100, 5):
+                if position >= index:
+                    string += "█"
+                else:
+                    string += " "
+
+            string += "|"
+
+            string += " " * (3 - len(str(position))) + str(position) + "% ("
+
+            string += " " * (len(str(total_state)) - len(str(current_state))) + str(current_state) + "/" \
+                + str(total_state)
+
+            if current_state < total_state:
+                minute, second = divmod(wait_time, 60)
+                hour, minute = divmod(minute, 60)
+                string += ") wait " + "%04d:%02d:%02d" % (hour, minute, second)
+            else:
+                minute, second = divmod(pass_time, 60)
+                hour, minute = divmod(minute, 60)
+                string += ") used " + "%04d:%02d:%02d" % (hour, minute, second)
+
+            if extra is not None:
+                string += " " + str(extra).replace("\'", "").replace("{", "(").replace("}", ")") + "."
+            else:
+                string += "."
 
-        string += " " * (len(str(total_state)) - len(str(current_state))) + str(current_state) + "/" + str(total_state)
+            print("\r" + string, end="", flush=True)
 
-        if current_state < total_state:
-            minute, second = divmod(wait_time, 60)
-            hour, minute = divmod(minute, 60)
-            string += ") wait " + "%04d:%02d:%02d" % (hour, minute, second)
+            if current_state >= total_state:
+                print()
+
+        if current_state >= total_state:
+            self.last_time, self.last_position = None, -1
+
+
+class PackedDNA(object):
+
+    table = full(256, 4, dtype=uint8)
+    table[frombuffer(b"ACGT", dtype=uint8)] = [0, 1, 2, 3]
+    letters = frombuffer(b"ACGT", dtype=uint8)
+
+    def __init__(self, dna_sequence=""):
+        """
+        Initialize the packed DNA sequence, which stores each nucleotide in 2 bits (4 nucleotides per byte).
+
+        :param dna_sequence: DNA sequence (or ASCII bytes of DNA sequence) to be packed.
+        :type dna_sequence: str or bytes or PackedDNA
+
+        Example
+            >>> from dsw import PackedDNA
+            >>> dna_sequence = PackedDNA("ACGTTGCAA")
+            >>> len(dna_sequence), dna_sequence.to_bytes()
+            (9, b'\\x1b\\xe4\\x00')
+            >>> str(dna_sequence), dna_sequence[2], dna_sequence[-4:]
+            ('ACGTTGCAA', 'G', PackedDNA('GCAA'))
+            >>> dna_sequence == "ACGTTGCAA", dna_sequence + "C" == PackedDNA(b"ACGTTGCAAC")
+            (True, True)
+            >>> PackedDNA.from_bytes(dna_sequence.to_bytes(), 9).indices()
+            array([0, 1, 2, 3, 3, 2, 1, 0, 0], dtype=uint8)
+
+        .. note::
+            The nucleotides "A", "C", "G", and "T" are packed as 00, 01, 10, and 11,
+            with the first nucleotide in the two most significant bits of the first byte.
+
+            A packed DNA sequence built from another packed DNA sequence (or from "from_bytes")
+            shares its underlying bytes instead of copying them.
+        """
+        if isinstance(dna_sequence, PackedDNA):
+            self.data, self.length = dna_sequence.data, dna_sequence.length
         else:
-            minute, second = divmod(pass_time, 60)
-            hour, minute = divmod(minute, 60)
-            string += ") used " + "%04d:%02d:%02d" % (hour, minute, second)
+            if isinstance(dna_sequence, str):
+                try:
+                    dna_sequence = dna_sequence.encode("ascii")
+                except UnicodeEncodeError:
+                    raise ValueError("Only \"A\", \"C\", \"G\", and \"T\" can be packed!")
+            values = self.table[frombuffer(dna_sequence, dtype=uint8)]
+            if any(values > 3):
+                raise ValueError("Only \"A\", \"C\", \"G\", and \"T\" can be packed!")
+            packed_sequence = PackedDNA.from_indices(values)
+            self.data, self.length = packed_sequence.data, packed_sequence.length
+
+    @staticmethod
+    def from_indices(indices):
+        """
+        Pack the nucleotide indices (0, 1, 2, and 3 for "A", "C", "G", and "T") into a packed DNA sequence.
+
+        :param indices: nucleotide indices.
+        :type indices: list or numpy.ndarray
+
+        :return: packed DNA sequence.
+        :rtype: dsw.operation.PackedDNA
+        """
+        values = array(indices, dtype=uint8).reshape(-1)
+        padded_values = zeros(shape=(-len(values) // 4 * -4,), dtype=uint8)
+        padded_values[:len(values)] = values
+        padded_values = padded_values.reshape(-1, 4)
+
+        packed_sequence = PackedDNA.__new__(PackedDNA)
+        packed_sequence.data = (padded_values[:, 0] << 6) | (padded_values[:, 1] << 4) \
+            | (padded_values[:, 2] << 2) | padded_values[:, 3]
+        packed_sequence.length = len(values)
+        return packed_sequence
+
+    @staticmethod
+    def from_bytes(data, length):
+        """
+        Wrap the packed bytes into a packed DNA sequence without copying.
+
+        :param data: packed bytes, such as the result of "to_bytes".
+        :type data: bytes or bytearray or memoryview
+
+        :param length: number of nucleotides stored in the packed bytes.
+        :type length: int
+
+        :return: packed DNA sequence.
+        :rtype: dsw.operation.PackedDNA
+        """
+        if length < 0 or -length // 4 * -1 > len(data):
+            raise ValueError("The packed bytes cannot hold " + str(length) + " nucleotides!")
+
+        packed_sequence = PackedDNA.__new__(PackedDNA)
+        packed_sequence.data = frombuffer(data, dtype=uint8, count=-length // 4 * -1)
+        packed_sequence.length = length
+        return packed_sequence
+
+    def indices(self):
+        """
+        Unpack the nucleotide indices (0, 1, 2, and 3 for "A", "C", "G", and "T").
+
+        :return: nucleotide indices.
+        :rtype: numpy.ndarray
+        """
+        values = stack([self.data >> 6, (self.data >> 4) & 3, (self.data >> 2) & 3, self.data & 3], axis=1)
+        return values.reshape(-1)[:self.length]
+
+    def to_bytes(self):
+        """
+        Export the packed bytes.
+
+        :return: packed bytes.
+        :rtype: bytes
+        """
+        return self.data.tobytes()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return PackedDNA.from_indices(self.indices()[item])
 
-        if extra is not None:
-            string += " " + str(extra).replace("\'", "").replace("{", "(").replace("}", ")") + "."
+        if item < 0:
+            item += self.length
+        if item < 0 or item >= self.length:
+            raise IndexError("Index out of range of the packed DNA sequence!")
+
+        return "ACGT"[(int(self.data[item >> 2]) >> (6 - 2 * (item & 3))) & 3]
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __add__(self, other):
+        return PackedDNA.from_indices(concatenate((self.indices(), PackedDNA(other).indices())))
+
+    def __eq__(self, other):
+        if isinstance(other, PackedDNA):
+            return self.length == other.length and self.to_bytes() == other.to_bytes()
+        if isinstance(other, str):
+            return str(self) == other
+        return False
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __str__(self):
+        return self.letters[self.indices()].tobytes().decode("ascii")
+
+    def __repr__(self):
+        return "PackedDNA(\'" + str(self) + "\')"
+
+
+class BigNumber(object):
+
+    def __init__(self, number=0):
+        """
+        Initialize the huge number, which supports the in-place calculus with small values.
+
+        :param number: huge number (decimal string is acceptable).
+        :type number: int or str or dsw.operation.BigNumber
+
+        Example
+            >>> from dsw import BigNumber
+            >>> number = BigNumber("99999999999999999999999999999999999999999999999999")
+            >>> number.multiply_add(multiplier=2, addend=3)
+            BigNumber('200000000000000000000000000000000000000000000000001')
+            >>> number.divide(divisor=7), str(number)
+            (5, '28571428571428571428571428571428571428571428571428')
+            >>> len(str(BigNumber("9" * 100000) + 1))
+            100001
+
+        .. note::
+            The value is stored as a Python integer, whose machine-word limbs are handled in C,
+            instead of the decimal string with one digit per Python operation.
+
+            The decimal strings are converted in the divide-and-conquer way,
+            so that the conversion is not limited by the maximum digits of integer string conversion (Python >= 3.11).
+        """
+        if isinstance(number, BigNumber):
+            self.value = number.value
+        elif isinstance(number, str):
+            self.value = BigNumber.parse(number)
         else:
-            string += "."
+            self.value = int(number)
+
+    @staticmethod
+    def parse(string, threshold=2048):
+        """
+        Transform a decimal string to the equivalent integer in the divide-and-conquer way.
 
-        print("\r" + string, end="", flush=True)
+        :param string: decimal string.
+        :type string: str
 
-        if current_state >= total_state:
-            self.last_time = None
-            print()
+        :param threshold: number of digits below which the built-in conversion is used.
+        :type threshold: int
+
+        :return: equivalent integer.
+        :rtype: int
+        """
+        string, powers = string.strip(), {}
+
+        def merge(digits):
+            if len(digits) <= threshold:
+                return int(digits)
+
+            low_length = len(digits) // 2
+            if low_length not in powers:
+                powers[low_length] = 10 ** low_length
+
+            return merge(digits[:-low_length]) * powers[low_length] + merge(digits[-low_length:])
+
+        if len(string) > 0 and string[0] in "+-":
+            return -merge(string[1:]) if string[0] == "-" else merge(string[1:])
+
+        return merge(string)
+
+    @staticmethod
+    def format(value, threshold=2048):
+        """
+        Transform an integer to the equivalent decimal string in the divide-and-conquer way.
+
+        :param value: integer.
+        :type value: int
+
+        :param threshold: number of digits below which the built-in conversion is used.
+        :type threshold: int
+
+        :return: equivalent decimal string.
+        :rtype: str
+        """
+        powers = {}
+
+        def split(number, length=0):
+            digit_number = int(number.bit_length() * 0.30102999566398) + 1  # upper bound of the digit number.
+            if digit_number <= threshold:
+                return str(number).zfill(length)
+
+            low_length = digit_number // 2
+            if low_length not in powers:
+                powers[low_length] = 10 ** low_length
+
+            high, low = huge_divmod(number, powers[low_length])
+            return (split(high) if high > 0 else "").zfill(length - low_length) + split(low, low_length)
+
+        return "-" + split(-value) if value < 0 else split(value)
+
+    def multiply_add(self, multiplier, addend=0):
+        """
+        Do the in-place calculus, as number * multiplier + addend.
+
+        :param multiplier: multiplier.
+        :type multiplier: int
+
+        :param addend: addend.
+        :type addend: int
+
+        :return: this huge number.
+        :rtype: dsw.operation.BigNumber
+        """
+        self.value = self.value * multiplier + addend
+        return self
+
+    def divide(self, divisor):
+        """
+        Do the in-place calculus, as number // divisor, and return number % divisor.
+
+        :param divisor: divisor.
+        :type divisor: int
+
+        :return: remainder.
+        :rtype: int
+        """
+        self.value, remainder = huge_divmod(self.value, divisor)
+        return remainder
+
+    def __add__(self, other):
+        return BigNumber(self.value + BigNumber(other).value)
+
+    def __sub__(self, other):
+        return BigNumber(self.value - BigNumber(other).value)
+
+    def __mul__(self, other):
+        return BigNumber(self.value * BigNumber(other).value)
+
+    def __divmod__(self, other):
+        quotient, remainder = huge_divmod(self.value, BigNumber(other).value)
+        return BigNumber(quotient), BigNumber(remainder)
+
+    def __eq__(self, other):
+        if isinstance(other, (BigNumber, int, str)):
+            return self.value == BigNumber(other).value
+        return False
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __int__(self):
+        return self.value
+
+    def __str__(self):
+        return BigNumber.format(self.value)
+
+    def __repr__(self):
+        return "BigNumber(\'" + str(self) + "\')"
 
 
 def calculus_addition(number, base):
@@ -99,23 +761,7 @@ def calculus_addition(number, base):
         >>> calculus_addition(number="99999999999999999999999999999999999999999999999999", base="2")
         '100000000000000000000000000000000000000000000000001'
     """
-    number, base = list(number), list(base.zfill(len(number)))
-
-    result = [0 for _ in range(len(number) + 1)]
-    for index in range(len(number) - 1, -1, -1):
-        sum_value = int(number[index]) + int(base[index]) + int(result[index + 1])
-        if sum_value < 10:
-            result[index + 1] = sum_value
-        else:
-            flag = 0
-            while sum_value > 0:
-                result[index + 1 - flag] = sum_value % 10
-                sum_value //= 10
-                flag += 1
-
-    result = "".join(list(map(str, result)))
-
-    return result if result[0] != "0" else result[1:]
+    return str(BigNumber(number).multiply_add(multiplier=1, addend=int(base)))
 
 
 def calculus_subtraction(number, base):
@@ -139,28 +785,7 @@ def calculus_subtraction(number, base):
         >>> calculus_subtraction(number="10000000000000000000000000000000000000000000000001", base="2")
         '9999999999999999999999999999999999999999999999999'
     """
-    number, base = [int(item) for item in number], [int(item) for item in base]
-
-    residue = ""
-    for index in range(len(base)):
-        flag_a, flag_b = len(number) - 1 - index, len(base) - 1 - index
-        if int(number[flag_a]) >= int(base[flag_b]):
-            residue = str(int(number[flag_a]) - int(base[flag_b])) + residue
-        else:
-            residue = str(10 + int(number[flag_a]) - int(base[flag_b])) + residue
-            while number[flag_a - 1] == 0:
-                number[flag_a - 1] = 9
-                flag_a -= 1
-            number[flag_a - 1] -= 1
-
-        for flag in range(len(number) - 1 - index - 1, -1, -1):
-            residue = str(number[flag]) + residue
-
-    for index in range(len(residue)):
-        if residue[index] != "0":
-            return residue[index:]
-
-    return "0"
+    return str(BigNumber(number).multiply_add(multiplier=1, addend=-int(base)))
 
 
 def calculus_multiplication(number, base):
@@ -184,31 +809,7 @@ def calculus_multiplication(number, base):
         >>> calculus_multiplication(number="9999999999999999999999999999999999999999999999999", base="2")
         '19999999999999999999999999999999999999999999999998'
     """
-    if base == "0":
-        return "0"
-
-    if base == "1":
-        return number
-
-    number = [int(item) for item in number]
-
-    remainder = 0
-    for index in range(len(number))[::-1]:
-        current = number[index] * int(base) + remainder
-        if current >= 10:
-            number[index] = current % 10
-            remainder = current // 10
-        else:
-            number[index] = current
-            remainder = 0
-
-    while remainder > 0:
-        number.insert(0, remainder % 10)
-        remainder //= 10
-
-    result = "".join(list(map(str, number)))
-
-    return result
+    return str(BigNumber(number).multiply_add(multiplier=int(base)))
 
 
 def calculus_division(number, base):
@@ -237,29 +838,127 @@ def calculus_division(number, base):
     if base == "0":
         return "0", "0"
 
-    if base == "1":
-        return number, "0"
+    quotient = BigNumber(number)
+    remainder = quotient.divide(divisor=int(base))
+
+    return str(quotient), str(remainder)
+
+
+def huge_divmod(number, divisor, threshold=4096):
+    """
+    Do huge number division calculus in the divide-and-conquer way, as number // divisor and number % divisor.
+
+    :param number: huge number.
+    :type number: int
+
+    :param divisor: huge divisor.
+    :type divisor: int
+
+    :param threshold: bit length of divisor below which the built-in division is used.
+    :type threshold: int
+
+    :return: number // divisor and number % divisor.
+    :rtype: (int, int)
+
+    Example
+        >>> from dsw import huge_divmod
+        >>> huge_divmod(number=3 ** 100 + 7, divisor=3 ** 50, threshold=8)
+        (717897987691852588770249, 7)
+
+    .. note::
+        The built-in division of huge integers is quadratic in the bit length.
+        Here, the recursive division of Burnikel and Ziegler (1998) is used,
+        which reduces the division to several multiplications of half size.
+
+        The negative number or non-positive divisor is handled by the built-in division.
+    """
+    def divide_2n_1n(a, b, n):  # a < b * 2^n, the bit length of b is n.
+        if n <= threshold:
+            return divmod(a, b)
+
+        pad = n & 1
+        if pad:
+            a, b, n = a << 1, b << 1, n + 1
+
+        half = n >> 1
+        mask = (1 << half) - 1
+        b1, b2 = b >> half, b & mask
+        q1, r = divide_3n_2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+        q2, r = divide_3n_2n(r, a & mask, b, b1, b2, half)
+
+        if pad:
+            r >>= 1
 
-    if len(number) == 1 and number[0] < base:
-        return "0", number[0]
+        return (q1 << half) | q2, r
 
-    number, new_number, remainder = [int(item) for item in number], [], 0
-    for index, quotient in enumerate(number):
-        current = quotient + remainder * 10
-        if current >= int(base):
-            new_number.append(current // int(base))
-            remainder = current - new_number[-1] * int(base)
+    def divide_3n_2n(a12, a3, b, b1, b2, n):  # (a12 * 2^n + a3) < b * 2^n, b = b1 * 2^n + b2.
+        if a12 >> n == b1:
+            q, r = (1 << n) - 1, a12 - (b1 << n) + b1
         else:
-            new_number.append(0)
-            remainder = current
+            q, r = divide_2n_1n(a12, b1, n)
+
+        r = ((r << n) | a3) - q * b2
+        while r < 0:
+            q -= 1
+            r += b
+
+        return q, r
+
+    bit_length = divisor.bit_length()
+    if number < 0 or divisor <= 0 or bit_length <= threshold:
+        return divmod(number, divisor)
+
+    mask, quotient, remainder = (1 << bit_length) - 1, 0, 0
+    for index in range((number.bit_length() + bit_length - 1) // bit_length - 1, -1, -1):
+        block = (number >> (index * bit_length)) & mask
+        value, remainder = divide_2n_1n((remainder << bit_length) | block, divisor, bit_length)
+        quotient = (quotient << bit_length) | value
+
+    return quotient, remainder
+
+
+def digit_to_number(digits, radices):
+    """
+    Transform a mixed-radix digit array to the equivalent decimal number.
+
+    :param digits: digit array, the first digit is the least significant one.
+    :type digits: list
+
+    :param radices: radix of each digit.
+    :type radices: list
+
+    :return: equivalent decimal number (may huge) of the inputted digit array.
+    :rtype: int
+
+    Example
+        >>> from dsw import digit_to_number
+        >>> digit_to_number(digits=[1, 2, 0, 1], radices=[2, 3, 4, 2])
+        29
+
+    .. note::
+        The decimal number is digits[0] + radices[0] * (digits[1] + radices[1] * (digits[2] + ...)).
 
-    quotient = "".join(list(map(str, new_number)))
+        Instead of folding the digits one by one (quadratic in the bit length),
+        the neighboring (number, product of radices) pairs are merged level by level as a product tree,
+        so that the cost is dominated by a few multiplications of huge integers.
+    """
+    pairs = [(int(digit), int(radix)) for digit, radix in zip(digits, radices)]
+
+    if len(pairs) == 0:
+        return 0
+
+    while len(pairs) > 1:
+        merged_pairs = []
+        for index in range(0, len(pairs) - 1, 2):
+            (low_number, low_product), (high_number, high_product) = pairs[index], pairs[index + 1]
+            merged_pairs.append((low_number + low_product * high_number, low_product * high_product))
 
-    for index in range(len(quotient)):
-        if quotient[index] != "0":
-            return quotient[index:], str(remainder)
+        if len(pairs) % 2 == 1:
+            merged_pairs.append(pairs[-1])
 
-    return "0", str(remainder)
+        pairs = merged_pairs
+
+    return pairs[0][0]
 
 
 def bit_to_number(bit_array, is_string=True, verbose=False):
@@ -284,28 +983,21 @@ def bit_to_number(bit_array, is_string=True, verbose=False):
         '999'
         >>> bit_to_number(bit_array=[1, 1, 1, 1, 1, 0, 0, 1, 1, 1], is_string=False)
         999
-    """
-    monitor = Monitor()
-    if is_string:
-        decimal_number = "0"
 
-        for index, a_bit in enumerate(bit_array):
-            # multiply by 2
-            decimal_number = calculus_multiplication(number=decimal_number, base="2")
-            # add current bit
-            decimal_number = calculus_addition(number=decimal_number, base=str(a_bit))
+    .. note::
+        The bit array is packed into bytes (8 bits per byte, the first bit is the most significant one),
+        and the bytes are read as a big-endian integer at once, so the time is linear in the length of the bit array.
+    """
+    bit_array = array(bit_array, dtype=uint8).reshape(-1)
 
-            if verbose:
-                monitor(index + 1, len(bit_array))
-    else:
-        decimal_number = 0
+    padded_array = zeros(shape=(-len(bit_array) % 8 + len(bit_array),), dtype=uint8)
+    padded_array[len(padded_array) - len(bit_array):] = bit_array
+    decimal_number = int.from_bytes(packbits(padded_array).tobytes(), byteorder="big")
 
-        for index, a_bit in enumerate(bit_array):
-            decimal_number = decimal_number * 2 + a_bit
-            if verbose:
-                monitor(index + 1, len(bit_array))
+    if verbose:
+        Monitor()(len(bit_array), len(bit_array))
 
-    return decimal_number
+    return str(BigNumber(decimal_number)) if is_string else decimal_number
 
 
 def number_to_bit(decimal_number, bit_length):
@@ -327,19 +1019,23 @@ def number_to_bit(decimal_number, bit_length):
         [1, 1, 1, 1, 1, 0, 0, 1, 1, 1]
         >>> number_to_bit(decimal_number=999, bit_length=10)
         [1, 1, 1, 1, 1, 0, 0, 1, 1, 1]
+
+    .. note::
+        The decimal number is exported as big-endian bytes and unpacked at once,
+        so the time is linear in the bit length of the decimal number.
     """
-    one_array = []
     if type(decimal_number) == str:
-        while decimal_number != "0":  # decimal number > 0
-            decimal_number, remainder = calculus_division(number=decimal_number, base="2")
-            one_array.insert(0, int(remainder))
-    elif type(decimal_number) == int:
-        while decimal_number > 0:
-            decimal_number, remainder = divmod(decimal_number, 2)
-            one_array.insert(0, remainder)
-    else:
+        decimal_number = BigNumber(decimal_number).value
+    elif type(decimal_number) != int:
         raise ValueError("No such type of decimal number (" + str(type(decimal_number)) + ")!")
 
+    if decimal_number > 0:
+        byte_number = (decimal_number.bit_length() + 7) // 8
+        one_array = unpackbits(frombuffer(decimal_number.to_bytes(byte_number, byteorder="big"), dtype=uint8))
+        one_array = one_array[byte_number * 8 - decimal_number.bit_length():].tolist()
+    else:
+        one_array = []
+
     if len(one_array) == bit_length:
         return one_array
     elif len(one_array) < bit_length:
@@ -373,12 +1069,11 @@ def dna_to_number(dna_sequence, is_string=True):
     nucleotide_values = list(map(nucleotides.index, dna_sequence))
 
     if is_string:
-        decimal_number = "0"
+        decimal_number = BigNumber()
         for nucleotide_value in nucleotide_values:
-            # multiply by length of usage of nucleotides.
-            decimal_number = calculus_multiplication(number=decimal_number, base=str(len(nucleotides)))
-            # add current nucleotide value.
-            decimal_number = calculus_addition(number=decimal_number, base=str(nucleotide_value))
+            # multiply by length of usage of nucleotides and add current nucleotide value.
+            decimal_number.multiply_add(multiplier=len(nucleotides), addend=nucleotide_value)
+        decimal_number = str(decimal_number)
     else:
         decimal_number = 0
         for nucleotide_value in nucleotide_values:
@@ -412,16 +1107,126 @@ def number_to_dna(decimal_number, dna_length):
     one_array = []
 
     if type(decimal_number) == str:
-        while decimal_number != "0":  # decimal number > 0
-            decimal_number, remainder = calculus_division(number=decimal_number, base=str(len(nucleotides)))
-            one_array.insert(0, nucleotides[int(remainder)])
+        decimal_number = BigNumber(decimal_number)
+        while decimal_number.value > 0:
+            one_array.append(nucleotides[decimal_number.divide(divisor=len(nucleotides))])
     elif type(decimal_number) == int:
         while decimal_number > 0:
             decimal_number, remainder = divmod(decimal_number, len(nucleotides))
-            one_array.insert(0, nucleotides[remainder])
+            one_array.append(nucleotides[remainder])
     else:
         raise ValueError("No such type of decimal number (" + str(type(decimal_number)) + ")!")
 
-    one_array = "".join(one_array)
+    one_array = "".join(one_array[::-1])
 
     return nucleotides[0] * (dna_length - len(one_array)) + one_array
+
+
+def vertices_to_digits(vertex_indices, observed_length):
+    """
+    Transform the vertex indices to the equivalent base-4 digit matrix.
+
+    :param vertex_indices: vertex indices.
+    :type vertex_indices: list or numpy.ndarray
+
+    :param observed_length: length of the DNA sequence in a vertex.
+    :type observed_length: int
+
+    :return: digit matrix (one vertex per row, 0, 1, 2, and 3 refer to "A", "C", "G", and "T").
+    :rtype: numpy.ndarray
+
+    Example
+        >>> from dsw import vertices_to_digits
+        >>> vertices_to_digits(vertex_indices=[6939, 0, 65535], observed_length=8)
+        array([[0, 1, 2, 3, 0, 1, 2, 3],
+               [0, 0, 0, 0, 0, 0, 0, 0],
+               [3, 3, 3, 3, 3, 3, 3, 3]], dtype=uint8)
+    """
+    vertex_indices = array(vertex_indices, dtype=int64).reshape(-1)
+    shifts = arange(2 * (observed_length - 1), -1, -2, dtype=int64)
+
+    return ((vertex_indices[:, None] >> shifts[None, :]) & 3).astype(uint8)
+
+
+def digits_to_vertices(digit_matrix):
+    """
+    Transform the base-4 digit matrix to the equivalent vertex indices.
+
+    :param digit_matrix: digit matrix (one vertex per row, 0, 1, 2, and 3 refer to "A", "C", "G", and "T").
+    :type digit_matrix: list or numpy.ndarray
+
+    :return: vertex indices.
+    :rtype: numpy.ndarray
+
+    Example
+        >>> from dsw import digits_to_vertices
+        >>> digits_to_vertices(digit_matrix=[[0, 1, 2, 3, 0, 1, 2, 3], [3, 3, 3, 3, 3, 3, 3, 3]])
+        array([ 6939, 65535])
+    """
+    digit_matrix = array(digit_matrix, dtype=int64)
+    shifts = arange(2 * (digit_matrix.shape[1] - 1), -1, -2, dtype=int64)
+
+    return sum(digit_matrix << shifts[None, :], axis=1)
+
+
+def vertices_to_dna(vertex_indices, observed_length):
+    """
+    Transform the vertex indices to the equivalent DNA strings.
+
+    :param vertex_indices: vertex indices.
+    :type vertex_indices: list or numpy.ndarray
+
+    :param observed_length: length of the DNA sequence in a vertex.
+    :type observed_length: int
+
+    :return: DNA strings (fixed-width string array).
+    :rtype: numpy.ndarray
+
+    Example
+        >>> from dsw import vertices_to_dna
+        >>> vertices_to_dna(vertex_indices=[6939, 0, 65535], observed_length=8)
+        array(['ACGTACGT', 'AAAAAAAA', 'TTTTTTTT'], dtype='<U8')
+
+    .. note::
+        The nucleotides of all the vertices are written into one byte buffer and viewed as fixed-width strings,
+        instead of formatting the DNA string of each vertex one by one.
+    """
+    digit_matrix = vertices_to_digits(vertex_indices=vertex_indices, observed_length=observed_length)
+    if observed_length == 0:
+        return full(shape=(len(digit_matrix),), fill_value="", dtype="<U1")
+
+    letters = frombuffer(b"ACGT", dtype=uint8)[digit_matrix]
+
+    return letters.reshape(-1).view(dtype="S" + str(observed_length)).astype("<U" + str(observed_length))
+
+
+def dna_to_vertices(dna_sequences):
+    """
+    Transform the DNA strings (with the same length) to the equivalent vertex indices.
+
+    :param dna_sequences: DNA strings.
+    :type dna_sequences: list or numpy.ndarray
+
+    :return: vertex indices.
+    :rtype: numpy.ndarray
+
+    Example
+        >>> from dsw import dna_to_vertices
+        >>> dna_to_vertices(dna_sequences=["ACGTACGT", "AAAAAAAA", "TTTTTTTT"])
+        array([ 6939,     0, 65535])
+    """
+    if len(dna_sequences) == 0:
+        return zeros(shape=(0,), dtype=int64)
+
+    dna_sequences = [str(dna_sequence) for dna_sequence in dna_sequences]
+    observed_length = len(dna_sequences[0])
+    if any([len(dna_sequence) != observed_length for dna_sequence in dna_sequences]):
+        raise ValueError("The DNA strings should have the same length!")
+
+    data = "".join(dna_sequences)
+
+    digit_matrix = PackedDNA.table[frombuffer(data.encode("ascii", errors="replace"), dtype=uint8)]
+    if any(digit_matrix > 3):
+        raise ValueError("Only \"A\", \"C\", \"G\", and \"T\" can be transformed!")
+
+    return digits_to_vertices(digit_matrix=digit_matrix.reshape(len(dna_sequences), observed_length))
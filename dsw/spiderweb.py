@@ -1,23 +1,31 @@
 from collections import Counter
+from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from os.path import getsize
 from itertools import product
-from networkx import DiGraph, find_cycle
-from numpy import zeros, ones, array, random, log, sum, max, argmax, argsort, unique, intersect1d, where
+from numpy import zeros, ones, array, random, log, sum, max, any, argmax, argsort, unique, intersect1d, where, stack
+from numpy import int8, arange, tile, bincount, concatenate, frombuffer, unpackbits, uint8, ndarray, minimum
+from numpy import subtract
 
-from dsw.operation import Monitor, calculus_addition, calculus_multiplication, calculus_division
-from dsw.operation import bit_to_number, number_to_bit, number_to_dna, dna_to_number
-from dsw.graphized import obtain_vertices, obtain_formers, obtain_latters, path_matching, calculate_intersection_score
+from dsw.operation import Monitor, telemetry, profiled, bit_to_number, number_to_bit, number_to_dna
+from dsw.operation import huge_divmod, digit_to_number, PackedDNA
+from dsw.operation import vertices_to_digits, vertices_to_dna, digits_to_vertices
+from dsw.graphized import CompiledAccessor, CompactAccessor, MaskAccessor
+from dsw.graphized import obtain_vertices, obtain_components
+from dsw.graphized import path_matching, calculate_intersection_score
 
 
-def encode(binary_message, accessor, start_index,
-           is_faster=False, vt_length=0, shuffles=None, need_path=False, verbose=False):
+@profiled
+def encode(binary_message, accessor, start_index, is_faster=False, vt_length=0, shuffles=None,
+           need_path=False, path_buffer=None, is_ranged=False, is_packed=False, verbose=False):
     """
     Encode a bit array by the specific accessor.
 
     :param binary_message: binary message.
     :type binary_message: numpy.ndarray
 
-    :param accessor: accessor of the coding algorithm.
-    :type accessor: numpy.ndarray
+    :param accessor: (compiled or compact) accessor of the coding algorithm.
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
 
     :param start_index: virtual vertex to start encoding.
     :type start_index: int
@@ -34,15 +42,42 @@ def encode(binary_message, accessor, start_index,
     :param need_path: need to record the restricted state transition path.
     :type need_path: bool
 
+    :param path_buffer: preallocated integer matrix (N x 2) to record the path into if "need_path" is True.
+    :type path_buffer: numpy.ndarray or None
+
+    :param is_ranged: encode through the arithmetic coding with bounded precision.
+    :type is_ranged: bool
+
+    :param is_packed: return the DNA sequence as a packed DNA sequence (2 bits per nucleotide).
+    :type is_packed: bool
+
     :param verbose: need to print log.
     :type verbose: bool
 
     :return: DNA sequence encoded by this graph (and VT check sequence if required).
-    :rtype: str or (str, str)
+    :rtype: str or dsw.operation.PackedDNA or (str, str)
 
     .. note::
-        If the parameter "is_faster" is set as True, the out-degree of coding digraph cannot contains 3.
-
+        If the parameter "is_faster" is set as True, the vertex with out-degree 4 (or 2) transcodes 2 (or 1) bits.
+        The vertices with out-degree 3 transcode 11 bits by a block of 7 trits (3^7 >= 2^11),
+        where the block starts at the first of these vertices and its trits are spread over the next ones.
+        If the binary message is exhausted before the last block is completed,
+        the remaining trits are transcoded as a mixed radix number through the following vertices.
+        If a vertex with out-degree 4 is reached when only one bit remains, the missing bit is regarded as 0.
+
+        If the parameter "is_ranged" is set as True, the binary message is regarded as an arithmetic code,
+        where the symbol of each vertex is uniformly distributed over its out-degree.
+        The 32-bit interval is narrowed vertex by vertex until the first "len(binary_message)" bits are determined,
+        so the time is linear and the DNA sequence is at most a few nucleotides longer than the one by default.
+
+        If the accessor is compiled with the shuffles ("CompiledAccessor(accessor, shuffles)"),
+        the parameter "shuffles" can be omitted and the bit-nucleotide mapping is looked up from the compiled tables.
+
+        If the parameter "need_path" is set as True, each row of the path is [vertex, 1 if it contains information],
+        where the vertex is the current one by default (or in the ranged way) and the latter one in the faster way.
+        The visited vertices are written into a preallocated path matrix during the walk,
+        which is sized from the bit length and only doubled when many vertices with out-degree 1 are passed.
+        If the parameter "path_buffer" is given, the path is written into its first rows (a view of them is returned).
 
     Example
         >>> from numpy import array
@@ -63,89 +98,244 @@ def encode(binary_message, accessor, start_index,
                               [2, 3, 1, 0], [2, 0, 3, 1], [0, 1, 3, 2], [0, 3, 2, 1]])
         >>> encode(accessor=accessor, binary_message=binary_message, shuffles=shuffles, start_index=1)
         'AGAGAGA'
+        >>> encode(accessor=accessor, binary_message=binary_message, start_index=1, is_ranged=True)
+        'AGAGAGAG'
+        >>> encode(accessor=accessor, binary_message=binary_message, start_index=1, is_packed=True)
+        PackedDNA('TCTCTCT')
+        >>> _, record_path = encode(accessor=accessor, binary_message=binary_message, start_index=1, need_path=True)
+        >>> record_path[:3]
+        array([[ 1,  1],
+               [ 7,  1],
+               [13,  1]])
     """
-    monitor, record_path, vertex_index, dna_sequence, nucleotides = Monitor(), [], start_index, "", "ACGT"
-
-    if not is_faster:
-        quotient = bit_to_number(binary_message, verbose=verbose)
-        total_state = len(quotient)  # number of symbol.
-
-        while quotient != "0":
-            used_indices = where(accessor[vertex_index] >= 0)[0]
+    monitor, vertex_index, dna_values, nucleotides = Monitor(), start_index, [], "ACGT"
 
-            if len(used_indices) > 1:  # current vertex contains information.
-                quotient, remainder = calculus_division(number=quotient, base=str(len(used_indices)))
-                remainder = int(remainder)
+    record_path = None
+    if need_path:
+        if path_buffer is None:  # each vertex with out-degree more than 1 transcodes at least 1 bit.
+            record_path = zeros(shape=(len(binary_message) + 8, 2), dtype=int)
+        elif path_buffer.ndim != 2 or path_buffer.shape[1] != 2:
+            raise ValueError("The path buffer should be a matrix with 2 columns and enough rows!")
+        else:
+            record_path = path_buffer
+
+    def record(current_index):
+        # write the vertex before the next nucleotide into the path.
+        nonlocal record_path
+        if len(dna_values) == len(record_path):
+            if path_buffer is not None:
+                raise ValueError("The path buffer should be a matrix with 2 columns and enough rows!")
+            record_path = concatenate((record_path, zeros(shape=record_path.shape, dtype=int)))
+        record_path[len(dna_values), 0] = current_index
+
+    compact_accessor = None
+    if isinstance(accessor, CompactAccessor):  # walk through the compact indices.
+        compact_accessor, vertex_index = accessor, accessor.to_compact(start_index)
+        if shuffles is not None:
+            shuffles = accessor.select(shuffles)
+        accessor = accessor.latters
+
+    if isinstance(accessor, CompiledAccessor):
+        if not accessor.compatible(shuffles):
+            raise ValueError("The shuffles are inconsistent with the shuffles of the compiled accessor!")
+        # the shuffles have been folded into the compiled tables.
+        out_degrees, used_table, accessor = accessor.out_degrees, accessor.shuffled_indices, accessor.accessor
+        shuffles = None
+    else:
+        out_degrees, used_table = None, None
+
+    if is_faster and is_ranged:
+        raise ValueError("The parameters \"is_faster\" and \"is_ranged\" cannot be set as True together!")
+
+    if is_ranged:
+        # interval [low, high] of the arithmetic code, code is the current window of the binary message.
+        # the binary message is followed by 1 and 0s, so that the code is inside (not at the border of) its cell.
+        padded_message = list(binary_message) + [1]
+        low, high, half, quarter = 0, 2 ** 32 - 1, 2 ** 31, 2 ** 30
+        code = bit_to_number(padded_message[:32] + [0] * (32 - len(padded_message[:32])), is_string=False)
+        location, determined_number, pending_number = 32, 0, 0
+
+        while determined_number < len(binary_message):
+            if used_table is not None:
+                radix, used_indices = out_degrees[vertex_index], used_table[vertex_index]
+            else:
+                used_indices = where(accessor[vertex_index] >= 0)[0]
+                radix = len(used_indices)
+
+            if radix > 1:  # current vertex contains information.
+                step = (high - low + 1) // int(radix)
+                remainder = min([(code - low) // step, int(radix) - 1])  # the last symbol takes the rest interval.
+                if remainder < radix - 1:
+                    high = low + (remainder + 1) * step - 1
+                low += remainder * step
+
+                while True:
+                    if high < half:
+                        offset, determined_number, pending_number = 0, determined_number + 1 + pending_number, 0
+                    elif low >= half:
+                        offset, determined_number, pending_number = half, determined_number + 1 + pending_number, 0
+                    elif low >= quarter and high < half + quarter:
+                        offset, pending_number = quarter, pending_number + 1
+                    else:
+                        break
+
+                    next_bit = int(padded_message[location]) if location < len(padded_message) else 0
+                    low, high, code = (low - offset) * 2, (high - offset) * 2 + 1, (code - offset) * 2 + next_bit
+                    location += 1
 
                 if shuffles is not None:  # shuffle remainder based on the inputted shuffles.
-                    remainder = argsort(shuffles[vertex_index, used_indices])[remainder]
+                    remainder = argsort(shuffles[vertex_index, used_indices[:radix]])[remainder]
 
                 value = used_indices[remainder]
 
-                if need_path:
-                    record_path.append([vertex_index, 1])
-
-            elif len(used_indices) == 1:  # current vertex does not contain information.
+            elif radix == 1:  # current vertex does not contain information.
                 value = used_indices[0]
 
-                if need_path:
-                    record_path.append([vertex_index, 0])
-
             else:  # current vertex is wrong.
                 raise ValueError("Current vertex doesn't have an out-degree, "
                                  + "the accessor or the start vertex is wrong!")
 
-            nucleotide, vertex_index = nucleotides[value], accessor[vertex_index][value]
+            if need_path:
+                record(vertex_index)
 
-            dna_sequence += nucleotide
+            vertex_index = accessor[vertex_index, value]
+            dna_values.append(int(value))
 
             if verbose:
-                if quotient != "0":
-                    monitor(total_state - len(quotient), total_state)
-                else:
-                    monitor(total_state, total_state)
+                monitor(min([determined_number, len(binary_message)]), len(binary_message))
 
-    else:
-        location = 0
-        while location < len(binary_message):
-            used_indices = where(accessor[vertex_index] >= 0)[0]
-            radix = len(used_indices)
-
-            if radix == 4:  # current vertex contains information.
-                remainder = binary_message[location] * 2 + binary_message[location + 1]
+    elif not is_faster:
+        quotient = bit_to_number(binary_message, is_string=False, verbose=verbose)
+        total_state, powers = quotient.bit_length(), {}  # number of bit.
 
-                if shuffles is not None:  # shuffle remainder based on the inputted shuffles.
-                    remainder = argsort(shuffles[vertex_index, used_indices])[remainder]
+        def transit(number, current_index):
+            if used_table is not None:
+                radix, used_indices = out_degrees[current_index], used_table[current_index]
+            else:
+                used_indices = where(accessor[current_index] >= 0)[0]
+                radix = len(used_indices)
 
-                value = used_indices[remainder]
-                location += 2
-            elif radix == 2:
-                remainder = binary_message[location]
+            if radix > 1:  # current vertex contains information.
+                number, remainder = divmod(number, int(radix))
 
                 if shuffles is not None:  # shuffle remainder based on the inputted shuffles.
-                    remainder = argsort(shuffles[vertex_index, used_indices])[remainder]
+                    remainder = argsort(shuffles[current_index, used_indices[:radix]])[remainder]
 
                 value = used_indices[remainder]
-                location += 1
+
             elif radix == 1:  # current vertex does not contain information.
                 value = used_indices[0]
-            elif radix == 3:
-                raise ValueError("Not implementation!")
+
             else:  # current vertex is wrong.
                 raise ValueError("Current vertex doesn't have an out-degree, "
                                  + "the accessor or the start vertex is wrong!")
 
-            nucleotide, vertex_index = nucleotides[value], accessor[vertex_index][value]
-            dna_sequence += nucleotides[value]
+            if need_path:
+                record(current_index)
+
+            dna_values.append(int(value))
+
+            return number, int(radix), accessor[current_index, value]
+
+        def walk(number, current_index, steps):
+            # the first steps only depend on (number mod 12^steps), where 12 is the lcm of the available radices.
+            if steps <= 64:
+                factor = 1
+                for _ in range(steps):
+                    number, radix, current_index = transit(number, current_index)
+                    factor *= 12 // radix
+
+                return number, factor, current_index
+
+            half = steps // 2
+            for step in [half, steps - half]:
+                if step not in powers:
+                    powers[step] = 12 ** step
+
+            high, low = huge_divmod(number, powers[half])
+            low, low_factor, current_index = walk(low, current_index, half)
+            high, low = huge_divmod(high * low_factor + low, powers[steps - half])
+            low, high_factor, current_index = walk(low, current_index, steps - half)
+
+            # number // (product of radices) and 12^steps // (product of radices).
+            return high * high_factor + low, low_factor * high_factor, current_index
+
+        while quotient != 0:
+            if quotient.bit_length() > 4096:  # the quotient cannot become 0 within these steps.
+                quotient, _, vertex_index = walk(quotient, vertex_index, (quotient.bit_length() - 1) // 2)
+            else:
+                quotient, _, vertex_index = transit(quotient, vertex_index)
+
+            if verbose:
+                if quotient != 0:
+                    monitor(total_state - quotient.bit_length(), total_state)
+                else:
+                    monitor(total_state, total_state)
+
+    else:
+        # radix-3 vertices transcode 11 bits by a block of 7 trits (3^7 >= 2^11).
+        padded_message = zeros(shape=(len(binary_message) + 11,), dtype=int)
+        padded_message[:len(binary_message)] = binary_message
+        location, block_value, trit_number = 0, 0, 0
+
+        while location < len(binary_message) or (trit_number > 0 and block_value > 0):
+            if used_table is not None:
+                radix, used_indices = out_degrees[vertex_index], used_table[vertex_index]
+            else:
+                used_indices = where(accessor[vertex_index] >= 0)[0]
+                radix = len(used_indices)
+
+            if radix == 0:  # current vertex is wrong.
+                raise ValueError("Current vertex doesn't have an out-degree, "
+                                 + "the accessor or the start vertex is wrong!")
+
+            if location >= len(binary_message):  # flush the remaining trits of the last block as a mixed radix number.
+                block_value, remainder = divmod(block_value, int(radix))
+            elif radix == 4:  # current vertex contains information.
+                remainder = padded_message[location] * 2 + padded_message[location + 1]
+                location += 2
+            elif radix == 2:
+                remainder = padded_message[location]
+                location += 1
+            elif radix == 3:
+                if trit_number == 0:  # start a new block.
+                    bit_number = min([11, len(binary_message) - location])
+                    block_value = bit_to_number(padded_message[location: location + bit_number], is_string=False)
+                    location, trit_number = location + bit_number, 7
+
+                block_value, remainder = divmod(block_value, 3)
+                trit_number -= 1
+            else:  # current vertex does not contain information.
+                remainder = 0
+
+            if shuffles is not None and radix > 1:  # shuffle remainder based on the inputted shuffles.
+                remainder = argsort(shuffles[vertex_index, used_indices[:radix]])[remainder]
+
+            value = used_indices[remainder]
 
             if need_path:
-                record_path.append([vertex_index, int(radix > 1)])
+                record(vertex_index)
+
+            vertex_index = accessor[vertex_index, value]
+            dna_values.append(int(value))
 
             if verbose:
-                monitor(location + 1, len(binary_message))
+                monitor(min([location, len(binary_message)]), len(binary_message))
+
+    telemetry.count(name="encode.nucleotides", value=len(dna_values))
+
+    if is_packed:
+        dna_sequence = PackedDNA.from_indices(dna_values)
+    else:
+        dna_sequence = "".join([nucleotides[value] for value in dna_values])
 
     if need_path:
-        record_path = array(record_path)
+        record_path = record_path[:len(dna_values)]
+        currents, values = record_path[:, 0].copy(), array(dna_values, dtype=int)
+        record_path[:, 0] = accessor[currents, values] if is_faster else currents
+        record_path[:, 1] = sum(accessor[currents] >= 0, axis=1) > 1
+        if compact_accessor is not None:
+            record_path[:, 0] = compact_accessor.to_original(record_path[:, 0])
 
     if vt_length > 0:
         vt_check = set_vt(dna_sequence=dna_sequence, vt_length=vt_length)
@@ -160,19 +350,20 @@ def encode(binary_message, accessor, start_index,
             return dna_sequence
 
 
+@profiled
 def decode(dna_sequence, bit_length, accessor, start_index,
-           is_faster=False, vt_check=None, shuffles=None, verbose=False):
+           is_faster=False, vt_check=None, shuffles=None, is_ranged=False, verbose=False):
     """
     Decode a DNA sequence by the specific accessor.
 
     :param dna_sequence: DNA sequence encoded by this graph.
-    :type dna_sequence: str
+    :type dna_sequence: str or dsw.operation.PackedDNA
 
     :param bit_length: length of the bit array.
     :type bit_length: int
 
-    :param accessor: accessor of the coding algorithm (consistent with the encoding process).
-    :type accessor: numpy.ndarray
+    :param accessor: (compiled or compact) accessor of the coding algorithm (consistent with the encoding process).
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
 
     :param start_index: virtual vertex to start decoding (consistent with the encoding process).
     :type start_index: int
@@ -186,6 +377,9 @@ def decode(dna_sequence, bit_length, accessor, start_index,
     :param shuffles: shuffle relationships for bit-nucleotide mapping.
     :type shuffles: numpy.ndarray
 
+    :param is_ranged: decode through the arithmetic coding with bounded precision.
+    :type is_ranged: bool
+
     :param verbose: need to print log.
     :type verbose: bool
 
@@ -195,11 +389,21 @@ def decode(dna_sequence, bit_length, accessor, start_index,
     :raise ValueError: if one or more errors are found.
 
     .. note::
-        If the parameter "is_faster" is set as True, the out-degree of coding digraph cannot contains 3.
+        If the parameter "is_faster" is set as True, the vertex with out-degree 4 (or 2) transcodes 2 (or 1) bits.
+        The vertices with out-degree 3 transcode 11 bits by a block of 7 trits (3^7 >= 2^11),
+        where the block starts at the first of these vertices and its trits are spread over the next ones.
+        If the binary message is exhausted before the last block is completed,
+        the remaining trits are transcoded as a mixed radix number through the following vertices.
+
+        If the parameter "is_ranged" is set as True, the binary message is the arithmetic code of the DNA sequence,
+        where the symbol of each vertex is uniformly distributed over its out-degree.
+
+        If the accessor is compiled with the shuffles ("CompiledAccessor(accessor, shuffles)"),
+        the parameter "shuffles" can be omitted and the bit-nucleotide mapping is looked up from the compiled tables.
 
     Example
         >>> from numpy import array
-        >>> from dsw import decode
+        >>> from dsw import decode, PackedDNA
         >>> # accessor with GC-balanced
         >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
                               [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
@@ -217,37 +421,117 @@ def decode(dna_sequence, bit_length, accessor, start_index,
                               [2, 3, 1, 0], [2, 0, 3, 1], [0, 1, 3, 2], [0, 3, 2, 1]])
         >>> decode(accessor=accessor, dna_sequence="TCTCTCT", start_index=1, shuffles=shuffles, bit_length=8)
         array([0, 0, 0, 0, 0, 0, 0, 0])
+
+        >>> decode(accessor=accessor, dna_sequence="AGAGAGAG", start_index=1, bit_length=8, is_ranged=True)
+        array([0, 1, 0, 1, 0, 1, 0, 1])
+        >>> decode(accessor=accessor, dna_sequence=PackedDNA("TCTCTCT"), start_index=1, bit_length=8)
+        array([0, 1, 0, 1, 0, 1, 0, 1])
     """
-    vertex_index, nucleotides, monitor = start_index, "ACGT", Monitor()
+    vertex_index, monitor = start_index, Monitor()
 
     if vt_check is not None:
         if vt_check != set_vt(dna_sequence=dna_sequence, vt_length=len(vt_check)):
             raise ValueError("At least one error is found in this DNA sequence!")
 
-    if not is_faster:
-        quotient, saved_values = "0", []
+    nucleotide_indices = PackedDNA(dna_sequence).indices().tolist()
+    telemetry.count(name="decode.nucleotides", value=len(nucleotide_indices))
+
+    if isinstance(accessor, CompactAccessor):  # walk through the compact indices.
+        vertex_index = accessor.to_compact(start_index)
+        if shuffles is not None:
+            shuffles = accessor.select(shuffles)
+        accessor = accessor.latters
+
+    if isinstance(accessor, CompiledAccessor):
+        if not accessor.compatible(shuffles):
+            raise ValueError("The shuffles are inconsistent with the shuffles of the compiled accessor!")
+        # the shuffles have been folded into the compiled tables.
+        out_degrees, used_table, rank_table = accessor.out_degrees, accessor.shuffled_indices, accessor.shuffled_ranks
+        accessor, shuffles = accessor.accessor, None
+    else:
+        out_degrees, used_table, rank_table = None, None, None
 
-        for location, nucleotide in enumerate(dna_sequence):
-            used_indices = where(accessor[vertex_index] >= 0)[0]
+    if is_faster and is_ranged:
+        raise ValueError("The parameters \"is_faster\" and \"is_ranged\" cannot be set as True together!")
 
-            if len(used_indices) > 1:  # current vertex contains information.
-                used_nucleotides = [nucleotides[used_index] for used_index in used_indices]
+    if is_ranged:
+        # interval [low, high] of the arithmetic code.
+        low, high, half, quarter = 0, 2 ** 32 - 1, 2 ** 31, 2 ** 30
+        determined_bits, pending_number = [], 0
 
-                if nucleotide in used_nucleotides:  # check whether the DNA sequence is right currently.
-                    remainder = used_nucleotides.index(nucleotide)
-                else:
+        for location, nucleotide_index in enumerate(nucleotide_indices):
+            if rank_table is not None:
+                radix, used_indices = out_degrees[vertex_index], used_table[vertex_index]
+                remainder = rank_table[vertex_index, nucleotide_index]
+            else:
+                used_indices = where(accessor[vertex_index] >= 0)[0]
+                radix = len(used_indices)
+                remainder = int(sum(used_indices < nucleotide_index)) if nucleotide_index in used_indices else -1
+
+            if remainder < 0:  # check whether the DNA sequence is right currently.
+                raise ValueError("At least one error is found in this DNA sequence!")
+
+            if radix > 1:  # current vertex contains information.
+                if shuffles is not None:  # shuffle remainder based on the inputted shuffles.
+                    remainder = where(argsort(shuffles[vertex_index, used_indices[:radix]]) == remainder)[0][0]
+
+                step = (high - low + 1) // int(radix)
+                if remainder < radix - 1:  # the last symbol takes the rest interval.
+                    high = low + (int(remainder) + 1) * step - 1
+                low += int(remainder) * step
+
+                while True:
+                    if high < half:
+                        offset = 0
+                        determined_bits += [0] + [1] * pending_number
+                        pending_number = 0
+                    elif low >= half:
+                        offset = half
+                        determined_bits += [1] + [0] * pending_number
+                        pending_number = 0
+                    elif low >= quarter and high < half + quarter:
+                        offset, pending_number = quarter, pending_number + 1
+                    else:
+                        break
+
+                    low, high = (low - offset) * 2, (high - offset) * 2 + 1
+
+            vertex_index = accessor[vertex_index, nucleotide_index]
+
+            if verbose:
+                monitor(location + 1, len(dna_sequence))
+
+        if len(determined_bits) < bit_length:  # the DNA sequence is too short.
+            raise ValueError("At least one error is found in this DNA sequence!")
+
+        binary_message = array(determined_bits[:bit_length], dtype=int)
+
+    elif not is_faster:
+        saved_digits, saved_radices = [], []
+
+        for location, nucleotide_index in enumerate(nucleotide_indices):
+            if rank_table is not None:
+                radix, used_indices = out_degrees[vertex_index], used_table[vertex_index]
+                remainder = rank_table[vertex_index, nucleotide_index]
+            else:
+                used_indices = where(accessor[vertex_index] >= 0)[0]
+                radix = len(used_indices)
+                remainder = int(sum(used_indices < nucleotide_index)) if nucleotide_index in used_indices else -1
+
+            if radix > 1:  # current vertex contains information.
+                if remainder < 0:  # check whether the DNA sequence is right currently.
                     raise ValueError("At least one error is found in this DNA sequence!")
 
                 if shuffles is not None:  # shuffle remainder based on the inputted shuffles.
-                    remainder = where(argsort(shuffles[vertex_index, used_indices]) == remainder)[0][0]
+                    remainder = where(argsort(shuffles[vertex_index, used_indices[:radix]]) == remainder)[0][0]
 
-                saved_values.append((len(used_indices), remainder))
-                vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+                saved_digits.append(int(remainder))
+                saved_radices.append(int(radix))
+                vertex_index = accessor[vertex_index, nucleotide_index]
 
-            elif len(used_indices) == 1:  # current vertex does not contain information.
-                used_nucleotide = nucleotides[used_indices[0]]
-                if nucleotide == used_nucleotide:
-                    vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+            elif radix == 1:  # current vertex does not contain information.
+                if remainder == 0:
+                    vertex_index = accessor[vertex_index, nucleotide_index]
                 else:
                     raise ValueError("At least one error is found in this DNA sequence!")
 
@@ -258,54 +542,657 @@ def decode(dna_sequence, bit_length, accessor, start_index,
             if verbose:
                 monitor(location + 1, len(dna_sequence))
 
-        for location, (out_degree, number) in enumerate(saved_values[::-1]):
-            quotient = calculus_multiplication(number=quotient, base=str(out_degree))
-            quotient = calculus_addition(number=quotient, base=str(number))
+        quotient = digit_to_number(digits=saved_digits, radices=saved_radices)
 
         binary_message = array(number_to_bit(decimal_number=quotient, bit_length=bit_length), dtype=int)
 
     else:
-        message_location, binary_message = 0, zeros(shape=(bit_length,), dtype=int)
+        # radix-3 vertices transcode 11 bits by a block of 7 trits (3^7 >= 2^11).
+        location, padded_message = 0, zeros(shape=(bit_length + 11,), dtype=int)
+        block_location, block_value, block_scale, trit_number = 0, 0, 1, 0
+        saved_digits, saved_radices = [], []  # the remaining trits of the last block.
+
+        def write_block(value):
+            bit_number = min([11, bit_length - block_location])
+            if value >= 2 ** bit_number:  # the trits cannot be created by any bit block.
+                raise ValueError("At least one error is found in this DNA sequence!")
 
-        for location, nucleotide in enumerate(dna_sequence):
-            used_indices = where(accessor[vertex_index] >= 0)[0]
-            radix = len(used_indices)
+            padded_message[block_location: block_location + bit_number] = number_to_bit(value, bit_number)
 
-            used_nucleotides = [nucleotides[used_index] for used_index in used_indices]
-            if nucleotide in used_nucleotides:  # check whether the DNA sequence is right currently.
-                remainder = used_nucleotides.index(nucleotide)
+        for nucleotide_index in nucleotide_indices:
+            if rank_table is not None:
+                radix, used_indices = out_degrees[vertex_index], used_table[vertex_index]
+                remainder = rank_table[vertex_index, nucleotide_index]
             else:
+                used_indices = where(accessor[vertex_index] >= 0)[0]
+                radix = len(used_indices)
+                remainder = int(sum(used_indices < nucleotide_index)) if nucleotide_index in used_indices else -1
+
+            if remainder < 0:  # check whether the DNA sequence is right currently.
                 raise ValueError("At least one error is found in this DNA sequence!")
 
             if shuffles is not None:  # shuffle remainder based on the inputted shuffles.
-                remainder = where(argsort(shuffles[vertex_index, used_indices]) == remainder)[0][0]
+                remainder = where(argsort(shuffles[vertex_index, used_indices[:radix]]) == remainder)[0][0]
 
-            vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+            vertex_index = accessor[vertex_index, nucleotide_index]
 
-            if radix == 4:
-                binary_message[message_location] = remainder // 2
-                binary_message[message_location + 1] = remainder % 2
-                message_location += 2
+            if location >= bit_length:
+                if trit_number == 0:  # no information is left.
+                    raise ValueError("At least one error is found in this DNA sequence!")
+                saved_digits.append(int(remainder))
+                saved_radices.append(int(radix))
+            elif radix == 4:
+                padded_message[location] = remainder // 2
+                padded_message[location + 1] = remainder % 2
+                location += 2
             elif radix == 2:
-                binary_message[message_location] = remainder % 2
-                message_location += 1
-            elif radix == 1:
-                pass  # do nothing.
+                padded_message[location] = remainder % 2
+                location += 1
             elif radix == 3:
-                raise ValueError("Not implementation!")
-            else:
-                raise ValueError("Current vertex doesn't have an out-degree, "
-                                 + "the accessor, the start vertex, or DNA sequence is wrong!")
+                if trit_number == 0:  # start a new block.
+                    block_location, block_value, block_scale = location, 0, 1
+                    location, trit_number = location + min([11, bit_length - location]), 7
+
+                block_value += int(remainder) * block_scale
+                block_scale, trit_number = block_scale * 3, trit_number - 1
+
+                if trit_number == 0:
+                    write_block(block_value)
+
+        if trit_number > 0:  # the last block.
+            write_block(block_value + digit_to_number(digits=saved_digits, radices=saved_radices) * block_scale)
+
+        binary_message = padded_message[:bit_length]
 
     return binary_message
 
 
+def encode_batch(matrix, accessor, start_indices, shuffles=None, need_path=False, path_buffer=None, verbose=False):
+    """
+    Encode a bit matrix (one binary message per row) by the specific accessor in the faster way.
+
+    :param matrix: bit matrix, each row of which is a binary message.
+    :type matrix: numpy.ndarray
+
+    :param accessor: (compiled or compact) accessor of the coding algorithm.
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
+
+    :param start_indices: virtual vertex (or vertices for each row) to start encoding.
+    :type start_indices: int or numpy.ndarray
+
+    :param shuffles: shuffle relationships for bit-nucleotide mapping.
+    :type shuffles: numpy.ndarray or None
+
+    :param need_path: need to record the restricted state transition path of each row.
+    :type need_path: bool
+
+    :param path_buffer: preallocated integer tensor (row number x N x 2) to record the paths into if "need_path".
+    :type path_buffer: numpy.ndarray or None
+
+    :param verbose: need to print log.
+    :type verbose: bool
+
+    :return: nucleotide matrix (0, 1, 2, and 3 refer to "A", "C", "G", and "T", -1 refers to no nucleotide)
+             and the length of DNA sequence in each row (and the path tensor if required).
+    :rtype: (numpy.ndarray, numpy.ndarray) or (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+
+    Example
+        >>> from numpy import array
+        >>> from dsw import encode_batch
+        >>> # accessor with GC-balanced
+        >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+        >>> matrix = array([[0, 1, 0, 1, 0, 1, 0, 1], [1, 1, 1, 1, 0, 0, 0, 0]])
+        >>> dna_matrix, lengths = encode_batch(matrix=matrix, accessor=accessor, start_indices=1)
+        >>> dna_matrix
+        array([[0, 2, 0, 2, 0, 2, 0, 2],
+               [3, 2, 3, 2, 0, 1, 0, 1]], dtype=int8)
+        >>> lengths
+        array([8, 8])
+        >>> ["".join("ACGT"[value] for value in row[:length]) for row, length in zip(dna_matrix, lengths)]
+        ['AGAGAGAG', 'TGTGACAC']
+        >>> _, _, paths = encode_batch(matrix=matrix, accessor=accessor, start_indices=1, need_path=True)
+        >>> paths[:, :3]
+        array([[[ 4,  1],
+                [ 2,  1],
+                [ 8,  1]],
+        <BLANKLINE>
+               [[ 7,  1],
+                [14,  1],
+                [11,  1]]])
+
+    .. note::
+        All the binary messages are walked through the accessor together,
+        which is equivalent to call "encode" (is_faster=True) for each row.
+
+        The shuffles (if any) are compiled together with the accessor.
+        If a vertex with out-degree 4 is reached when only one bit remains, the missing bit is regarded as 0.
+
+        The path of each row is the same as the one of "encode" (is_faster=True, need_path=True),
+        and the rows after the end of its DNA sequence are filled with -1.
+        If the parameter "path_buffer" is given, the paths are written into its first columns (a view is returned).
+    """
+    if not isinstance(accessor, CompiledAccessor):
+        accessor = CompiledAccessor(accessor=accessor, shuffles=shuffles)
+    elif not accessor.compatible(shuffles):
+        raise ValueError("The shuffles are inconsistent with the shuffles of the compiled accessor!")
+
+    out_degrees, used_table, latters = accessor.out_degrees, accessor.shuffled_indices, accessor.accessor
+
+    matrix, monitor = array(matrix, dtype=int), Monitor()
+    row_number, bit_length = matrix.shape
+    padded_matrix = zeros(shape=(row_number, bit_length + 11), dtype=int)  # avoid reading outside the message.
+    padded_matrix[:, :bit_length] = matrix
+
+    vertex_indices = zeros(shape=(row_number,), dtype=int) + start_indices
+    locations, lengths = zeros(shape=(row_number,), dtype=int), zeros(shape=(row_number,), dtype=int)
+    block_values, trit_numbers = zeros(shape=(row_number,), dtype=int), zeros(shape=(row_number,), dtype=int)
+    columns, path_columns, rows = [], [], where(locations < bit_length)[0]
+
+    while len(rows) > 0:
+        currents = vertex_indices[rows]
+        radices = out_degrees[currents]
+
+        if any(radices == 0):
+            raise ValueError("Current vertex doesn't have an out-degree, "
+                             + "the accessor or the start vertex is wrong!")
+
+        flushes = locations[rows] >= bit_length  # flush the remaining trits of the last block.
+        first_bits = padded_matrix[rows, locations[rows]]
+        second_bits = padded_matrix[rows, locations[rows] + 1]
+        remainders = where(radices == 4, first_bits * 2 + second_bits, where(radices == 2, first_bits, 0))
+        locations[rows] += where(flushes, 0, where(radices == 4, 2, where(radices == 2, 1, 0)))
+
+        starts = rows[(radices == 3) & (~flushes) & (trit_numbers[rows] == 0)]  # start new blocks.
+        if len(starts) > 0:
+            bit_numbers = minimum(11, bit_length - locations[starts])
+            windows = padded_matrix[starts[:, None], locations[starts][:, None] + arange(11)]
+            block_values[starts] = sum(windows * 2 ** arange(10, -1, -1), axis=1) >> (11 - bit_numbers)
+            locations[starts] += bit_numbers
+            trit_numbers[starts] = 7
+
+        chosen = flushes | (radices == 3)
+        divisors = where(flushes, radices, 3)[chosen]
+        remainders[chosen] = block_values[rows[chosen]] % divisors
+        block_values[rows[chosen]] //= divisors
+        trit_numbers[rows[(~flushes) & (radices == 3)]] -= 1
+
+        values = used_table[currents, remainders]
+
+        column = -ones(shape=(row_number,), dtype=int8)
+        column[rows] = values
+        columns.append(column)
+
+        vertex_indices[rows] = latters[currents, values]
+
+        if need_path:
+            path_column = -ones(shape=(row_number, 2), dtype=int)
+            path_column[rows, 0], path_column[rows, 1] = vertex_indices[rows], radices > 1
+            path_columns.append(path_column)
+        lengths[rows] += 1
+        rows = rows[(locations[rows] < bit_length) | ((trit_numbers[rows] > 0) & (block_values[rows] > 0))]
+
+        if verbose:
+            monitor(row_number - len(rows), row_number)
+
+    if len(columns) > 0:
+        dna_matrix = stack(columns, axis=1)
+    else:
+        dna_matrix = -ones(shape=(row_number, 0), dtype=int8)
+
+    if need_path:
+        if path_buffer is None:
+            paths = zeros(shape=(row_number, len(path_columns), 2), dtype=int)
+        elif path_buffer.ndim != 3 or path_buffer.shape[0] != row_number or path_buffer.shape[2] != 2 \
+                or path_buffer.shape[1] < len(path_columns):
+            raise ValueError("The path buffer should be a tensor with a matrix per row and enough rows per matrix!")
+        else:
+            paths = path_buffer[:, :len(path_columns)]
+
+        for location, path_column in enumerate(path_columns):
+            paths[:, location] = path_column
+
+        return dna_matrix, lengths, paths
+
+    return dna_matrix, lengths
+
+
+def decode_batch(dna_matrix, lengths, accessor, start_indices, bit_length, shuffles=None, verbose=False):
+    """
+    Decode a nucleotide matrix (one DNA sequence per row) by the specific accessor in the faster way.
+
+    :param dna_matrix: nucleotide matrix (0, 1, 2, and 3 refer to "A", "C", "G", and "T").
+    :type dna_matrix: numpy.ndarray
+
+    :param lengths: length of DNA sequence in each row.
+    :type lengths: numpy.ndarray
+
+    :param accessor: (compiled or compact) accessor of the coding algorithm (consistent with the encoding process).
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
+
+    :param start_indices: virtual vertex (or vertices for each row) to start decoding.
+    :type start_indices: int or numpy.ndarray
+
+    :param bit_length: length of the bit array.
+    :type bit_length: int
+
+    :param shuffles: shuffle relationships for bit-nucleotide mapping (consistent with the encoding process).
+    :type shuffles: numpy.ndarray or None
+
+    :param verbose: need to print log.
+    :type verbose: bool
+
+    :return: bit matrix decoded by this graph and error mask (True refers to the row leaving the graph).
+    :rtype: (numpy.ndarray, numpy.ndarray)
+
+    Example
+        >>> from numpy import array
+        >>> from dsw import decode_batch
+        >>> # accessor with GC-balanced
+        >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+        >>> dna_matrix = array([[0, 2, 0, 2, 0, 2, 0, 2], [3, 2, 3, 2, 0, 1, 0, 1], [3, 2, 3, 3, 0, 1, 0, 1]])
+        >>> matrix, errors = decode_batch(dna_matrix=dna_matrix, lengths=array([8, 8, 8]), accessor=accessor, \
+                                          start_indices=1, bit_length=8)
+        >>> matrix
+        array([[0, 1, 0, 1, 0, 1, 0, 1],
+               [1, 1, 1, 1, 0, 0, 0, 0],
+               [0, 0, 0, 0, 0, 0, 0, 0]])
+        >>> errors
+        array([False, False,  True])
+
+    .. note::
+        All the DNA sequences are walked through the accessor together,
+        which is equivalent to call "decode" (is_faster=True) for each row.
+        Instead of raising an error, the row leaving the graph is marked in the error mask and its bits are set to 0.
+    """
+    if not isinstance(accessor, CompiledAccessor):
+        accessor = CompiledAccessor(accessor=accessor, shuffles=shuffles)
+    elif not accessor.compatible(shuffles):
+        raise ValueError("The shuffles are inconsistent with the shuffles of the compiled accessor!")
+
+    out_degrees, rank_table, latters = accessor.out_degrees, accessor.shuffled_ranks, accessor.accessor
+
+    dna_matrix, lengths, monitor = array(dna_matrix, dtype=int), array(lengths, dtype=int), Monitor()
+    row_number = len(dna_matrix)
+    padded_matrix = zeros(shape=(row_number, bit_length + 11), dtype=int)  # avoid writing outside the message.
+
+    vertex_indices = zeros(shape=(row_number,), dtype=int) + start_indices
+    locations, errors = zeros(shape=(row_number,), dtype=int), zeros(shape=(row_number,), dtype=bool)
+    block_locations, block_values = zeros(shape=(row_number,), dtype=int), zeros(shape=(row_number,), dtype=int)
+    block_scales, trit_numbers = ones(shape=(row_number,), dtype=int), zeros(shape=(row_number,), dtype=int)
+    flush_values, flush_scales = zeros(shape=(row_number,), dtype=int), ones(shape=(row_number,), dtype=int)
+    maximum_length = max(lengths) if row_number > 0 else 0
+
+    def write_blocks(block_rows, values):
+        bit_numbers = minimum(11, bit_length - block_locations[block_rows])
+        failed_blocks = values >= 2 ** bit_numbers  # the trits cannot be created by any bit block.
+        errors[block_rows[failed_blocks]] = True
+        for offset in range(11):
+            chosen_blocks = offset < bit_numbers
+            bits = (values[chosen_blocks] >> (bit_numbers[chosen_blocks] - 1 - offset)) % 2
+            padded_matrix[block_rows[chosen_blocks], block_locations[block_rows[chosen_blocks]] + offset] = bits
+
+    for position in range(maximum_length):
+        rows = where((lengths > position) & (~errors))[0]
+        currents, nucleotides = vertex_indices[rows], dna_matrix[rows, position]
+        radices = out_degrees[currents]
+        remainders = where(nucleotides >= 0, rank_table[currents, nucleotides % 4], -1)
+        flushes = locations[rows] >= bit_length  # the remaining trits of the last block.
+
+        failed = remainders < 0  # the DNA sequence leaves the graph.
+        failed |= flushes & ((trit_numbers[rows] == 0) | (flush_scales[rows] > 4 ** 11))  # no information is left.
+        errors[rows[failed]] = True
+        rows, currents, nucleotides = rows[~failed], currents[~failed], nucleotides[~failed]
+        radices, remainders, flushes = radices[~failed], remainders[~failed], flushes[~failed]
+
+        flush_values[rows[flushes]] += remainders[flushes] * flush_scales[rows[flushes]]
+        flush_scales[rows[flushes]] *= radices[flushes]
+
+        for radix, bit_number in [(4, 2), (2, 1)]:
+            chosen = (radices == radix) & (~flushes)
+            for offset in range(bit_number):
+                bits = (remainders[chosen] >> (bit_number - 1 - offset)) % 2
+                padded_matrix[rows[chosen], locations[rows[chosen]] + offset] = bits
+            locations[rows[chosen]] += bit_number
+
+        chosen = (radices == 3) & (~flushes)
+        starts = rows[chosen & (trit_numbers[rows] == 0)]  # start new blocks.
+        block_locations[starts], block_values[starts], block_scales[starts] = locations[starts], 0, 1
+        locations[starts] += minimum(11, bit_length - locations[starts])
+        trit_numbers[starts] = 7
+
+        block_values[rows[chosen]] += remainders[chosen] * block_scales[rows[chosen]]
+        block_scales[rows[chosen]] *= 3
+        trit_numbers[rows[chosen]] -= 1
+        completes = rows[chosen & (trit_numbers[rows] == 0)]
+        write_blocks(completes, block_values[completes])
+
+        vertex_indices[rows] = latters[currents, nucleotides]
+
+        if verbose:
+            monitor(position + 1, maximum_length)
+
+    completes = where((trit_numbers > 0) & (~errors))[0]  # the last blocks.
+    write_blocks(completes, block_values[completes] + flush_values[completes] * block_scales[completes])
+
+    padded_matrix[errors] = 0
+
+    return padded_matrix[:, :bit_length], errors
+
+
+def encode_parallel(matrix, accessor, start_indices, is_faster=False, shuffles=None, need_path=False,
+                    worker_number=None, task_size=None, verbose=False):
+    """
+    Encode a bit matrix (one binary message per row) by the specific accessor through a process pool.
+
+    :param matrix: bit matrix, each row of which is a binary message.
+    :type matrix: numpy.ndarray
+
+    :param accessor: (compiled or compact) accessor of the coding algorithm.
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
+
+    :param start_indices: virtual vertex (or vertices for each row) to start encoding.
+    :type start_indices: int or numpy.ndarray
+
+    :param is_faster: encode in a faster way.
+    :type is_faster: bool
+
+    :param shuffles: shuffle relationships for bit-nucleotide mapping.
+    :type shuffles: numpy.ndarray or None
+
+    :param need_path: need to record the restricted state transition path of each row.
+    :type need_path: bool
+
+    :param worker_number: number of worker processes (the number of CPUs if None).
+    :type worker_number: int or None
+
+    :param task_size: number of rows encoded by a worker per task (about 4 tasks per worker if None).
+    :type task_size: int or None
+
+    :param verbose: need to print log.
+    :type verbose: bool
+
+    :return: DNA sequences encoded by this graph, in the order of rows (and their paths if required).
+    :rtype: list or (list, list)
+
+    Example
+        >>> from numpy import array
+        >>> from dsw import encode_parallel
+        >>> # accessor with GC-balanced
+        >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+        >>> matrix = array([[0, 1, 0, 1, 0, 1, 0, 1], [1, 1, 1, 1, 0, 0, 0, 0]])
+        >>> encode_parallel(matrix=matrix, accessor=accessor, start_indices=1, worker_number=2)
+        ['TCTCTCT', 'ACACTGTG']
+
+    .. note::
+        The accessor is compiled once here, and its compiled tables, the bit matrix and the start vertices
+        are put into shared memory once, so that only the row ranges are sent to the workers
+        instead of pickling the accessor for every task.
+        Each worker wraps the shared tables when it starts, so the compiled tables are not copied into any worker.
+        The compact accessor is compiled through its equivalent accessor,
+        where the start vertices and the paths still use the vertex indices.
+
+        The result is equivalent to call "encode" for each row.
+    """
+    if not isinstance(accessor, CompiledAccessor):
+        accessor = CompiledAccessor(accessor=accessor, shuffles=shuffles)
+    elif not accessor.compatible(shuffles):
+        raise ValueError("The shuffles are inconsistent with the shuffles of the compiled accessor!")
+
+    matrix, monitor = array(matrix, dtype=uint8), Monitor()
+    start_indices = zeros(shape=(len(matrix),), dtype=int) + start_indices
+
+    if worker_number is None:
+        worker_number = cpu_count()
+
+    if task_size is None:
+        task_size = max([1, (len(matrix) + 4 * worker_number - 1) // (4 * worker_number)])
+
+    memories, blocks = [], []
+    try:
+        for data in _obtain_compiled_tables(accessor) + [matrix, start_indices]:
+            if data is None:
+                blocks.append(None)
+            else:
+                memory = SharedMemory(create=True, size=max([1, data.nbytes]))
+                ndarray(shape=data.shape, dtype=data.dtype, buffer=memory.buf)[:] = data
+                memories.append(memory)
+                blocks.append((memory.name, data.shape, data.dtype.str))
+
+        row_ranges = [(location, min([location + task_size, len(matrix)]))
+                      for location in range(0, len(matrix), task_size)]
+
+        dna_sequences, paths = [], []
+        with Pool(processes=worker_number, initializer=_initialize_worker,
+                  initargs=(blocks, isinstance(accessor.accessor, MaskAccessor), is_faster, need_path)) as pool:
+            for task_sequences in pool.imap(_encode_rows, row_ranges):
+                if need_path:
+                    task_sequences, task_paths = zip(*task_sequences)
+                    paths += list(task_paths)
+                dna_sequences += list(task_sequences)
+
+                if verbose:
+                    monitor(len(dna_sequences), len(matrix))
+
+    finally:
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+
+    if need_path:
+        return dna_sequences, paths
+
+    return dna_sequences
+
+
+def _obtain_compiled_tables(accessor):
+    # the tables of the compiled accessor, where the mask accessor is shared by its masks,
+    # and the shuffled tables are omitted if they are the same as the unshuffled ones.
+    graph = accessor.accessor.masks if isinstance(accessor.accessor, MaskAccessor) else accessor.accessor
+
+    tables = [graph, accessor.out_degrees, accessor.used_indices, accessor.ranks]
+    if accessor.shuffles is None:
+        return tables + [None, None, None]
+
+    return tables + [accessor.shuffled_indices, accessor.shuffled_ranks, accessor.shuffles]
+
+
+def _wrap_compiled_tables(tables, is_masked):
+    # wrap the (shared) tables as the compiled accessor without compiling it again.
+    graph, out_degrees, used_indices, ranks, shuffled_indices, shuffled_ranks, shuffles = tables
+    if is_masked:
+        mask_accessor = MaskAccessor.__new__(MaskAccessor)
+        mask_accessor.vertex_number, mask_accessor.masks = len(out_degrees), graph
+        graph = mask_accessor
+
+    accessor = CompiledAccessor.__new__(CompiledAccessor)
+    accessor.accessor, accessor.shuffles = graph, shuffles
+    accessor.out_degrees, accessor.used_indices, accessor.ranks = out_degrees, used_indices, ranks
+    if shuffles is None:
+        accessor.shuffled_indices, accessor.shuffled_ranks = used_indices, ranks
+    else:
+        accessor.shuffled_indices, accessor.shuffled_ranks = shuffled_indices, shuffled_ranks
+
+    return accessor
+
+
+def _initialize_worker(blocks, is_masked, is_faster, need_path):
+    # attach the shared memory blocks and wrap the compiled tables in this worker.
+    data_group = []
+    for block in blocks:
+        if block is None:
+            data_group.append(None)
+        else:
+            memory = SharedMemory(name=block[0])
+            _worker_state.setdefault("memories", []).append(memory)
+            data_group.append(ndarray(shape=block[1], dtype=block[2], buffer=memory.buf))
+
+    _worker_state["accessor"] = _wrap_compiled_tables(tables=data_group[:-2], is_masked=is_masked)
+    _worker_state["matrix"], _worker_state["start_indices"] = data_group[-2], data_group[-1]
+    _worker_state["is_faster"], _worker_state["need_path"] = is_faster, need_path
+
+
+def _encode_rows(row_range):
+    # encode the rows in [start, stop) through the compiled accessor shared with this worker.
+    accessor, matrix, start_indices = _worker_state["accessor"], _worker_state["matrix"], _worker_state["start_indices"]
+
+    return [encode(binary_message=matrix[index].astype(int), accessor=accessor, start_index=int(start_indices[index]),
+                   is_faster=_worker_state["is_faster"], need_path=_worker_state["need_path"])
+            for index in range(*row_range)]
+
+
+def _initialize_screener(memory_name, vertex_number, observed_length, bio_filter):
+    # attach the shared bitmap and keep the bio-filter in this worker.
+    memory = SharedMemory(name=memory_name)
+    _worker_state.setdefault("memories", []).append(memory)
+    _worker_state["vertices"] = ndarray(shape=(vertex_number,), dtype=bool, buffer=memory.buf)
+    _worker_state["observed_length"], _worker_state["bio_filter"] = observed_length, bio_filter
+
+
+def _screen_vertices(chunk_range):
+    # screen the vertices in [start, stop) and write the judgements into the shared bitmap.
+    vertices, chunk_start, chunk_stop = _worker_state["vertices"], chunk_range[0], chunk_range[1]
+    digit_matrix = vertices_to_digits(vertex_indices=arange(chunk_start, chunk_stop),
+                                      observed_length=_worker_state["observed_length"])
+    vertices[chunk_start: chunk_stop] = _worker_state["bio_filter"].valid_batch(digit_matrix=digit_matrix)
+
+    return chunk_stop - chunk_start, int(sum(vertices[chunk_start: chunk_stop]))
+
+
+_worker_state = {}
+
+
+def encode_file(file_path, fasta_path, accessor, start_index, segment_length, index_length=None,
+                is_faster=False, shuffles=None, chunk_size=1048576, verbose=False):
+    """
+    Encode a binary file into a FASTA file segment by segment, without holding the whole file in memory.
+
+    :param file_path: path of the binary file to be encoded.
+    :type file_path: str
+
+    :param fasta_path: path of the FASTA file to save the DNA sequences.
+    :type fasta_path: str
+
+    :param accessor: (compiled or compact) accessor of the coding algorithm.
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
+
+    :param start_index: virtual vertex to start encoding.
+    :type start_index: int
+
+    :param segment_length: bit length of the payload in each DNA sequence.
+    :type segment_length: int
+
+    :param index_length: bit length of the address field (the minimum required length if None).
+    :type index_length: int or None
+
+    :param is_faster: encode in a faster way.
+    :type is_faster: bool
+
+    :param shuffles: shuffle relationships for bit-nucleotide mapping.
+    :type shuffles: numpy.ndarray or None
+
+    :param chunk_size: number of bytes read from the binary file at a time.
+    :type chunk_size: int
+
+    :param verbose: need to print log.
+    :type verbose: bool
+
+    :return: number of segments and bit length of the address field.
+    :rtype: (int, int)
+
+    Example
+        >>> from os import path
+        >>> from tempfile import TemporaryDirectory
+        >>> from numpy import array
+        >>> from dsw import encode_file
+        >>> # accessor with GC-balanced
+        >>> accessor = array([[-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1,  1,  2, -1], [-1, -1, -1, -1], [-1, -1, -1, -1], [-1, 13, 14, -1], \
+                              [-1, -1, -1, -1], [ 4, -1, -1,  7], [ 8, -1, -1, 11], [-1, -1, -1, -1]])
+        >>> with TemporaryDirectory() as folder:
+        ...     with open(path.join(folder, "message.bin"), "wb") as file:
+        ...         _ = file.write(bytes([85, 240, 15]))
+        ...     encode_file(file_path=path.join(folder, "message.bin"), fasta_path=path.join(folder, "message.fasta"), \
+                            accessor=accessor, start_index=1, segment_length=8, is_faster=True)
+        ...     with open(path.join(folder, "message.fasta"), "r") as file:
+        ...         print(file.read(), end="")
+        (3, 2)
+        >0
+        ACAGAGAGAG
+        >1
+        AGTGTGACAC
+        >2
+        TCACACTGTG
+
+    .. note::
+        The binary file is read in chunks and each DNA sequence is written once it is encoded,
+        so the memory usage is bounded by the chunk size rather than the file size.
+
+        Each binary message is the address field (the index of segment, the most significant bit first)
+        followed by the payload, so its bit length is "index_length" + "segment_length".
+        The last payload is padded with 0 to "segment_length",
+        which can be removed through the size of the binary file (8 * file size bits in total).
+
+        Each record of the FASTA file is named by the index of segment.
+    """
+    total_length = getsize(file_path) * 8
+    segment_number = (total_length + segment_length - 1) // segment_length
+
+    if index_length is None:
+        index_length = (segment_number - 1).bit_length() if segment_number > 1 else 1
+    elif segment_number > 2 ** index_length:
+        raise ValueError("The parameter \"index_length\" is too short to address "
+                         + str(segment_number) + " segments!")
+
+    if not isinstance(accessor, CompiledAccessor):
+        accessor = CompiledAccessor(accessor=accessor, shuffles=shuffles)
+    elif not accessor.compatible(shuffles):
+        raise ValueError("The shuffles are inconsistent with the shuffles of the compiled accessor!")
+
+    monitor, index_bits = Monitor(), 2 ** arange(index_length - 1, -1, -1)
+    segment_index, rest_bits = 0, zeros(shape=(0,), dtype=uint8)
+
+    with open(file_path, "rb") as binary_file, open(fasta_path, "w") as fasta_file:
+        while segment_index < segment_number:
+            chunk = binary_file.read(chunk_size)
+            if len(chunk) > 0:
+                rest_bits = concatenate((rest_bits, unpackbits(frombuffer(chunk, dtype=uint8))))
+            else:  # pad the last payload.
+                rest_bits = concatenate((rest_bits, zeros(shape=(segment_length - len(rest_bits),), dtype=uint8)))
+
+            for location in range(0, len(rest_bits) - segment_length + 1, segment_length):
+                binary_message = zeros(shape=(index_length + segment_length,), dtype=int)
+                binary_message[:index_length] = (segment_index // index_bits) % 2
+                binary_message[index_length:] = rest_bits[location: location + segment_length]
+
+                dna_sequence = encode(binary_message=binary_message, accessor=accessor, start_index=start_index,
+                                      is_faster=is_faster)
+                fasta_file.write(">" + str(segment_index) + "\n" + dna_sequence + "\n")
+                segment_index += 1
+
+                if verbose:
+                    monitor(segment_index, segment_number)
+
+            rest_bits = rest_bits[len(rest_bits) - len(rest_bits) % segment_length:]
+
+    return segment_number, index_length
+
+
 def set_vt(dna_sequence, vt_length):
     """
     Set Varshamov-Tenengolts-based path check string ('salt-protected') from DNA (payload) sequence.
 
     :param dna_sequence: DNA sequence encoded through SPIDER-WEB.
-    :type dna_sequence: str
+    :type dna_sequence: str or dsw.operation.PackedDNA
 
     :param vt_length: length of DNA sequence (path check).
     :type vt_length: int or None
@@ -330,22 +1217,23 @@ def set_vt(dna_sequence, vt_length):
     """
     nucleotides = "ACGT"
 
-    values = array([nucleotides.index(nucleotide) for nucleotide in dna_sequence])
+    values = PackedDNA(dna_sequence).indices().astype(int)
     vt_value = sum(where((values[1:] - values[:-1]) > 0)[0]) % (len(nucleotides) ** (vt_length - 1))
     vt_flag = sum(values) % len(nucleotides)
 
     return nucleotides[vt_flag] + number_to_dna(decimal_number=int(vt_value), dna_length=vt_length - 1)
 
 
+@profiled
 def repair_dna(dna_sequence, accessor, start_index, observed_length, vt_check=None, has_indel=False, heap_size=1e3):
     """
     Repair the DNA sequence containing one (or more) errors.
 
     :param dna_sequence: DNA sequence waiting for recovery.
-    :type dna_sequence: str
+    :type dna_sequence: str or dsw.operation.PackedDNA
 
-    :param accessor: accessor of the coding algorithm.
-    :type accessor: numpy.ndarray
+    :param accessor: (compiled or compact) accessor of the coding algorithm.
+    :type accessor: numpy.ndarray or dsw.graphized.CompiledAccessor or dsw.graphized.CompactAccessor
 
     :param start_index: virtual vertex to start encoding.
     :type start_index: int
@@ -362,7 +1250,7 @@ def repair_dna(dna_sequence, accessor, start_index, observed_length, vt_check=No
     :param heap_size: maximum heap size.
     :type heap_size: int
 
-    :return: repaired DNA sequence set and additional information.
+    :return: repaired DNA sequence set (in the type of the inputted DNA sequence) and additional information.
     :rtype: (list, (bool, bool, int))
 
     Example
@@ -381,25 +1269,36 @@ def repair_dna(dna_sequence, accessor, start_index, observed_length, vt_check=No
                        vt_check=vt_check, has_indel=True)
         (['TCTCTCTCTCTC'], (1, True, 2, 14))
     """
-    nucleotides = "ACGT"
+    nucleotides, is_packed, original_sequence = "ACGT", isinstance(dna_sequence, PackedDNA), dna_sequence
+
+    if isinstance(accessor, CompiledAccessor):
+        accessor = accessor.accessor
+
+    compact_accessor = None
+    if isinstance(accessor, CompactAccessor):  # walk through the compact indices.
+        compact_accessor, start_index, accessor = accessor, accessor.to_compact(start_index), accessor.latters
+
+    dna_values, dna_sequence = PackedDNA(dna_sequence).indices().tolist(), str(dna_sequence)
 
     location, vertex_index, index_queue = 0, start_index, -ones(shape=(len(dna_sequence),), dtype=int)
     split_sequences, chuck_sequences, index_markers = [""], [], []
     detected_count, chuck_flag, visited_times = 0, False, 0
 
     while location < len(dna_sequence):
-        used_indices, nucleotide = where(accessor[vertex_index] >= 0)[0], dna_sequence[location]
-        if dna_sequence[location] in [nucleotides[used_index] for used_index in used_indices]:
-            split_sequences[-1] += nucleotide
-            vertex_index = accessor[vertex_index][nucleotides.index(nucleotide)]
+        latter_index = accessor[vertex_index, dna_values[location]]
+        if latter_index >= 0:
+            split_sequences[-1] += dna_sequence[location]
+            vertex_index = latter_index
             index_queue[location] = vertex_index
             visited_times += 1
             location += 1
         elif len(split_sequences[-1]) > 0:
             detected_count += 1
             split_sequences[-1] = split_sequences[-1][: - observed_length + 1]
-            vertex_index = dna_to_number(dna_sequence[location + 1: location + observed_length + 1], is_string=False)
+            vertex_index = int(digits_to_vertices([dna_values[location + 1: location + observed_length + 1]])[0])
             split_sequences.append(nucleotides[vertex_index % 4])
+            if compact_accessor is not None:
+                vertex_index = compact_accessor.to_compact(vertex_index)
             index_markers.append(index_queue[location - observed_length: location])
             chuck_sequences.append(dna_sequence[location - observed_length + 1: location + observed_length])
             location += observed_length + 1
@@ -415,6 +1314,9 @@ def repair_dna(dna_sequence, accessor, start_index, observed_length, vt_check=No
                     repaired_fragment_set[index].add(fragment)
         repaired_fragment_set[index] = list(repaired_fragment_set[index])
 
+    telemetry.count(name="repair_dna.nucleotides", value=len(dna_values))
+    telemetry.count(name="repair_dna.visited_times", value=visited_times)
+
     repaired_results, count = set(), 1
     for fragments in repaired_fragment_set:
         count *= len(fragments)
@@ -422,11 +1324,11 @@ def repair_dna(dna_sequence, accessor, start_index, observed_length, vt_check=No
     if count == 0 or count > heap_size:
         if vt_check is not None:
             if vt_check == set_vt(dna_sequence=dna_sequence, vt_length=len(vt_check)):
-                return [dna_sequence], (0, False, 0, visited_times)
+                return [original_sequence], (0, False, 0, visited_times)
             else:
                 return [], (0, True, 0, visited_times)
         else:
-            return [dna_sequence], (0, False, 0, visited_times)
+            return [original_sequence], (0, False, 0, visited_times)
 
     for fragments in product(*repaired_fragment_set):
         repaired_dna_sequence = ""
@@ -441,10 +1343,15 @@ def repair_dna(dna_sequence, accessor, start_index, observed_length, vt_check=No
         else:
             repaired_results.add(repaired_dna_sequence)
 
-    return sorted(list(repaired_results)), (detected_count, chuck_flag, count, visited_times)
+    repaired_results = sorted(list(repaired_results))
+    if is_packed:
+        repaired_results = [PackedDNA(repaired_dna_sequence) for repaired_dna_sequence in repaired_results]
+
+    return repaired_results, (detected_count, chuck_flag, count, visited_times)
 
 
-def find_vertices(observed_length, bio_filter, verbose=False):
+@profiled
+def find_vertices(observed_length, bio_filter, worker_number=1, verbose=False):
     """
     Find valid vertices based on the given the biochemical constraints.
 
@@ -454,6 +1361,9 @@ def find_vertices(observed_length, bio_filter, verbose=False):
     :param bio_filter: screening operation for identifying the valid DNA sequence (required the given constraints).
     :type bio_filter: dsw.biofilter.DefaultBioFilter
 
+    :param worker_number: number of worker processes (the number of CPUs if None).
+    :type worker_number: int or None
+
     :param verbose: need to print log.
     :type verbose: bool
 
@@ -471,28 +1381,68 @@ def find_vertices(observed_length, bio_filter, verbose=False):
 
     .. note::
         Reference [1] Florent Capelli and Yann Strozecki (2019) Discrete Applied Mathematics
+
+        The vertices are screened in chunks through "valid_batch" of the bio-filter,
+        which is vectorized for the local biochemical constraints.
+
+        For the user-defined bio-filter with the arbitrary "valid" (which cannot be vectorized),
+        the chunks could be screened by several worker processes ("worker_number" > 1).
+        The bio-filter is sent to each worker once, and the workers write their judgements into a shared bitmap.
+        Therefore, the bio-filter should be picklable.
     """
     nucleotides = "ACGT"
 
-    vertices, monitor = zeros(shape=(int(len(nucleotides) ** observed_length),), dtype=bool), Monitor()
+    vertex_number, monitor = int(len(nucleotides) ** observed_length), Monitor()
 
     if verbose:
-        print("Find valid vertices in this observed length of DNA sequence.")
+        telemetry.message("Find valid vertices in this observed length of DNA sequence.")
 
-    for vertex_index in range(len(vertices)):
-        dna_sequence = number_to_dna(decimal_number=vertex_index, dna_length=observed_length)
-        vertices[vertex_index] = bio_filter.valid(dna_sequence=dna_sequence)
+    if worker_number is None:
+        worker_number = cpu_count()
 
-        if verbose:
-            monitor(vertex_index + 1, len(vertices), extra={"valid": sum(vertices[: vertex_index + 1])})
+    chunk_size = 4 ** 8  # the vertices are screened chunk by chunk.
+    chunk_ranges = [(location, min([location + chunk_size, vertex_number]))
+                    for location in range(0, vertex_number, chunk_size)]
+
+    screened_number, valid_number = 0, 0
+    if worker_number > 1 and len(chunk_ranges) > 1:
+        memory = SharedMemory(create=True, size=vertex_number)
+        try:
+            with Pool(processes=min([worker_number, len(chunk_ranges)]), initializer=_initialize_screener,
+                      initargs=(memory.name, vertex_number, observed_length, bio_filter)) as pool:
+                for chunk_screened_number, chunk_valid_number in pool.imap_unordered(_screen_vertices, chunk_ranges):
+                    screened_number += chunk_screened_number
+                    valid_number += chunk_valid_number
+
+                    if verbose:
+                        monitor(screened_number, vertex_number, extra={"valid": valid_number})
+
+            vertices = ndarray(shape=(vertex_number,), dtype=bool, buffer=memory.buf).copy()
+
+        finally:
+            memory.close()
+            memory.unlink()
+
+    else:
+        vertices = zeros(shape=(vertex_number,), dtype=bool)
+        for chunk_start, chunk_stop in chunk_ranges:
+            chunk_indices = arange(chunk_start, chunk_stop)
+            digit_matrix = vertices_to_digits(vertex_indices=chunk_indices, observed_length=observed_length)
+            vertices[chunk_start: chunk_stop] = bio_filter.valid_batch(digit_matrix=digit_matrix)
+
+            if verbose:
+                valid_number += int(sum(vertices[chunk_start: chunk_stop]))
+                monitor(chunk_stop, vertex_number, extra={"valid": valid_number})
 
     valid_rate = sum(vertices) / len(vertices)
+    telemetry.count(name="find_vertices.vertices", value=len(vertices))
 
     if valid_rate == 0:
         raise ValueError("No vertex is collected!")
 
     if verbose:
-        print(str(round(valid_rate * 100, 2)) + "% (" + str(sum(vertices)) + ") valid vertices are collected.")
+        telemetry.message(str(round(valid_rate * 100, 2)) + "% (" + str(sum(vertices)) + ") "
+                          + "valid vertices are collected.")
 
     return vertices
 
@@ -539,38 +1489,34 @@ def connect_valid_graph(observed_length, vertices, verbose=False):
 
     .. note::
         Reference [1] Nicolaas Govert de Bruijn (1946) Indagationes Mathematicae
-    """
-    nucleotides = "ACGT"
 
+        The accessor is created by masking the complete accessor with the vertex bitmap as a whole,
+        i.e. the arcs from or to the invalid vertices are removed.
+    """
     if vertices is None:
         raise ValueError("No collected vertex!")
 
     if verbose:
-        print("Connect valid graph with valid vertices.")
+        telemetry.message("Connect valid graph with valid vertices.")
 
-    valid_rate, monitor = sum(vertices) / len(vertices), Monitor()
+    vertices = array(vertices) != 0
+    valid_rate = sum(vertices) / len(vertices)
 
     if valid_rate > 0:
-        accessor = -ones(shape=(int(len(nucleotides) ** observed_length), len(nucleotides)), dtype=int)
-
-        for vertex_index in range(int(len(nucleotides) ** observed_length)):
-            if vertices[vertex_index]:
-                latters = obtain_latters(current=vertex_index, observed_length=observed_length)
-                for position, latter_vertex_index in enumerate(latters):
-                    if vertices[latter_vertex_index]:
-                        accessor[vertex_index][position] = latter_vertex_index
-
-            if verbose:
-                monitor(vertex_index + 1, len(vertices))
+        # the latter vertices of the first 4 ^ (l - 1) vertices cover all the vertices in order.
+        accessor = where(vertices.reshape(-1, 4), arange(len(vertices)).reshape(-1, 4), -1)
+        accessor = tile(accessor, (4, 1))
+        accessor[~vertices] = -1
 
         if verbose:
-            print("Valid graph is created.")
+            telemetry.message("Valid graph is created.")
 
         return accessor
     else:
         raise ValueError("No collected vertex!")
 
 
+@profiled
 def connect_coding_graph(observed_length, vertices, threshold, verbose=False):
     """
     Connect a coding algorithm by valid vertices and the threshold for minimum out-degree.
@@ -619,80 +1565,93 @@ def connect_coding_graph(observed_length, vertices, threshold, verbose=False):
 
     .. note::
         Reference [1] Nicolaas Govert de Bruijn (1946) Indagationes Mathematicae
+
+        The vertices with insufficient out-degree are trimmed round by round.
+        The out-degrees are maintained incrementally: in each round,
+        only the former vertices of the vertices removed in the previous round are checked,
+        so the total work after the initial count is proportional to the number of the removed vertices.
+
+        If the threshold is 1, the degenerate cycles (each vertex in the cycle has only one latter vertex)
+        are found by the strongly connected components and removed, along with the vertices without latter vertex.
     """
-    times, nucleotides = 1, "ACGT"
+    vertices = array(vertices) != 0
+    quarter_number = len(vertices) // 4
 
+    # the out-degree of each vertex in the valid graph, the latter vertices repeat every 4 ^ (l - 1) vertices.
+    out_degrees = tile(sum(vertices.reshape(-1, 4), axis=1), 4)
+    removed_indices = where(vertices & (out_degrees < threshold))[0]
+    vertex_number = int(sum(vertices))
+
+    times = 1
     while True:
         if verbose:
-            print("Check the vertex collection requirement in round " + str(times) + ".")
+            telemetry.message("Check the vertex collection requirement in round " + str(times) + ".")
 
-        new_vertices, monitor = zeros(shape=(int(len(nucleotides) ** observed_length),), dtype=bool), Monitor()
-        saved_indices = where(vertices != 0)[0]
-        for current, vertex_index in enumerate(saved_indices):
-            latter_indices = obtain_latters(current=vertex_index, observed_length=observed_length)
-            new_vertices[vertex_index] = sum(vertices[latter_indices]) >= threshold
-
-            if verbose:
-                monitor(current + 1, len(saved_indices))
-
-        changed = sum(vertices) - sum(new_vertices)
+        vertices[removed_indices] = False
+        vertex_number -= len(removed_indices)
 
         if verbose:
-            print(str(round(sum(new_vertices) / len(vertices) * 100, 2)) + "% (" + str(sum(new_vertices)) + ") "
-                  + "valid vertices are saved.")
+            telemetry.message(str(round(vertex_number / len(vertices) * 100, 2)) + "% ("
+                              + str(vertex_number) + ") valid vertices are saved.")
 
-        if sum(new_vertices) < 1:
+        if vertex_number < 1:
             raise ValueError("No coding graph is created!")
 
-        if not changed:
+        if len(removed_indices) == 0:
             break
 
-        vertices = new_vertices
+        # only the former vertices of the removed vertices lose their out-degrees.
+        former_indices = ((removed_indices >> 2)[:, None] + arange(4)[None, :] * quarter_number).reshape(-1)
+        subtract.at(out_degrees, former_indices, 1)
+        former_indices = unique(former_indices)
+        removed_indices = former_indices[vertices[former_indices] & (out_degrees[former_indices] < threshold)]
         times += 1
 
-    valid_rate = sum(vertices) / len(vertices)
-    if valid_rate > 0:
-        accessor = -ones(shape=(int(len(nucleotides) ** observed_length), len(nucleotides)), dtype=int)
-        for vertex_index in range(int(len(nucleotides) ** observed_length)):
-            if vertices[vertex_index]:
-                latters = obtain_latters(current=vertex_index, observed_length=observed_length)
-                for position, latter_vertex_index in enumerate(latters):
-                    if vertices[latter_vertex_index]:
-                        accessor[vertex_index][position] = latter_vertex_index
+    telemetry.count(name="connect_coding_graph.rounds", value=times)
 
-            if verbose:
-                monitor(vertex_index + 1, len(vertices))
+    valid_rate = vertex_number / len(vertices)
+    if valid_rate > 0:
+        accessor = connect_valid_graph(observed_length=observed_length, vertices=vertices)
 
         if threshold == 1:
+            alive_flags = vertices.copy()
             while True:
-                vertices = obtain_vertices(accessor)
-                graph = DiGraph()
-                for former_index, latter_indices in enumerate(accessor):
-                    for latter_index in latter_indices:
-                        if latter_index >= 0:
-                            graph.add_edge(u_of_edge=former_index, v_of_edge=latter_index)
-                useless_vertices, cycle = [], find_cycle(graph)
-                for former_index, latter_index in cycle:
-                    if len(where(accessor[former_index] >= 0)[0]) == 1:
-                        useless_vertices.append(former_index)
-                if len(useless_vertices) == len(cycle):
-                    for useless_vertex in useless_vertices:
-                        accessor[useless_vertex] = -1
-                        pairs = [(i, useless_vertex) for i in obtain_formers(useless_vertex, 10)]
-                        while len(pairs) > 0:
-                            new_pairs = []
-                            for former_index, latter_index in pairs:
-                                previous = len(where(accessor[former_index] >= 0)[0])
-                                accessor[former_index, latter_index % 4] = -1
-                                current = len(where(accessor[former_index] >= 0)[0])
-                                if previous > current == 0:
-                                    new_pairs += [(i, former_index) for i in obtain_formers(former_index, 10)]
-                            pairs = new_pairs
-                else:
+                # the degenerate cycles, where each vertex has only one latter vertex, are found in the components
+                # of the graph that only keeps the arcs between the vertices with only one latter vertex.
+                single_flags = sum(accessor >= 0, axis=1) == 1
+                single_indices = where(single_flags)[0]
+                latter_indices = max(accessor[single_indices], axis=1)
+                chained = single_flags[latter_indices]
+                single_indices, latter_indices = single_indices[chained], latter_indices[chained]
+                single_accessor = -ones(shape=accessor.shape, dtype=int)
+                single_accessor[single_indices, latter_indices % 4] = latter_indices
+                labels = obtain_components(accessor=single_accessor, vertex_indices=single_indices)
+                sizes = bincount(labels[labels >= 0])
+                cycled = (sizes[labels[single_indices]] > 1) | (single_indices == latter_indices)
+                removed_indices = single_indices[cycled]
+
+                if verbose:
+                    telemetry.message(str(len(removed_indices)) + " vertices in the degenerate cycles are removed.")
+
+                if len(removed_indices) == 0:
                     break
 
+                # remove the vertices in the degenerate cycles and then the vertices without latter vertex.
+                while len(removed_indices) > 0:
+                    accessor[removed_indices] = -1
+                    alive_flags[removed_indices] = False
+                    former_indices = (removed_indices >> 2)[:, None] + arange(4)[None, :] * quarter_number
+                    accessor[former_indices, (removed_indices % 4)[:, None]] = -1
+                    former_indices = unique(former_indices)
+                    removed_indices = former_indices[alive_flags[former_indices]
+                                                     & (sum(accessor[former_indices] >= 0, axis=1) == 0)]
+
+            vertices = obtain_vertices(accessor)
+            if len(vertices) == 0:  # all the vertices are in (or lead to) the degenerate cycles.
+                raise ValueError("The coding graph cannot be created!")
+
         if verbose:
-            print("The coding graph is created.")
+            telemetry.message("The coding graph is created.")
 
         return vertices, accessor
     else:
@@ -771,9 +1730,10 @@ def remove_nasty_arc(accessor, latter_map, iteration=0, has_insertion=True, has_
 
     if verbose:
         if iteration > 0:
-            print("Calculate the intersection score for each remained arc in " + str(iteration) + " round(s).")
+            telemetry.message("Calculate the intersection score for each remained arc in "
+                              + str(iteration) + " round(s).")
         else:
-            print("Calculate the intersection score for each remained arc.")
+            telemetry.message("Calculate the intersection score for each remained arc.")
 
     scores = calculate_intersection_score(latter_map=latter_map, has_insertion=has_insertion, has_deletion=has_deletion,
                                           observed_length=observed_length, verbose=verbose)
@@ -795,11 +1755,11 @@ def remove_nasty_arc(accessor, latter_map, iteration=0, has_insertion=True, has_
     score_record = score_record[:, argsort(score_record[0])[::-1]]
 
     if verbose:
-        print("Current scores are:")
-        print(score_record)
-        print("Remove arc " + number_to_dna(int(former), dna_length=observed_length) + " -> "
-              + number_to_dna(int(latter), dna_length=observed_length)
-              + " with the maximum intersection score " + str(max(scores)) + ".")
+        telemetry.message("Current scores are:")
+        telemetry.message(str(score_record))
+        former_sequence, latter_sequence = vertices_to_dna([former, latter], observed_length=observed_length)
+        telemetry.message("Remove arc " + former_sequence + " -> " + latter_sequence
+                          + " with the maximum intersection score " + str(max(scores)) + ".")
 
     return accessor, latter_map, (former, latter), scores
 
@@ -1,10 +1,12 @@
 from hashlib import md5
 from itertools import permutations
+from multiprocessing import cpu_count
 from numpy import random, array, zeros, abs, sum, min, max, linalg, real, log2, log10, ceil, where
 from os.path import exists, getsize
+from time import perf_counter
 
 from dsw import Monitor, obtain_vertices, find_vertices, connect_valid_graph, connect_coding_graph
-from dsw import encode, bit_to_number, calculus_division, approximate_capacity
+from dsw import encode, encode_parallel, bit_to_number, calculus_division, approximate_capacity, CompiledAccessor
 from dsw import get_complete_accessor, accessor_to_adjacency_matrix, adjacency_matrix_to_accessor
 
 from experiments import local_bio_filters, special_filter, load_data, save_data
@@ -331,11 +333,33 @@ def evaluate_conversion():
         save_data(save_path="./raw/conversion_evaluation.pkl", information=record)
 
 
+def evaluate_parallelism():
+    if not exists("./raw/parallel_evaluation.pkl"):
+        coding_graphs = load_data(load_path="./raw/graph_coding.pkl")
+        accessor = CompiledAccessor(accessor=coding_graphs["01"])  # compiled once for all the worker numbers.
+        start_index = int(obtain_vertices(accessor=coding_graphs["01"])[0])
+
+        random.seed(2021)
+        matrix = random.randint(low=0, high=2, size=(10000, 200))
+
+        records = {}
+        for worker_number in [1, 2, 4, 8, 16]:
+            if worker_number > cpu_count():
+                break
+            print("Encode with " + str(worker_number) + " worker(s).")
+            previous_time = perf_counter()
+            encode_parallel(matrix=matrix, accessor=accessor, start_indices=start_index, worker_number=worker_number)
+            records[worker_number] = len(matrix) / (perf_counter() - previous_time)  # encoded rows per second.
+
+        save_data(save_path="./raw/parallel_evaluation.pkl", information=records)
+
+
 if __name__ == "__main__":
     evaluate_performance()
     evaluate_correction()
     evaluate_reliability()
     evaluate_conversion()
+    evaluate_parallelism()
 
     child_paths = [
         "generation_evaluation.pkl",
@@ -21,7 +21,7 @@ setup(
     author_email="zhanghaoling@genomics.cn",
     url="https://github.com/HaolingZHANG/DNASpiderWeb",
     packages=["dsw", "tests"],
-    install_requires=["numpy", "networkx"],
+    install_requires=["numpy"],
     license="BGI-Research",
     classifiers=["Programming Language :: Python :: 3",
                  "Operating System :: OS Independent"],
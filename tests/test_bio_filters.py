@@ -1,7 +1,7 @@
 from numpy import random
 from unittest import TestCase
 
-from dsw import LocalBioFilter
+from dsw import DefaultBioFilter, LocalBioFilter, build_automaton
 
 
 class TestLocalBioFilterTotally(TestCase):
@@ -98,3 +98,80 @@ class TestLocalBioFilterOnlyLast(TestCase):
         for dna_sequences, bio_filter in zip(self.dna_sequence_group, self.bio_filters):
             for flag, dna_sequence in dna_sequences:
                 self.assertEqual(flag, bio_filter.valid(dna_sequence=dna_sequence, only_last=True))
+
+
+class TestLocalBioFilterBatch(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.sample_number = 2000
+        self.observed_length = 10
+        self.bio_filters = [LocalBioFilter(observed_length=self.observed_length, max_homopolymer_runs=2),
+                            LocalBioFilter(observed_length=self.observed_length, gc_range=[0.4, 0.6]),
+                            LocalBioFilter(observed_length=self.observed_length, undesired_motifs=["GCC", "AT"]),
+                            LocalBioFilter(observed_length=self.observed_length, max_homopolymer_runs=1,
+                                           gc_range=[0.3, 0.7], undesired_motifs=["ACGT", "GGC"])]
+
+    def test(self):
+        random.seed(self.random_seed)
+        for dna_length in [6, 10, 16]:
+            digit_matrix = random.randint(0, 4, size=(self.sample_number, dna_length))
+            dna_sequences = ["".join(["ACGT"[digit] for digit in digits]) for digits in digit_matrix.tolist()]
+            for bio_filter in self.bio_filters:
+                for only_last in [True, False]:
+                    expected = [bio_filter.valid(dna_sequence=dna_sequence, only_last=only_last)
+                                for dna_sequence in dna_sequences]
+                    obtained = bio_filter.valid_batch(digit_matrix=digit_matrix, only_last=only_last).tolist()
+                    self.assertEqual(expected, obtained)
+
+
+class CountingBioFilter(DefaultBioFilter):
+
+    def __init__(self, is_broken=False):
+        super().__init__(screen_name="Counting")
+        self.is_broken, self.call_number = is_broken, 0
+
+    def valid(self, dna_string):
+        self.call_number += 1
+        if self.is_broken:
+            raise TypeError("This screen is broken!")
+        return dna_string == dna_string[::-1]
+
+
+class TestDefaultBioFilterBatch(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.sample_number = 200
+
+    def test(self):
+        random.seed(self.random_seed)
+        bio_filter = CountingBioFilter()
+        digit_matrix = random.randint(0, 4, size=(self.sample_number, 4))
+        expected = ["".join(["ACGT"[digit] for digit in digits]) for digits in digit_matrix.tolist()]
+        expected = [dna_string == dna_string[::-1] for dna_string in expected]
+        self.assertEqual(bio_filter.valid_batch(digit_matrix=digit_matrix).tolist(), expected)
+        self.assertEqual(bio_filter.call_number, self.sample_number)
+
+        bio_filter = CountingBioFilter(is_broken=True)
+        with self.assertRaises(TypeError):
+            bio_filter.valid_batch(digit_matrix=digit_matrix)
+        self.assertEqual(bio_filter.call_number, 1)
+
+
+class TestAutomaton(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.patterns = ["GCC", "AT", "GATATC", "CCC", "TTTT", "ACGN"]
+
+    def test(self):
+        random.seed(self.random_seed)
+        transitions, terminals = build_automaton(patterns=self.patterns)
+        for _ in range(1000):
+            dna_sequence = "".join(random.choice(["A", "C", "G", "T"], size=12))
+            state, found = 0, False
+            for nucleotide in dna_sequence:
+                state = transitions[state]["ACGT".index(nucleotide)]
+                found |= terminals[state]
+            self.assertEqual(any([pattern in dna_sequence for pattern in self.patterns]), found)
@@ -1,7 +1,7 @@
 from numpy import real, zeros, array, max, random, where, log2, linalg
 from unittest import TestCase
 
-from dsw import adjacency_matrix_to_accessor, approximate_capacity
+from dsw import adjacency_matrix_to_accessor, approximate_capacity, CompactAccessor, MaskAccessor
 
 
 class TestTerminals(TestCase):
@@ -253,3 +253,9 @@ class TestRandom(TestCase):
             calculated_value = log2(calculated_eigenvalue) if calculated_eigenvalue > 0.0 else 0.0
             approximate_value = approximate_capacity(accessor=adjacency_matrix_to_accessor(matrix), repeats=10)
             self.assertEqual(abs(approximate_value - calculated_value) <= 1e-4, True)
+            compact_accessor = CompactAccessor(accessor=adjacency_matrix_to_accessor(matrix))
+            approximate_value = approximate_capacity(accessor=compact_accessor, repeats=10)
+            self.assertEqual(abs(approximate_value - calculated_value) <= 1e-4, True)
+            mask_accessor = MaskAccessor(accessor=adjacency_matrix_to_accessor(matrix))
+            approximate_value = approximate_capacity(accessor=mask_accessor, repeats=10)
+            self.assertEqual(abs(approximate_value - calculated_value) <= 1e-4, True)
@@ -1,7 +1,13 @@
-from numpy import array, all
+from numpy import array, zeros, ones, arange, random, sum, all, any, where, concatenate, unpackbits
+from numpy import uint8, shares_memory
+from os import path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from dsw import encode, decode
+from dsw import encode, decode, encode_batch, decode_batch, encode_parallel, encode_file
+from dsw import get_complete_accessor, bit_to_number, calculus_division
+from dsw import CompiledAccessor, CompactAccessor, MaskAccessor, PackedDNA, create_random_shuffles
+from dsw.spiderweb import _obtain_compiled_tables, _wrap_compiled_tables
 
 
 class TestNormalEncode(TestCase):
@@ -86,3 +92,513 @@ class TestFasterDecode(TestCase):
         binary_message = decode(accessor=self.accessor, dna_sequence=self.dna_sequence, start_index=1, bit_length=8,
                                 is_faster=True)
         self.assertEqual(all(binary_message == array([0, 1, 0, 1, 0, 1, 0, 1])), True)
+
+
+class TestLongCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=2)
+        self.accessor[::2, 1] = -1  # vertices with out-degree 3.
+        self.accessor[15] = [12, -1, -1, -1]  # vertex without information.
+        self.start_index = 5
+        self.binary_messages = [random.randint(low=0, high=2, size=(bit_length,)) for bit_length in [200, 1000]]
+
+    def test(self):
+        for binary_message in self.binary_messages:
+            # reference transcoding through the decimal string calculus.
+            quotient, vertex_index, reference = bit_to_number(binary_message, is_string=True), self.start_index, ""
+            while quotient != "0":
+                used_indices = where(self.accessor[vertex_index] >= 0)[0]
+                if len(used_indices) > 1:
+                    quotient, remainder = calculus_division(number=quotient, base=str(len(used_indices)))
+                    value = used_indices[int(remainder)]
+                else:
+                    value = used_indices[0]
+                reference += "ACGT"[value]
+                vertex_index = self.accessor[vertex_index][value]
+
+            dna_sequence = encode(binary_message=binary_message, accessor=self.accessor, start_index=self.start_index)
+            self.assertEqual(reference, dna_sequence)
+            decoded_message = decode(dna_sequence=dna_sequence, bit_length=len(binary_message),
+                                     accessor=self.accessor, start_index=self.start_index)
+            self.assertEqual(all(binary_message == decoded_message), True)
+
+
+class TestSuperStrandCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=2)
+        self.accessor[::2, 1] = -1  # vertices with out-degree 3.
+        self.accessor[1::4, 2] = -1  # vertices with out-degree 2.
+        self.accessor[15] = [12, -1, -1, -1]  # vertex without information.
+        self.start_index = 5
+        self.binary_message = random.randint(low=0, high=2, size=(20000,))
+
+    def test(self):
+        # reference transcoding through the digit-by-digit division.
+        quotient, vertex_index, reference = bit_to_number(self.binary_message, is_string=False), self.start_index, ""
+        while quotient != 0:
+            used_indices = where(self.accessor[vertex_index] >= 0)[0]
+            if len(used_indices) > 1:
+                quotient, remainder = divmod(quotient, len(used_indices))
+                value = used_indices[remainder]
+            else:
+                value = used_indices[0]
+            reference += "ACGT"[value]
+            vertex_index = self.accessor[vertex_index][value]
+
+        dna_sequence = encode(binary_message=self.binary_message, accessor=self.accessor, start_index=self.start_index)
+        self.assertEqual(reference, dna_sequence)
+        decoded_message = decode(dna_sequence=dna_sequence, bit_length=len(self.binary_message),
+                                 accessor=self.accessor, start_index=self.start_index)
+        self.assertEqual(all(self.binary_message == decoded_message), True)
+
+
+class TestCompiledCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=2)
+        self.accessor[:, 1] = -1
+        self.accessor[:, 2] = -1  # vertices with out-degree 2.
+        self.accessor[4] = [-1, -1, -1, 15]  # vertex without information.
+        self.compiled_accessor = CompiledAccessor(accessor=self.accessor)
+        self.binary_messages = random.randint(low=0, high=2, size=(20, 100))
+
+    def test(self):
+        for is_faster in [False, True]:
+            for start_index, binary_message in enumerate(self.binary_messages):
+                start_index %= 16
+                dna_sequence = encode(binary_message=binary_message, accessor=self.accessor,
+                                      start_index=start_index, is_faster=is_faster)
+                self.assertEqual(dna_sequence, encode(binary_message=binary_message, accessor=self.compiled_accessor,
+                                                      start_index=start_index, is_faster=is_faster))
+                decoded_message = decode(dna_sequence=dna_sequence, bit_length=len(binary_message),
+                                         accessor=self.compiled_accessor, start_index=start_index,
+                                         is_faster=is_faster)
+                self.assertEqual(all(binary_message == decoded_message), True)
+
+
+class TestCompactCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        removed_flags = random.random(size=self.accessor.shape) < 0.3
+        removed_flags[arange(len(self.accessor)), random.randint(low=1, high=4, size=len(self.accessor))] = False
+        self.accessor[removed_flags | (self.accessor == 0)] = -1
+        self.accessor[0] = -1  # vertex "AAA" is out of the graph.
+        self.compact_accessor = CompactAccessor(accessor=self.accessor)
+        self.shuffles = create_random_shuffles(observed_length=3, random_seed=2021)
+        self.binary_messages = random.randint(low=0, high=2, size=(20, 100))
+
+    def test(self):
+        self.assertEqual(all(self.compact_accessor.to_accessor() == self.accessor), True)
+        self.assertEqual(self.compact_accessor.to_compact(0), -1)
+        self.assertEqual(all(self.compact_accessor.to_original(arange(len(self.compact_accessor)))
+                             == self.compact_accessor.vertex_indices), True)
+
+        start_indices = where(sum(self.accessor >= 0, axis=1) > 0)[0]
+        for is_faster, is_ranged in [(False, False), (True, False), (False, True)]:
+            for shuffles in [None, self.shuffles]:
+                for index, binary_message in enumerate(self.binary_messages):
+                    start_index = int(start_indices[index % len(start_indices)])
+                    dna_sequence, record_path = encode(binary_message=binary_message, accessor=self.accessor,
+                                                       start_index=start_index, is_faster=is_faster,
+                                                       is_ranged=is_ranged, shuffles=shuffles, need_path=True)
+                    compact_sequence, compact_path = encode(binary_message=binary_message,
+                                                            accessor=self.compact_accessor, start_index=start_index,
+                                                            is_faster=is_faster, is_ranged=is_ranged,
+                                                            shuffles=shuffles, need_path=True)
+                    self.assertEqual(compact_sequence, dna_sequence)
+                    self.assertEqual(all(compact_path == record_path), True)
+                    decoded_message = decode(dna_sequence=compact_sequence, bit_length=len(binary_message),
+                                             accessor=self.compact_accessor, start_index=start_index,
+                                             is_faster=is_faster, is_ranged=is_ranged, shuffles=shuffles)
+                    self.assertEqual(all(binary_message == decoded_message), True)
+
+    def test_parallel(self):
+        start_indices = where(sum(self.accessor >= 0, axis=1) > 0)[0][:len(self.binary_messages)]
+        for is_faster in [False, True]:
+            expected, expected_paths = encode_parallel(matrix=self.binary_messages, accessor=self.accessor,
+                                                       start_indices=start_indices, is_faster=is_faster,
+                                                       shuffles=self.shuffles, need_path=True, worker_number=2)
+            dna_sequences, paths = encode_parallel(matrix=self.binary_messages, accessor=self.compact_accessor,
+                                                   start_indices=start_indices, is_faster=is_faster,
+                                                   shuffles=self.shuffles, need_path=True, worker_number=2)
+            self.assertEqual(dna_sequences, expected)
+            for path, expected_path in zip(paths, expected_paths):
+                self.assertEqual(all(path == expected_path), True)
+
+        dna_matrix, lengths = encode_batch(matrix=self.binary_messages, accessor=self.compact_accessor,
+                                           start_indices=start_indices, shuffles=self.shuffles)
+        decoded_matrix, errors = decode_batch(dna_matrix=dna_matrix, lengths=lengths, accessor=self.compact_accessor,
+                                              start_indices=start_indices, bit_length=self.binary_messages.shape[1],
+                                              shuffles=self.shuffles)
+        self.assertEqual(all(decoded_matrix == self.binary_messages), True)
+        self.assertEqual(any(errors), False)
+
+
+class TestMaskCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        removed_flags = random.random(size=self.accessor.shape) < 0.3
+        removed_flags[arange(len(self.accessor)), random.randint(low=1, high=4, size=len(self.accessor))] = False
+        self.accessor[removed_flags | (self.accessor == 0)] = -1
+        self.accessor[0] = -1
+        self.mask_accessor = MaskAccessor(accessor=self.accessor)
+        self.shuffles = create_random_shuffles(observed_length=3, random_seed=2021)
+        self.binary_messages = random.randint(low=0, high=2, size=(20, 100))
+
+    def test_conversion(self):
+        self.assertEqual(len(self.mask_accessor.masks), len(self.accessor) // 2)
+        self.assertEqual(all(self.mask_accessor.to_accessor() == self.accessor), True)
+        self.assertEqual(all(self.mask_accessor[arange(8), 2] == self.accessor[:8, 2]), True)
+        self.assertEqual(all(self.mask_accessor.obtain_out_degrees() == sum(self.accessor >= 0, axis=1)), True)
+
+        vertices = random.random(size=(len(self.accessor),)) < 0.7
+        accessor = get_complete_accessor(observed_length=3)
+        accessor[~vertices] = -1
+        accessor[accessor >= 0] = where(vertices[accessor[accessor >= 0]], accessor[accessor >= 0], -1)
+        mask_accessor = MaskAccessor.from_vertices(vertices=vertices, observed_length=3)
+        self.assertEqual(all(mask_accessor.to_accessor() == accessor), True)
+
+        accessor, mask_accessor = self.accessor.copy(), MaskAccessor(accessor=self.accessor)
+        vertex_index, nucleotide_index = 5, int(where(accessor[5] >= 0)[0][0])
+        accessor[vertex_index, nucleotide_index] = mask_accessor[vertex_index, nucleotide_index] = -1
+        self.assertEqual(all(mask_accessor.to_accessor() == accessor), True)
+        mask_accessor[vertex_index, nucleotide_index] = self.accessor[vertex_index, nucleotide_index]
+        self.assertEqual(all(mask_accessor.to_accessor() == self.accessor), True)
+
+        with self.assertRaises(ValueError):
+            mask_accessor[vertex_index, nucleotide_index] = 0
+        with self.assertRaises(ValueError):
+            MaskAccessor(accessor=-ones(shape=(16, 4), dtype=int) + 2)
+
+    def test_coding(self):
+        start_indices = where(sum(self.accessor >= 0, axis=1) > 0)[0]
+        for is_faster, is_ranged in [(False, False), (True, False), (False, True)]:
+            for shuffles in [None, self.shuffles]:
+                for index, binary_message in enumerate(self.binary_messages):
+                    start_index = int(start_indices[index % len(start_indices)])
+                    dna_sequence, record_path = encode(binary_message=binary_message, accessor=self.accessor,
+                                                       start_index=start_index, is_faster=is_faster,
+                                                       is_ranged=is_ranged, shuffles=shuffles, need_path=True)
+                    mask_sequence, mask_path = encode(binary_message=binary_message, accessor=self.mask_accessor,
+                                                      start_index=start_index, is_faster=is_faster,
+                                                      is_ranged=is_ranged, shuffles=shuffles, need_path=True)
+                    self.assertEqual(mask_sequence, dna_sequence)
+                    self.assertEqual(all(mask_path == record_path), True)
+                    decoded_message = decode(dna_sequence=mask_sequence, bit_length=len(binary_message),
+                                             accessor=self.mask_accessor, start_index=start_index,
+                                             is_faster=is_faster, is_ranged=is_ranged, shuffles=shuffles)
+                    self.assertEqual(all(binary_message == decoded_message), True)
+
+    def test_batch(self):
+        start_indices = where(sum(self.accessor >= 0, axis=1) > 0)[0][:len(self.binary_messages)]
+        dna_matrix, lengths = encode_batch(matrix=self.binary_messages, accessor=self.accessor,
+                                           start_indices=start_indices, shuffles=self.shuffles)
+        mask_matrix, mask_lengths = encode_batch(matrix=self.binary_messages, accessor=self.mask_accessor,
+                                                 start_indices=start_indices, shuffles=self.shuffles)
+        self.assertEqual(all(mask_matrix == dna_matrix), True)
+        self.assertEqual(all(mask_lengths == lengths), True)
+        decoded_matrix, errors = decode_batch(dna_matrix=mask_matrix, lengths=mask_lengths,
+                                              accessor=self.mask_accessor, start_indices=start_indices,
+                                              bit_length=self.binary_messages.shape[1], shuffles=self.shuffles)
+        self.assertEqual(all(decoded_matrix == self.binary_messages), True)
+        self.assertEqual(any(errors), False)
+
+
+class TestPackedCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=2)
+        self.accessor[:, 1] = -1  # vertices with out-degree 3.
+        self.binary_messages = random.randint(low=0, high=2, size=(20, 100))
+
+    def test(self):
+        for is_faster, is_ranged in [(False, False), (True, False), (False, True)]:
+            for start_index, binary_message in enumerate(self.binary_messages):
+                dna_sequence, vt_check = encode(binary_message=binary_message, accessor=self.accessor,
+                                                start_index=start_index % 16, is_faster=is_faster,
+                                                is_ranged=is_ranged, vt_length=4)
+                packed_sequence, packed_check = encode(binary_message=binary_message, accessor=self.accessor,
+                                                       start_index=start_index % 16, is_faster=is_faster,
+                                                       is_ranged=is_ranged, vt_length=4, is_packed=True)
+                self.assertEqual(type(packed_sequence), PackedDNA)
+                self.assertEqual(packed_sequence, dna_sequence)
+                self.assertEqual(packed_check, vt_check)
+                decoded_message = decode(dna_sequence=packed_sequence, bit_length=len(binary_message),
+                                         accessor=self.accessor, start_index=start_index % 16, vt_check=vt_check,
+                                         is_faster=is_faster, is_ranged=is_ranged)
+                self.assertEqual(all(binary_message == decoded_message), True)
+
+
+class TestPathRecording(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        self.accessor[1::2, 1] = -1  # vertices with out-degree 3.
+        self.accessor[2::4, 2] = -1
+        self.accessor[2::4, 3] = -1  # vertices with out-degree 2.
+        self.accessor[5] = [-1, -1, -1, 23]  # vertex without information.
+        self.start_indices = random.randint(low=0, high=64, size=(20,))
+        self.matrix = random.randint(low=0, high=2, size=(20, 120))
+
+    def test_single(self):
+        for is_faster, is_ranged in [(False, False), (True, False), (False, True)]:
+            for binary_message, start_index in zip(self.matrix, self.start_indices):
+                dna_sequence, record_path = encode(binary_message=binary_message, accessor=self.accessor,
+                                                   start_index=start_index, is_faster=is_faster,
+                                                   is_ranged=is_ranged, need_path=True)
+                self.assertEqual(record_path.shape, (len(dna_sequence), 2))
+                vertex_index = start_index
+                for nucleotide, (recorded_index, flag) in zip(dna_sequence, record_path):
+                    latter_index = self.accessor[vertex_index, "ACGT".index(nucleotide)]
+                    self.assertEqual(recorded_index, latter_index if is_faster else vertex_index)
+                    self.assertEqual(flag, int(sum(self.accessor[vertex_index] >= 0) > 1))
+                    vertex_index = latter_index
+
+                path_buffer = -ones(shape=(len(dna_sequence) + 5, 2), dtype=int)
+                _, buffered_path = encode(binary_message=binary_message, accessor=self.accessor,
+                                          start_index=start_index, is_faster=is_faster, is_ranged=is_ranged,
+                                          need_path=True, path_buffer=path_buffer)
+                self.assertEqual(shares_memory(buffered_path, path_buffer), True)
+                self.assertEqual(all(buffered_path == record_path), True)
+                self.assertEqual(all(path_buffer[len(dna_sequence):] == -1), True)
+
+                with self.assertRaises(ValueError):
+                    encode(binary_message=binary_message, accessor=self.accessor, start_index=start_index,
+                           is_faster=is_faster, is_ranged=is_ranged, need_path=True,
+                           path_buffer=zeros(shape=(len(dna_sequence) - 1, 2), dtype=int))
+
+    def test_batch(self):
+        path_buffer = zeros(shape=(len(self.matrix), 200, 2), dtype=int)
+        for buffer in [None, path_buffer]:
+            _, lengths, paths = encode_batch(matrix=self.matrix, accessor=self.accessor,
+                                             start_indices=self.start_indices, need_path=True, path_buffer=buffer)
+            if buffer is not None:
+                self.assertEqual(shares_memory(paths, buffer), True)
+            for binary_message, start_index, path, length in zip(self.matrix, self.start_indices, paths, lengths):
+                _, record_path = encode(binary_message=binary_message, accessor=self.accessor,
+                                        start_index=start_index, is_faster=True, need_path=True)
+                self.assertEqual(all(path[:length] == record_path), True)
+                self.assertEqual(all(path[length:] == -1), True)
+
+    def test_parallel(self):
+        dna_sequences, paths = encode_parallel(matrix=self.matrix, accessor=self.accessor,
+                                               start_indices=self.start_indices, need_path=True,
+                                               worker_number=2, task_size=7)
+        for binary_message, start_index, dna_sequence, path in zip(self.matrix, self.start_indices,
+                                                                   dna_sequences, paths):
+            expected_sequence, expected_path = encode(binary_message=binary_message, accessor=self.accessor,
+                                                      start_index=start_index, need_path=True)
+            self.assertEqual(dna_sequence, expected_sequence)
+            self.assertEqual(all(path == expected_path), True)
+
+
+class TestBatchEncode(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        self.accessor[1::2, 1] = -1
+        self.accessor[1::2, 2] = -1  # vertices with out-degree 2.
+        self.accessor[5] = [-1, -1, -1, 23]  # vertex without information.
+        self.start_indices = random.randint(low=0, high=64, size=(50,))
+        self.matrix = random.randint(low=0, high=2, size=(50, 120))
+
+    def test(self):
+        dna_matrix, lengths = encode_batch(matrix=self.matrix, accessor=self.accessor, start_indices=self.start_indices)
+        for binary_message, start_index, values, length in zip(self.matrix, self.start_indices, dna_matrix, lengths):
+            dna_sequence = encode(binary_message=binary_message, accessor=self.accessor,
+                                  start_index=start_index, is_faster=True)
+            self.assertEqual(dna_sequence, "".join(["ACGT"[value] for value in values[:length]]))
+            self.assertEqual(all(values[length:] == -1), True)
+
+
+class TestBatchDecode(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        self.accessor[1::2, 1] = -1
+        self.accessor[1::2, 2] = -1  # vertices with out-degree 2.
+        self.accessor[5] = [-1, -1, -1, 23]  # vertex without information.
+        self.start_indices = random.randint(low=0, high=64, size=(50,))
+        self.matrix = random.randint(low=0, high=2, size=(50, 120))
+
+    def test(self):
+        dna_matrix, lengths = encode_batch(matrix=self.matrix, accessor=self.accessor, start_indices=self.start_indices)
+        matrix, errors = decode_batch(dna_matrix=dna_matrix, lengths=lengths, accessor=self.accessor,
+                                      start_indices=self.start_indices, bit_length=120)
+        self.assertEqual(all(self.matrix == matrix), True)
+        self.assertEqual(any(errors), False)
+
+        dna_matrix[0::5, 10] = -1  # lose a nucleotide in the middle of some DNA sequences.
+        matrix, errors = decode_batch(dna_matrix=dna_matrix, lengths=lengths, accessor=self.accessor,
+                                      start_indices=self.start_indices, bit_length=120)
+        self.assertEqual(all(self.matrix[~errors] == matrix[~errors]), True)
+        self.assertEqual(all(errors[0::5]), True)
+
+
+class TestFasterTernaryCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        self.accessor[::2, 1] = -1  # vertices with out-degree 3.
+        self.accessor[1::4, 2] = -1  # vertices with out-degree 2.
+        self.accessor[7] = [-1, -1, -1, 31]  # vertex without information.
+        self.start_indices = random.randint(low=0, high=64, size=(50,))
+        self.matrices = [random.randint(low=0, high=2, size=(50, bit_length)) for bit_length in [1, 10, 11, 97]]
+
+    def test(self):
+        for matrix in self.matrices:
+            bit_length = matrix.shape[1]
+            dna_matrix, lengths = encode_batch(matrix=matrix, accessor=self.accessor, start_indices=self.start_indices)
+            for binary_message, start_index, values, length in zip(matrix, self.start_indices, dna_matrix, lengths):
+                dna_sequence = encode(binary_message=binary_message, accessor=self.accessor,
+                                      start_index=start_index, is_faster=True)
+                self.assertEqual(dna_sequence, "".join(["ACGT"[value] for value in values[:length]]))
+                decoded_message = decode(dna_sequence=dna_sequence, bit_length=bit_length, accessor=self.accessor,
+                                         start_index=start_index, is_faster=True)
+                self.assertEqual(all(binary_message == decoded_message), True)
+
+            decoded_matrix, errors = decode_batch(dna_matrix=dna_matrix, lengths=lengths, accessor=self.accessor,
+                                                  start_indices=self.start_indices, bit_length=bit_length)
+            self.assertEqual(all(decoded_matrix == matrix), True)
+            self.assertEqual(any(errors), False)
+
+
+class TestRangedCoding(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        self.accessor[::2, 1] = -1  # vertices with out-degree 3.
+        self.accessor[1::4, 2] = -1  # vertices with out-degree 2.
+        self.accessor[7] = [-1, -1, -1, 31]  # vertex without information.
+        self.compiled_accessor = CompiledAccessor(accessor=self.accessor)
+        self.start_indices = random.randint(low=0, high=64, size=(20,))
+        self.binary_messages = [random.randint(low=0, high=2, size=(bit_length,)) for bit_length in range(20)]
+        self.binary_messages += [random.randint(low=0, high=2, size=(1000,)) for _ in range(20)]
+
+    def test(self):
+        ranged_length, exact_length = 0, 0
+        for index, binary_message in enumerate(self.binary_messages):
+            start_index = self.start_indices[index % 20]
+            dna_sequence = encode(binary_message=binary_message, accessor=self.accessor,
+                                  start_index=start_index, is_ranged=True)
+            self.assertEqual(dna_sequence, encode(binary_message=binary_message, accessor=self.compiled_accessor,
+                                                  start_index=start_index, is_ranged=True))
+            decoded_message = decode(dna_sequence=dna_sequence, bit_length=len(binary_message),
+                                     accessor=self.compiled_accessor, start_index=start_index, is_ranged=True)
+            self.assertEqual(all(binary_message == decoded_message), True)
+
+            if len(binary_message) == 1000:
+                ranged_length += len(dna_sequence)
+                exact_length += len(encode(binary_message=binary_message, accessor=self.accessor,
+                                           start_index=start_index))
+
+        self.assertLess(ranged_length, exact_length * 1.01)
+
+        with self.assertRaises(ValueError):
+            decode(dna_sequence="", bit_length=10, accessor=self.accessor, start_index=0, is_ranged=True)
+
+
+class TestParallelEncode(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=3)
+        self.accessor[:, 1] = -1
+        self.accessor[:, 2] = -1  # vertices with out-degree 2.
+        self.accessor[5] = [-1, -1, -1, 23]  # vertex without information.
+        self.shuffles = create_random_shuffles(observed_length=3, random_seed=2021)
+        self.start_indices = random.randint(low=0, high=4 ** 3, size=(50,))
+        self.matrix = random.randint(low=0, high=2, size=(50, 120))
+
+    def test(self):
+        for is_faster in [False, True]:
+            expected = [encode(binary_message=binary_message, accessor=self.accessor, start_index=start_index,
+                               is_faster=is_faster, shuffles=self.shuffles)
+                        for binary_message, start_index in zip(self.matrix, self.start_indices)]
+            for accessor, shuffles in [(self.accessor, self.shuffles),
+                                       (CompiledAccessor(accessor=self.accessor, shuffles=self.shuffles), None)]:
+                dna_sequences = encode_parallel(matrix=self.matrix, accessor=accessor, start_indices=self.start_indices,
+                                                is_faster=is_faster, shuffles=shuffles, worker_number=2, task_size=7)
+                self.assertEqual(dna_sequences, expected)
+
+    def test_shared_tables(self):
+        for accessor in [self.accessor, MaskAccessor(accessor=self.accessor)]:
+            for shuffles in [None, self.shuffles]:
+                compiled_accessor = CompiledAccessor(accessor=accessor, shuffles=shuffles)
+                tables = _obtain_compiled_tables(compiled_accessor)
+                wrapped_accessor = _wrap_compiled_tables(tables=tables, is_masked=isinstance(accessor, MaskAccessor))
+                for name in ["out_degrees", "used_indices", "ranks", "shuffled_indices", "shuffled_ranks"]:
+                    wrapped_table = getattr(wrapped_accessor, name)
+                    self.assertEqual(any([wrapped_table is table for table in tables]), True)
+                    self.assertEqual(all(wrapped_table == getattr(compiled_accessor, name)), True)
+                self.assertEqual(all(wrapped_accessor.accessor[:] == compiled_accessor.accessor[:]), True)
+
+                expected = [encode(binary_message=binary_message, accessor=accessor, start_index=start_index,
+                                   shuffles=shuffles)
+                            for binary_message, start_index in zip(self.matrix, self.start_indices)]
+                dna_sequences = encode_parallel(matrix=self.matrix, accessor=compiled_accessor,
+                                                start_indices=self.start_indices, worker_number=2)
+                self.assertEqual(dna_sequences, expected)
+
+
+class TestFileEncode(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.accessor = get_complete_accessor(observed_length=2)
+        self.accessor[::2, 1] = -1  # vertices with out-degree 3.
+        self.accessor[15] = [12, -1, -1, -1]  # vertex without information.
+        self.start_index = 5
+        self.data = random.randint(low=0, high=256, size=(1000,)).astype(uint8).tobytes()
+        self.segment_length = 120
+
+    def test(self):
+        with TemporaryDirectory() as folder:
+            file_path, fasta_path = path.join(folder, "data.bin"), path.join(folder, "data.fasta")
+            with open(file_path, "wb") as file:
+                file.write(self.data)
+
+            for chunk_size in [7, 15, 4096]:  # chunks shorter than, aligned with, and longer than a segment.
+                segment_number, index_length = encode_file(file_path=file_path, fasta_path=fasta_path,
+                                                           accessor=self.accessor, start_index=self.start_index,
+                                                           segment_length=self.segment_length, chunk_size=chunk_size)
+                self.assertEqual(segment_number, 67)
+                self.assertEqual(index_length, 7)
+
+                with open(fasta_path, "r") as file:
+                    lines = file.read().split("\n")[:-1]
+                self.assertEqual(lines[0::2], [">" + str(index) for index in range(segment_number)])
+
+                segments = []
+                for index, dna_sequence in enumerate(lines[1::2]):
+                    binary_message = decode(dna_sequence=dna_sequence, bit_length=index_length + self.segment_length,
+                                            accessor=self.accessor, start_index=self.start_index)
+                    self.assertEqual(bit_to_number(binary_message[:index_length], is_string=False), index)
+                    segments.append(binary_message[index_length:])
+
+                expected = unpackbits(array(list(self.data), dtype=uint8))
+                self.assertEqual(all(concatenate(segments)[:len(expected)] == expected), True)
+                self.assertEqual(any(concatenate(segments)[len(expected):]), False)
+
+        with self.assertRaises(ValueError):
+            with TemporaryDirectory() as folder:
+                file_path = path.join(folder, "data.bin")
+                with open(file_path, "wb") as file:
+                    file.write(self.data)
+                encode_file(file_path=file_path, fasta_path=path.join(folder, "data.fasta"), accessor=self.accessor,
+                            start_index=self.start_index, segment_length=self.segment_length, index_length=6)
@@ -1,7 +1,17 @@
-from numpy import array, all, where
+from numpy import array, all, where, ones, random
 from unittest import TestCase
 
-from dsw import LocalBioFilter, find_vertices, connect_valid_graph, connect_coding_graph
+from dsw import DefaultBioFilter, LocalBioFilter, find_vertices, connect_valid_graph, connect_coding_graph
+from dsw import get_complete_accessor, obtain_latters, obtain_components
+
+
+class PalindromeBioFilter(DefaultBioFilter):
+
+    def __init__(self):
+        super().__init__(screen_name="Palindrome")
+
+    def valid(self, dna_sequence):
+        return dna_sequence != dna_sequence[::-1] and dna_sequence.count("A") != 3
 
 
 class TestFindVertices(TestCase):
@@ -15,6 +25,22 @@ class TestFindVertices(TestCase):
         self.assertEqual(all(self.available_vertices == vertices), True)
 
 
+class TestFindVerticesParallel(TestCase):
+
+    def setUp(self):
+        self.bio_filter = PalindromeBioFilter()
+        self.observed_length = 9
+
+    def test(self):
+        vertices = find_vertices(observed_length=self.observed_length, bio_filter=self.bio_filter)
+        self.assertEqual(vertices[0], False)
+        self.assertEqual(vertices[1], True)
+        for worker_number in [2, 3]:
+            parallel_vertices = find_vertices(observed_length=self.observed_length, bio_filter=self.bio_filter,
+                                              worker_number=worker_number)
+            self.assertEqual(all(vertices == parallel_vertices), True)
+
+
 class TestGenerateValidGraph(TestCase):
 
     def setUp(self):
@@ -29,6 +55,32 @@ class TestGenerateValidGraph(TestCase):
         self.assertEqual(all(self.valid_graph == graph), True)
 
 
+class TestGenerateRandomValidGraph(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.observed_length = 5
+
+    def test(self):
+        random.seed(self.random_seed)
+        vertex_number = 4 ** self.observed_length
+        complete_accessor = get_complete_accessor(observed_length=self.observed_length)
+        for vertex_index in range(vertex_number):
+            latters = obtain_latters(current=vertex_index, observed_length=self.observed_length)
+            self.assertEqual(complete_accessor[vertex_index].tolist(), latters)
+
+        for _ in range(10):
+            vertices = random.randint(0, 2, size=(vertex_number,))
+            expected_accessor = -ones(shape=(vertex_number, 4), dtype=int)
+            for vertex_index in where(vertices == 1)[0]:
+                latters = obtain_latters(current=vertex_index, observed_length=self.observed_length)
+                for position, latter_vertex_index in enumerate(latters):
+                    if vertices[latter_vertex_index]:
+                        expected_accessor[vertex_index][position] = latter_vertex_index
+            accessor = connect_valid_graph(observed_length=self.observed_length, vertices=vertices)
+            self.assertEqual(all(expected_accessor == accessor), True)
+
+
 class TestGenerateCodingGraph(TestCase):
 
     def setUp(self):
@@ -42,3 +94,80 @@ class TestGenerateCodingGraph(TestCase):
         vertices, graph = connect_coding_graph(observed_length=2, vertices=self.vertices, threshold=1)
         self.assertEqual(all(where(self.vertices == 1)[0] == vertices.astype(int)), True)
         self.assertEqual(all(self.coding_graph == graph), True)
+
+
+class TestTrimCodingGraph(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.observed_length = 5
+
+    def test(self):
+        random.seed(self.random_seed)
+        for threshold, choice_number in [(2, 4), (3, 30)]:  # about 1 / choice_number vertices are invalid.
+            for _ in range(5):
+                vertices = random.randint(0, choice_number, size=(4 ** self.observed_length,)) > 0
+                expected_vertices = vertices.copy()
+                while True:  # trim all the vertices round by round.
+                    new_vertices = expected_vertices.copy()
+                    for vertex_index in where(expected_vertices)[0]:
+                        latters = obtain_latters(current=vertex_index, observed_length=self.observed_length)
+                        new_vertices[vertex_index] = sum(expected_vertices[latters]) >= threshold
+                    if all(new_vertices == expected_vertices):
+                        break
+                    expected_vertices = new_vertices
+
+                obtained_vertices, _ = connect_coding_graph(observed_length=self.observed_length,
+                                                            vertices=vertices, threshold=threshold)
+                self.assertEqual(all(expected_vertices == obtained_vertices), True)
+
+
+class TestObtainComponents(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.observed_length = 3
+
+    def test(self):
+        random.seed(self.random_seed)
+        vertex_number = 4 ** self.observed_length
+        for _ in range(5):
+            accessor = connect_valid_graph(observed_length=self.observed_length,
+                                           vertices=random.randint(0, 3, size=(vertex_number,)) > 0)
+            reachable = [{vertex_index} for vertex_index in range(vertex_number)]
+            for _ in range(vertex_number):  # extend the reachable vertices until stable.
+                for vertex_index in range(vertex_number):
+                    for latter_index in accessor[vertex_index][accessor[vertex_index] >= 0]:
+                        reachable[vertex_index] |= reachable[latter_index]
+
+            labels = obtain_components(accessor=accessor)
+            for former_index in range(vertex_number):
+                for latter_index in range(vertex_number):
+                    connected = latter_index in reachable[former_index] and former_index in reachable[latter_index]
+                    self.assertEqual(connected, labels[former_index] == labels[latter_index])
+
+
+class TestPruneCodingGraph(TestCase):
+
+    def setUp(self):
+        self.random_seed = 2021
+        self.observed_length = 4
+
+    def test(self):
+        random.seed(self.random_seed)
+        for _ in range(5):
+            vertices = random.randint(0, 2, size=(4 ** self.observed_length,)) > 0
+            vertices, accessor = connect_coding_graph(observed_length=self.observed_length,
+                                                      vertices=vertices, threshold=1)
+            out_degrees = (accessor >= 0).sum(axis=1)
+            self.assertEqual(all(where(out_degrees > 0)[0] == vertices), True)
+            labels = obtain_components(accessor=accessor)
+            for label in set(labels[vertices].tolist()):  # no cycle only has the vertices with one latter vertex.
+                members = where(labels == label)[0]
+                if len(members) > 1 or accessor[members[0]].max() == members[0]:
+                    self.assertEqual(max(out_degrees[members]) > 1, True)
+
+    def test_empty(self):
+        vertices = array([1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1])
+        with self.assertRaises(ValueError):
+            connect_coding_graph(observed_length=2, vertices=vertices, threshold=1)
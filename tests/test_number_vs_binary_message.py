@@ -56,3 +56,26 @@ class TestTransform(TestCase):
             predicted_2 = bit_to_number(bit_array=bits, is_string=False)
             self.assertEqual(requested, predicted_1)
             self.assertEqual(requested, predicted_2)
+
+
+class TestLongTransform(TestCase):
+
+    def setUp(self):
+        seed(2021)
+        self.binary_messages = [[randint(0, 1) for _ in range(bit_length)] for bit_length in [0, 1, 7, 8, 9, 1000]]
+        self.binary_messages.append([1] + [randint(0, 1) for _ in range(100000)])
+
+    def test(self):
+        for bits in self.binary_messages:
+            requested = 0
+            for bit in bits:
+                requested = requested * 2 + bit
+            self.assertEqual(bit_to_number(bit_array=bits, is_string=False), requested)
+            self.assertEqual(number_to_bit(decimal_number=requested, bit_length=len(bits)), bits)
+            self.assertEqual(number_to_bit(decimal_number=requested, bit_length=len(bits) + 3), [0, 0, 0] + bits)
+            digits = [int(bit) for bit in bin(requested)[2:]] if requested > 0 else []
+            if len(digits) > len(bits) // 2:  # the most significant bits are kept.
+                self.assertEqual(number_to_bit(decimal_number=requested, bit_length=len(bits) // 2),
+                                 digits[:len(bits) // 2])
+            if len(bits) <= 1000:
+                self.assertEqual(int(bit_to_number(bit_array=bits)), requested)
@@ -2,6 +2,7 @@ from random import seed, randint
 from unittest import TestCase
 
 from dsw import dna_to_number, number_to_dna
+from dsw import vertices_to_digits, digits_to_vertices, vertices_to_dna, dna_to_vertices
 
 
 class TestNumber(TestCase):
@@ -51,3 +52,32 @@ class TestTransform(TestCase):
             predicted_2 = dna_to_number(dna_sequence=dna_sequence, is_string=False)
             self.assertEqual(requested, predicted_1)
             self.assertEqual(requested, predicted_2)
+
+
+class TestVertices(TestCase):
+
+    def setUp(self):
+        seed(2021)
+        self.observed_length = 10
+        self.vertex_indices = [0, 4 ** self.observed_length - 1]
+        self.vertex_indices += [randint(0, 4 ** self.observed_length - 1) for _ in range(100)]
+
+    def test(self):
+        digit_matrix = vertices_to_digits(vertex_indices=self.vertex_indices, observed_length=self.observed_length)
+        dna_sequences = vertices_to_dna(vertex_indices=self.vertex_indices, observed_length=self.observed_length)
+        for vertex_index, digits, dna_sequence in zip(self.vertex_indices, digit_matrix, dna_sequences):
+            requested = number_to_dna(decimal_number=vertex_index, dna_length=self.observed_length)
+            self.assertEqual(dna_sequence, requested)
+            self.assertEqual("".join(["ACGT"[digit] for digit in digits]), requested)
+
+        self.assertEqual(digits_to_vertices(digit_matrix=digit_matrix).tolist(), self.vertex_indices)
+        self.assertEqual(dna_to_vertices(dna_sequences=dna_sequences).tolist(), self.vertex_indices)
+        self.assertEqual(dna_to_vertices(dna_sequences=list(dna_sequences)).tolist(), self.vertex_indices)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            dna_to_vertices(dna_sequences=["ACGT", "ACG"])
+        with self.assertRaises(ValueError):
+            dna_to_vertices(dna_sequences=["AC", "GTA", "C"])  # the total length is still a multiple of 2.
+        with self.assertRaises(ValueError):
+            dna_to_vertices(dna_sequences=["ACGT", "ACGN"])
@@ -1,6 +1,8 @@
+from random import seed, getrandbits, randint
 from unittest import TestCase
 
-from dsw import calculus_addition, calculus_subtraction, calculus_multiplication, calculus_division
+from dsw import BigNumber, calculus_addition, calculus_subtraction, calculus_multiplication, calculus_division
+from dsw import huge_divmod, digit_to_number, PackedDNA
 
 
 class TestAddition(TestCase):
@@ -57,3 +59,100 @@ class TestDivision(TestCase):
                 requested = (str(number // base), str(number % base))
                 predicted = calculus_division(number=str(number), base=str(base))
                 self.assertEqual(requested, predicted)
+
+
+class TestBigNumber(TestCase):
+
+    def setUp(self):
+        seed(2021)
+        self.strings = ["0", "7", "-12"]
+        self.strings += ["".join([str(randint(1, 9))] + [str(randint(0, 9)) for _ in range(length)])
+                         for length in [10, 2047, 2048, 5000, 20000]]
+
+    def test_conversion(self):
+        for string in self.strings:
+            number = BigNumber(string)
+            self.assertEqual(str(number), string)
+            self.assertEqual(number.value % 10 ** 8, int(string[-9:]) % 10 ** 8)
+            self.assertEqual(number.value % 9, int(string) % 9 if len(string) < 100 else sum(map(int, string)) % 9)
+            self.assertEqual(BigNumber(number.value), number)
+
+    def test_calculus(self):
+        for string in self.strings[3:]:
+            number, value = BigNumber(string), BigNumber(string).value
+            for multiplier, addend in [(2, 1), (4, 3), (10, 0)]:
+                value = value * multiplier + addend
+                self.assertEqual(number.multiply_add(multiplier=multiplier, addend=addend).value, value)
+            for divisor in [2, 3, 4, 9]:
+                remainder = number.divide(divisor=divisor)
+                self.assertEqual((number.value, remainder), divmod(value, divisor))
+                value = number.value
+
+        number = "9" * 10000
+        self.assertEqual(calculus_addition(number=number, base="2"), "1" + "0" * 9999 + "1")
+        self.assertEqual(calculus_subtraction(number="1" + "0" * 9999 + "1", base="2"), number)
+        self.assertEqual(calculus_multiplication(number=number, base="2"), "1" + "9" * 9999 + "8")
+        self.assertEqual(calculus_division(number=number, base="3"), ("3" * 10000, "0"))
+
+
+class TestHugeDivision(TestCase):
+
+    def setUp(self):
+        seed(2021)
+        self.pairs = []
+        for _ in range(200):
+            self.pairs.append((getrandbits(randint(1, 20000)), getrandbits(randint(1, 12000)) + 1))
+
+    def test(self):
+        for number, divisor in self.pairs:
+            self.assertEqual(divmod(number, divisor), huge_divmod(number=number, divisor=divisor, threshold=64))
+
+
+class TestDigitToNumber(TestCase):
+
+    def setUp(self):
+        seed(2021)
+        self.radices = [randint(2, 4) for _ in range(5000)]
+        self.digits = [randint(0, radix - 1) for radix in self.radices]
+
+    def test(self):
+        for length in [0, 1, 2, 3, 1000, 5000]:
+            requested = 0
+            for digit, radix in zip(self.digits[:length][::-1], self.radices[:length][::-1]):
+                requested = requested * radix + digit
+            predicted = digit_to_number(digits=self.digits[:length], radices=self.radices[:length])
+            self.assertEqual(requested, predicted)
+
+
+class TestPackedDNA(TestCase):
+
+    def setUp(self):
+        seed(2021)
+        self.dna_sequences = ["".join(["ACGT"[randint(0, 3)] for _ in range(length)]) for length in range(0, 40)]
+
+    def test_conversion(self):
+        for dna_sequence in self.dna_sequences:
+            packed_sequence = PackedDNA(dna_sequence)
+            self.assertEqual(len(packed_sequence), len(dna_sequence))
+            self.assertEqual(len(packed_sequence.to_bytes()), (len(dna_sequence) + 3) // 4)
+            self.assertEqual(str(packed_sequence), dna_sequence)
+            self.assertEqual(list(packed_sequence), list(dna_sequence))
+            self.assertEqual(PackedDNA(dna_sequence.encode()), packed_sequence)
+            self.assertEqual(PackedDNA.from_bytes(packed_sequence.to_bytes(), len(dna_sequence)), packed_sequence)
+            self.assertEqual(PackedDNA.from_indices(packed_sequence.indices()), dna_sequence)
+
+    def test_operation(self):
+        for dna_sequence in self.dna_sequences[1:]:
+            packed_sequence = PackedDNA(dna_sequence)
+            for location in range(-len(dna_sequence), len(dna_sequence)):
+                self.assertEqual(packed_sequence[location], dna_sequence[location])
+            self.assertEqual(packed_sequence[1:-2], dna_sequence[1:-2])
+            self.assertEqual(packed_sequence + dna_sequence, dna_sequence * 2)
+            self.assertEqual(hash(packed_sequence), hash(dna_sequence))
+
+    def test_invalid(self):
+        for dna_sequence in ["ACGN", "acgt", "ACG\u00e9"]:
+            with self.assertRaises(ValueError):
+                PackedDNA(dna_sequence)
+        with self.assertRaises(IndexError):
+            _ = PackedDNA("ACGT")[4]
@@ -1,7 +1,7 @@
 from numpy import array
 from unittest import TestCase
 
-from dsw import set_vt, repair_dna
+from dsw import set_vt, repair_dna, CompiledAccessor, CompactAccessor, MaskAccessor, PackedDNA
 
 
 class TestRepair(TestCase):
@@ -26,3 +26,28 @@ class TestRepair(TestCase):
                                                        observed_length=2, has_indel=True)
         self.assertEqual(repaired_dna_sequences, ["TCTCTCTCTCTC"])
         self.assertEqual(additions, (1, True, 2, 14))
+
+        repaired_dna_sequences, additions = repair_dna(dna_sequence=self.dna_sequence, vt_check=self.vt_check,
+                                                       accessor=CompiledAccessor(self.accessor), start_index=1,
+                                                       observed_length=2, has_indel=True)
+        self.assertEqual(repaired_dna_sequences, ["TCTCTCTCTCTC"])
+        self.assertEqual(additions, (1, True, 2, 14))
+
+        repaired_dna_sequences, additions = repair_dna(dna_sequence=self.dna_sequence, vt_check=self.vt_check,
+                                                       accessor=CompactAccessor(self.accessor), start_index=1,
+                                                       observed_length=2, has_indel=True)
+        self.assertEqual(repaired_dna_sequences, ["TCTCTCTCTCTC"])
+        self.assertEqual(additions, (1, True, 2, 14))
+
+        repaired_dna_sequences, additions = repair_dna(dna_sequence=self.dna_sequence, vt_check=self.vt_check,
+                                                       accessor=MaskAccessor(self.accessor), start_index=1,
+                                                       observed_length=2, has_indel=True)
+        self.assertEqual(repaired_dna_sequences, ["TCTCTCTCTCTC"])
+        self.assertEqual(additions, (1, True, 2, 14))
+
+        repaired_dna_sequences, additions = repair_dna(dna_sequence=PackedDNA(self.dna_sequence),
+                                                       vt_check=self.vt_check, accessor=self.accessor, start_index=1,
+                                                       observed_length=2, has_indel=True)
+        self.assertEqual(repaired_dna_sequences, [PackedDNA("TCTCTCTCTCTC")])
+        self.assertEqual(type(repaired_dna_sequences[0]), PackedDNA)
+        self.assertEqual(additions, (1, True, 2, 14))
@@ -1,7 +1,8 @@
-from numpy import random, array, all
+from numpy import random, array, all, any
 from unittest import TestCase
 
-from dsw import create_random_shuffles, get_complete_accessor, encode, decode
+from dsw import create_random_shuffles, get_complete_accessor, encode, decode, encode_batch, decode_batch
+from dsw import CompiledAccessor
 
 
 class TestShuffles(TestCase):
@@ -29,3 +30,48 @@ class TestShuffles(TestCase):
                     target = decode(dna_sequence=oligo, accessor=self.accessor, bit_length=self.bit_length,
                                     shuffles=shuffles, start_index=start_index)
                     self.assertEqual(all(source == target), True)
+
+
+class TestCompiledShuffles(TestCase):
+
+    def setUp(self):
+        random.seed(2021)
+        self.repeats = 20
+        self.bit_length = 100
+        self.accessor = get_complete_accessor(observed_length=3)
+        for vertex_index in range(1, 4 ** 3, 2):  # out-degree 2 for the odd vertices.
+            self.accessor[vertex_index, random.permutation(4)[:2]] = -1
+        self.shuffles = create_random_shuffles(observed_length=3)
+        self.compiled_accessor = CompiledAccessor(accessor=self.accessor, shuffles=self.shuffles)
+        self.start_indices = random.randint(low=0, high=4 ** 3, size=(self.repeats,))
+        self.bit_matrix = random.randint(low=0, high=2, size=(self.repeats, self.bit_length), dtype=int)
+
+    def test_coding(self):
+        for source, start_index in zip(self.bit_matrix, self.start_indices):
+            for is_faster in [False, True]:
+                expected = encode(binary_message=source, accessor=self.accessor, start_index=start_index,
+                                  is_faster=is_faster, shuffles=self.shuffles)
+                oligo = encode(binary_message=source, accessor=self.compiled_accessor, start_index=start_index,
+                               is_faster=is_faster)
+                self.assertEqual(oligo, expected)
+                target = decode(dna_sequence=oligo, bit_length=self.bit_length, accessor=self.compiled_accessor,
+                                start_index=start_index, is_faster=is_faster, shuffles=self.shuffles)
+                self.assertEqual(all(source == target), True)
+
+    def test_batch(self):
+        dna_matrix, lengths = encode_batch(matrix=self.bit_matrix, accessor=self.accessor,
+                                           start_indices=self.start_indices, shuffles=self.shuffles)
+        matrix, errors = decode_batch(dna_matrix=dna_matrix, lengths=lengths, accessor=self.compiled_accessor,
+                                      start_indices=self.start_indices, bit_length=self.bit_length)
+        self.assertEqual(all(matrix == self.bit_matrix), True)
+        self.assertEqual(any(errors), False)
+        for index, (row, length) in enumerate(zip(dna_matrix, lengths)):
+            oligo = "".join("ACGT"[value] for value in row[:length])
+            target = decode(dna_sequence=oligo, bit_length=self.bit_length, accessor=self.accessor,
+                            start_index=self.start_indices[index], is_faster=True, shuffles=self.shuffles)
+            self.assertEqual(all(target == matrix[index]), True)
+
+    def test_inconsistent(self):
+        with self.assertRaises(ValueError):
+            encode(binary_message=self.bit_matrix[0], accessor=CompiledAccessor(accessor=self.accessor),
+                   start_index=0, shuffles=self.shuffles)
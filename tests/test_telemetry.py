@@ -0,0 +1,124 @@
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from dsw import Monitor, Telemetry, NullSink, LoggingSink, CallbackSink, JSONLinesSink, telemetry
+from dsw import Profiler, LocalBioFilter, find_vertices, connect_coding_graph, approximate_capacity, repair_dna
+
+
+class TestMonitor(TestCase):
+
+    def setUp(self):
+        self.records = []
+        self.monitor = Monitor(sink=CallbackSink(callback=self.records.append))
+
+    def test(self):
+        for _ in range(2):  # the monitor is reusable after the task is finished.
+            for state in range(1, 100001):
+                self.monitor(current_state=state, total_state=100000, extra={"state": state})
+        self.assertEqual(len(self.records), 2 * 101)
+        self.assertEqual([record["percent"] for record in self.records[:101]], list(range(101)))
+        self.assertEqual(self.records[100]["current"], 100000)
+        self.assertEqual(self.records[100]["extra"], {"state": 100000})
+
+    def test_reuse(self):
+        # the tasks are stopped early, where the percentage of a task can be the same as the one of the last task,
+        # the total state can be smaller, or the current state goes backwards with the same total state.
+        expected = []
+        for stop_state, total_state in [(5, 1000), (5, 1000), (500, 1000), (10, 100), (100, 100)]:
+            for state in range(1, stop_state + 1):
+                self.monitor(current_state=state, total_state=total_state)
+            expected += sorted(set([int(state / total_state * 100) for state in range(1, stop_state + 1)]))
+        self.assertEqual([record["percent"] for record in self.records], expected)
+
+
+class TestSinks(TestCase):
+
+    def test_null(self):
+        self.assertIsNone(NullSink().emit(record={"type": "message", "text": "dropped"}))
+
+    def test_logging(self):
+        with self.assertLogs(logger="dsw", level="INFO") as captured:
+            LoggingSink().emit(record={"type": "message", "text": "logged"})
+            LoggingSink().emit(record={"type": "progress", "current": 1, "total": 2})
+        self.assertEqual(captured.output[0], "INFO:dsw:logged")
+        self.assertEqual(loads(captured.output[1][len("INFO:dsw:"):]), {"type": "progress", "current": 1, "total": 2})
+
+    def test_json_lines(self):
+        with TemporaryDirectory() as folder:
+            file_path = path.join(folder, "records.jsonl")
+            sink = JSONLinesSink(target=file_path)
+            monitor = Monitor(sink=sink)
+            for state in range(1, 11):
+                monitor(current_state=state, total_state=10)
+            sink.close()
+            with open(file_path, "r") as file:
+                records = [loads(line) for line in file]
+        self.assertEqual([record["current"] for record in records], list(range(1, 11)))
+
+
+class TestTelemetry(TestCase):
+
+    def test_disabled(self):
+        local_telemetry = Telemetry()
+        local_telemetry.count(name="nucleotides", value=10)
+        with local_telemetry.timer(name="walk"):
+            pass
+        self.assertEqual(local_telemetry.snapshot(), {"counters": {}, "timers": {}})
+
+    def test_enabled(self):
+        records = []
+        local_telemetry = Telemetry(sink=CallbackSink(callback=records.append), enabled=True)
+        for _ in range(5):
+            local_telemetry.count(name="nucleotides", value=10)
+            with local_telemetry.timer(name="walk"):
+                pass
+        local_telemetry.flush()
+        self.assertEqual(records[0]["counters"], {"nucleotides": 50})
+        self.assertEqual(records[0]["timers"]["walk"]["calls"], 5)
+        local_telemetry.reset()
+        self.assertEqual(local_telemetry.snapshot(), {"counters": {}, "timers": {}})
+
+    def test_routing(self):
+        records, previous_sink = [], telemetry.sink
+        telemetry.sink = CallbackSink(callback=records.append)
+        try:
+            bio_filter = LocalBioFilter(observed_length=4, max_homopolymer_runs=2)
+            find_vertices(observed_length=4, bio_filter=bio_filter, verbose=True)
+        finally:
+            telemetry.sink = previous_sink
+        messages = [record["text"] for record in records if record["type"] == "message"]
+        progresses = [record for record in records if record["type"] == "progress"]
+        self.assertEqual(messages[0], "Find valid vertices in this observed length of DNA sequence.")
+        self.assertEqual(len(progresses), 1)  # the vertices are screened in one chunk.
+        self.assertEqual((progresses[-1]["current"], progresses[-1]["total"]), (4 ** 4, 4 ** 4))
+        self.assertEqual(progresses[-1]["extra"]["valid"], 4 ** 4 - 4 * 7)  # "XXXX", 3 "XXXY" and 3 "YXXX".
+
+
+class TestProfiler(TestCase):
+
+    def test(self):
+        bio_filter = LocalBioFilter(observed_length=2, max_homopolymer_runs=2, gc_range=[0.5, 0.5])
+        with TemporaryDirectory() as folder:
+            file_path = path.join(folder, "report.json")
+            with Profiler(file_path=file_path) as profiler:
+                vertices = find_vertices(observed_length=2, bio_filter=bio_filter)
+                _, accessor = connect_coding_graph(observed_length=2, vertices=vertices, threshold=1)
+                approximate_capacity(accessor=accessor, repeats=2)
+                _, additions = repair_dna(dna_sequence="TCTCTATCTCTC", accessor=accessor, start_index=1,
+                                          observed_length=2, has_indel=True)
+            with open(file_path, "r") as file:
+                report = loads(file.read())
+
+        self.assertEqual(report, profiler.report)
+        self.assertEqual(set(report["timers"].keys()), {"find_vertices", "connect_coding_graph",
+                                                        "approximate_capacity", "repair_dna", "path_matching"})
+        self.assertEqual(report["timers"]["approximate_capacity"]["calls"], 1)
+        self.assertEqual(report["timers"]["path_matching"]["calls"], 2)
+        self.assertEqual(report["counters"]["find_vertices.vertices"], 16)
+        self.assertEqual(report["counters"]["repair_dna.nucleotides"], 12)
+        self.assertEqual(report["counters"]["repair_dna.visited_times"], additions[3])
+        self.assertGreater(report["counters"]["approximate_capacity.iterations"], 2)
+        self.assertEqual(telemetry.enabled, False)
+        self.assertEqual(telemetry.snapshot(), {"counters": {}, "timers": {}})